@@ -0,0 +1,10 @@
+#!/usr/bin/env bash
+set -eo pipefail
+
+# 엔드포인트 벤치마크 (src/benchmarks) - 기준을 다시 기록하려면 BENCHMARK_UPDATE_BASELINES=1 로 실행
+docker-compose exec -e BENCHMARK=1 -e BENCHMARK_UPDATE_BASELINES="${BENCHMARK_UPDATE_BASELINES}" django_gunicorn bash -c "
+  source ~/.bashrc && \
+  pyenv activate django-main && \
+  cd src && \
+  python manage.py test benchmarks --tag benchmark
+"
@@ -0,0 +1,71 @@
+# Generated by Django 5.1.2 on 2026-10-18 10:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accommodations", "0004_refundpolicy_accommodation_image_is_representative_and_more"),
+        ("rooms", "0004_alter_room_check_in_time_alter_room_check_out_time"),
+        ("reviews", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AccommodationCard",
+            fields=[
+                (
+                    "accommodation",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="card",
+                        serialize=False,
+                        to="accommodations.accommodation",
+                    ),
+                ),
+                ("min_price", models.IntegerField(blank=True, db_index=True, null=True)),
+                ("representative_image", models.CharField(blank=True, default="", max_length=255)),
+                ("address", models.CharField(blank=True, default="", max_length=512)),
+                ("average_rating", models.FloatField(blank=True, null=True)),
+                ("room_count", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        # 기존 숙소의 카드 채우기 (AccommodationCardService.annotate_card_values 와 같은 값)
+        # 피드/검색/지도가 카드를 읽으므로 비워 두면 기존 숙소가 목록에서 빠진다
+        migrations.RunSQL(
+            """
+            INSERT INTO accommodations_accommodationcard
+                (accommodation_id, min_price, representative_image, address, average_rating, room_count, updated_at)
+            SELECT
+                a.id,
+                (SELECT MIN(r.price) FROM rooms_room AS r WHERE r.accommodation_id = a.id),
+                COALESCE(
+                    (
+                        SELECT i.image FROM accommodations_accommodation_image AS i
+                        WHERE i.accommodation_id = a.id
+                        ORDER BY i.is_representative DESC, i.id
+                        LIMIT 1
+                    ),
+                    ''
+                ),
+                left(
+                    concat_ws(' ', NULLIF(g.city, ''), NULLIF(g.states, ''), NULLIF(g.road_name, ''), NULLIF(g.address, '')),
+                    512
+                ),
+                (
+                    SELECT AVG(rt.rating::double precision) FROM reviews_rating AS rt
+                    JOIN reviews_review AS rv ON rv.id = rt.review_id
+                    WHERE rv.accommodation_id = a.id
+                ),
+                (SELECT COUNT(*) FROM rooms_room AS r WHERE r.accommodation_id = a.id),
+                now()
+            FROM accommodations_accommodation AS a
+            LEFT JOIN accommodations_gps_info AS g ON g.accommodation_id = a.id
+            """,
+            migrations.RunSQL.noop,
+        ),
+    ]
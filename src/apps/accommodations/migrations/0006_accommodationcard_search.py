@@ -0,0 +1,71 @@
+# Generated by Django 5.1.2 on 2026-10-18 15:00
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accommodations", "0005_accommodationcard"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="accommodationcard",
+            name="search_title",
+            field=models.CharField(blank=True, default="", max_length=255),
+        ),
+        migrations.AddField(
+            model_name="accommodationcard",
+            name="search_text",
+            field=models.TextField(blank=True, default=""),
+        ),
+        migrations.AddField(
+            model_name="accommodationcard",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.SearchVector("search_title", config="simple", weight="A"),
+                    "||",
+                    django.contrib.postgres.search.SearchVector("search_text", config="simple", weight="B"),
+                    django.contrib.postgres.search.SearchConfig("simple"),
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        # 기존 카드의 검색 텍스트 채우기
+        migrations.RunSQL(
+            """
+            UPDATE accommodations_accommodationcard AS c
+            SET search_title = a.name,
+                search_text = concat_ws(' ', a.description, a.rules, g.city, g.states, g.road_name, g.address)
+            FROM accommodations_accommodation AS a
+            LEFT JOIN accommodations_gps_info AS g ON g.accommodation_id = a.id
+            WHERE c.accommodation_id = a.id
+            """,
+            migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name="accommodationcard",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="accommodation_card_search_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="accommodationcard",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_title"], name="accommodation_card_title_trgm", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="accommodationcard",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_text"], name="accommodation_card_text_trgm", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+    ]
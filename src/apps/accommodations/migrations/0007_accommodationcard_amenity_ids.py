@@ -0,0 +1,41 @@
+# Generated by Django 5.1.2 on 2026-10-18 16:00
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accommodations", "0006_accommodationcard_search"),
+        ("amenities", "0002_alter_accommodationamenity_custom_value_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="accommodationcard",
+            name="amenity_ids",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.BigIntegerField(), blank=True, default=list, size=None
+            ),
+        ),
+        # 기존 카드의 부대시설 id 채우기
+        migrations.RunSQL(
+            """
+            UPDATE accommodations_accommodationcard AS c
+            SET amenity_ids = ARRAY(
+                SELECT aa.amenity_id FROM amenities_accommodationamenity AS aa
+                WHERE aa.accommodation_id = c.accommodation_id
+                ORDER BY aa.amenity_id
+            )
+            """,
+            migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name="accommodationcard",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["amenity_ids"], name="accommodation_card_amenity_gin"
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.2 on 2026-10-18 17:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accommodations", "0007_accommodationcard_amenity_ids"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="accommodation",
+            index=models.Index(fields=["created_at", "id"], name="accommodation_created_id_idx"),
+        ),
+    ]
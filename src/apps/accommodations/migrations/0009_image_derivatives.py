@@ -0,0 +1,23 @@
+# Generated by Django 5.1.2 on 2026-10-18 18:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accommodations", "0008_accommodation_created_id_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="accommodation_image",
+            name="derivatives",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name="accommodationcard",
+            name="representative_image_derivatives",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-18 21:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accommodations", "0010_accommodation_image_storage"),
+    ]
+
+    operations = [
+        # 지도 타일 조회(MapClusterService.cluster)의 location::geometry && envelope 용 expression 인덱스
+        migrations.RunSQL(
+            "CREATE INDEX gps_info_location_geometry_gist ON accommodations_gps_info USING GIST ((location::geometry))",
+            "DROP INDEX IF EXISTS gps_info_location_geometry_gist",
+        ),
+    ]
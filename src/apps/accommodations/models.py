@@ -2,8 +2,13 @@
 
 from django.contrib.gis.db import models as gis_models
 from django.contrib.gis.geos import Point
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 
+from apps.accommodations.querysets.accommodation_queryset import AccommodationQuerySet
+from apps.common.storage import get_image_storage
 from apps.users.models import BusinessUser
 
 
@@ -18,6 +23,14 @@ class Accommodation(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = AccommodationQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # 등록순 keyset 페이지네이션
+            models.Index(fields=["created_at", "id"], name="accommodation_created_id_idx"),
+        ]
+
 
 class AccommodationType(models.Model):
     accommodation = models.OneToOneField(Accommodation, on_delete=models.CASCADE)
@@ -27,7 +40,10 @@ class AccommodationType(models.Model):
 
 class Accommodation_Image(models.Model):
     accommodation = models.ForeignKey(Accommodation, on_delete=models.CASCADE, related_name="images")
-    image = models.ImageField(upload_to="accommodation_images")
+    # 내용 hash 로 이름 짓는 storage - 같은 사진은 한 번만 저장된다 (apps.common.storage)
+    image = models.ImageField(upload_to="accommodation_images", storage=get_image_storage)
+    # thumbnail / card / full 파생본 경로와 크기 (apps.common.util.image_derivatives)
+    derivatives = models.JSONField(default=dict, blank=True)
     is_representative = models.BooleanField(default=False)
 
     class Meta:
@@ -61,3 +77,39 @@ class RefundPolicy(models.Model):
 
     def __str__(self):
         return f"Refund Policy for {self.accommodation.name}"
+
+
+class AccommodationCard(models.Model):
+    """
+    목록 화면용 숙소 카드 (비정규화 테이블)
+    Room / Accommodation_Image / GPS_Info / Rating 변경 시 signals 로 갱신된다
+    """
+
+    accommodation = models.OneToOneField(Accommodation, on_delete=models.CASCADE, primary_key=True, related_name="card")
+    min_price = models.IntegerField(null=True, blank=True, db_index=True)
+    representative_image = models.CharField(max_length=255, blank=True, default="")
+    representative_image_derivatives = models.JSONField(default=dict, blank=True)
+    address = models.CharField(max_length=512, blank=True, default="")
+    average_rating = models.FloatField(null=True, blank=True)
+    room_count = models.PositiveIntegerField(default=0)
+    # 부대시설 id 목록 (AccommodationAmenity) - "모두 포함" 필터(@>)와 facet 집계용
+    amenity_ids = ArrayField(models.BigIntegerField(), blank=True, default=list)
+    # 검색용 텍스트 - 숙소명 / 설명, 규칙, 주소(GPS_Info)
+    search_title = models.CharField(max_length=255, blank=True, default="")
+    search_text = models.TextField(blank=True, default="")
+    search_vector = models.GeneratedField(
+        expression=SearchVector("search_title", weight="A", config="simple")
+        + SearchVector("search_text", weight="B", config="simple"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["search_vector"], name="accommodation_card_search_gin"),
+            GinIndex(fields=["amenity_ids"], name="accommodation_card_amenity_gin"),
+            # 한글 부분 일치(ILIKE '%...%')와 오타 허용(trigram 유사도) 검색용
+            GinIndex(fields=["search_title"], opclasses=["gin_trgm_ops"], name="accommodation_card_title_trgm"),
+            GinIndex(fields=["search_text"], opclasses=["gin_trgm_ops"], name="accommodation_card_text_trgm"),
+        ]
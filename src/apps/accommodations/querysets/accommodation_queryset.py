@@ -0,0 +1,132 @@
+from typing import Optional
+
+from django.contrib.gis.db.models import PointField
+from django.contrib.gis.geos import Point
+from django.contrib.gis.measure import D
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramWordSimilarity,
+)
+from django.db import models
+from django.db.models import (
+    Exists,
+    Expression,
+    F,
+    FloatField,
+    Func,
+    Lookup,
+    OuterRef,
+    Prefetch,
+    Q,
+    Value,
+)
+from django.db.models.lookups import IContains
+from django.utils import timezone
+
+
+class KNNDistance(Func):
+    """PostGIS <-> 거리 연산자 - ORDER BY 에 사용하면 GiST 인덱스로 가까운 순서대로 탐색한다"""
+
+    arg_joiner = " <-> "
+    template = "(%(expressions)s)"
+    output_field = FloatField()
+
+
+class ILikeContains(IContains):
+    """
+    대소문자 무시 부분 일치를 col ILIKE '%...%' 로 만든다 (filter(ILikeContains(F("col"), value)) 로 사용)
+    Django 의 icontains 는 UPPER(col) LIKE UPPER(...) 로 컴파일되어 컬럼에 만든 gin_trgm_ops 인덱스를 쓰지 못한다
+    """
+
+    lookup_name = "ilike_contains"
+
+    def process_lhs(self, compiler, connection, lhs=None):
+        # BuiltinLookup 의 UPPER() 변환을 건너뛴다
+        lhs_sql, params = Lookup.process_lhs(self, compiler, connection, lhs)
+        return lhs_sql, list(params)
+
+    def get_rhs_op(self, connection, rhs):
+        return f"ILIKE {rhs}"
+
+
+def text_search_expressions(query: str, prefix: str = "") -> tuple[Q, Expression]:
+    """
+    숙소 카드(AccommodationCard) 검색 조건과 순위 식
+    - 전문 검색: search_vector @@ websearch_to_tsquery (GIN)
+    - 한글 부분 일치: ILIKE '%...%' (pg_trgm GIN)
+    - 오타 허용: 숙소명 trigram word similarity (pg_trgm GIN)
+    prefix 로 다른 모델에서 카드까지의 경로를 지정한다 (예: "card__", "accommodation__card__")
+    """
+    search_query = SearchQuery(query, config="simple", search_type="websearch")
+    condition = (
+        Q(**{f"{prefix}search_vector": search_query})
+        | Q(ILikeContains(F(f"{prefix}search_title"), query))
+        | Q(ILikeContains(F(f"{prefix}search_text"), query))
+        | Q(**{f"{prefix}search_title__trigram_word_similar": query})
+    )
+    rank = SearchRank(F(f"{prefix}search_vector"), search_query) + TrigramWordSimilarity(query, f"{prefix}search_title")
+    return condition, rank
+
+
+class AccommodationQuerySet(models.QuerySet):
+    def active(self):
+        return self.filter(is_active=True)
+
+    def touch(self):
+        """
+        하위 데이터(객실, 이미지, 부대시설 등) 변경 시 숙소 버전(updated_at)을 올린다
+        QuerySet.update 를 사용하므로 Accommodation post_save signal 은 발생하지 않는다
+        """
+        return self.update(updated_at=timezone.now())
+
+    def for_detail_page(self):
+        """
+        숙소 상세 페이지용 쿼리셋
+        객실 수와 관계없이 고정된 쿼리 수(숙소+GPS 1, 숙소 이미지 1, 환불정책 1, 객실 1, 객실 이미지 1)로 조회한다
+        """
+        from apps.rooms.models import Room
+
+        rooms = Room.objects.order_by("id").prefetch_related("images")
+        return self.select_related("gps_info").prefetch_related(
+            "images",
+            "refund_policies",
+            Prefetch("room_set", queryset=rooms),
+        )
+
+    def with_amenities(self, amenity_ids):
+        """부대시설을 모두 갖춘 숙소 (숙소 카드 amenity_ids @> ... , GIN)"""
+        return self.filter(card__amenity_ids__contains=list(amenity_ids))
+
+    def with_available_room(
+        self, guests_count: Optional[int] = None, min_price: Optional[int] = None, max_price: Optional[int] = None
+    ):
+        """조건(인원/1박 요금)에 맞는 판매 중인 객실이 하나라도 있는 숙소"""
+        from apps.rooms.models import Room
+
+        rooms = Room.objects.available().filter(accommodation=OuterRef("pk"))
+        if guests_count is not None:
+            rooms = rooms.within_capacity_range(guests_count)
+        if min_price is not None:
+            rooms = rooms.filter(price__gte=min_price)
+        if max_price is not None:
+            rooms = rooms.filter(price__lte=max_price)
+        return self.filter(Exists(rooms))
+
+    def nearby(self, point: Point, radius_m: float):
+        """
+        반경 radius_m(미터) 안의 숙소를 가까운 순으로 (distance: 구면 거리, 미터)
+        ST_DWithin 으로 거르고 <-> (KNN) 으로 정렬해 GPS_Info.location 의 GiST 인덱스를 사용한다
+        distance 는 keyset 페이지네이션의 정렬 키로도 쓰인다 (WHERE distance > 이전 페이지 마지막 값)
+        """
+        geography_point = Value(point, output_field=PointField(geography=True, srid=4326))
+        return (
+            self.filter(gps_info__location__dwithin=(point, D(m=radius_m)))
+            .annotate(distance=KNNDistance("gps_info__location", geography_point))
+            .order_by("distance", "id")
+        )
+
+    def text_search(self, query: str):
+        """숙소명/설명/규칙/주소 검색 - search_rank 가 높은 순"""
+        condition, rank = text_search_expressions(query, prefix="card__")
+        return self.filter(condition).annotate(search_rank=rank).order_by("-search_rank", "id")
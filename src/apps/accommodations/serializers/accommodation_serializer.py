@@ -7,10 +7,13 @@ from apps.accommodations.models import (
     AccommodationType,
     GPS_Info,
 )
+from apps.accommodations.signals import accommodation_changed
 from apps.amenities.models import AccommodationAmenity, Amenity
 from apps.amenities.serializers.amenities_serializers import (
     AccommodationAmenityUpdateSerializer,
 )
+from apps.common.serializers import DynamicFieldsMixin, Expandable
+from apps.common.util.image_derivatives import ImageDerivativeService
 
 
 # 기본 조회/생성용 시리얼라이저들
@@ -65,7 +68,8 @@ class AccommodationImageSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Accommodation_Image
-        fields = ["id", "image", "image_url"]
+        fields = ["id", "image", "image_url", "derivatives"]
+        read_only_fields = ["derivatives"]
 
     def get_image_url(self, obj):
         if obj.image:
@@ -73,7 +77,7 @@ class AccommodationImageSerializer(serializers.ModelSerializer):
         return None
 
 
-class AccommodationSerializer(serializers.ModelSerializer):
+class AccommodationSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     accommodation_type = AccommodationTypeSerializer(source="accommodationtype")
     images = AccommodationImageSerializer(many=True, read_only=True)
     upload_images = serializers.ListField(
@@ -112,6 +116,13 @@ class AccommodationSerializer(serializers.ModelSerializer):
             "accommodation_amenities",  # 조회용
         ]
         read_only_fields = ["id", "host", "average_rating", "created_at", "updated_at"]
+        # ?fields= / ?expand= 로 고를 수 있는 중첩 필드
+        expandable_fields = {
+            "accommodation_type": Expandable(select_related=("accommodationtype",)),
+            "gps_info": Expandable(select_related=("gps_info",)),
+            "images": Expandable(prefetch_related=("images",)),
+            "accommodation_amenities": Expandable(prefetch_related=("accommodationamenity_set",)),
+        }
 
     def validate_phone_number(self, value):
         import re
@@ -167,7 +178,10 @@ class AccommodationSerializer(serializers.ModelSerializer):
         for image in upload_images:
             image_instances.append(Accommodation_Image(accommodation=accommodation, image=image))
         if image_instances:
-            Accommodation_Image.objects.bulk_create(image_instances)
+            created_images = Accommodation_Image.objects.bulk_create(image_instances)
+            # bulk_create 는 model signal 을 보내지 않으므로 직접 알린다
+            accommodation_changed.send(sender=Accommodation_Image, accommodation_id=accommodation.pk)
+            ImageDerivativeService.schedule(created_images)
 
         # 기존 부대시설 처리
         for amenity in amenities_data:
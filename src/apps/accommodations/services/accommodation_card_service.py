@@ -0,0 +1,123 @@
+from typing import Iterable, Optional
+
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db import transaction
+from django.db.models import Avg, Count, FloatField, Min, OuterRef, QuerySet, Subquery
+from django.db.models.functions import Cast, Coalesce
+
+from apps.accommodations.models import (
+    Accommodation,
+    Accommodation_Image,
+    AccommodationCard,
+    GPS_Info,
+)
+from apps.amenities.models import AccommodationAmenity
+from apps.reviews.models import Rating
+from apps.rooms.models import Room
+
+CARD_FIELDS = [
+    "min_price",
+    "representative_image",
+    "representative_image_derivatives",
+    "address",
+    "average_rating",
+    "room_count",
+    "amenity_ids",
+    "search_title",
+    "search_text",
+]
+
+
+class AccommodationCardService:
+    """숙소 카드(AccommodationCard) 생성/갱신"""
+
+    @staticmethod
+    def format_address(gps_info: Optional[GPS_Info]) -> str:
+        if gps_info is None:
+            return ""
+        parts = [gps_info.city, gps_info.states, gps_info.road_name, gps_info.address]
+        return " ".join(part for part in parts if part)
+
+    @staticmethod
+    def format_search_text(accommodation: Accommodation, address: str) -> str:
+        parts = [accommodation.description, accommodation.rules, address]
+        return " ".join(part for part in parts if part)
+
+    @staticmethod
+    def annotate_card_values(queryset: QuerySet) -> QuerySet:
+        """카드에 들어갈 값들을 숙소 쿼리셋 한 번으로 계산"""
+        rooms = Room.objects.filter(accommodation=OuterRef("pk")).order_by().values("accommodation")
+        ratings = Rating.objects.filter(review__accommodation=OuterRef("pk")).order_by().values("review__accommodation")
+        images = Accommodation_Image.objects.filter(accommodation=OuterRef("pk")).order_by("-is_representative", "id")
+        amenities = AccommodationAmenity.objects.filter(accommodation=OuterRef("pk")).order_by("amenity_id")
+
+        return queryset.select_related("gps_info").annotate(
+            card_min_price=Subquery(rooms.annotate(value=Min("price")).values("value")),
+            card_room_count=Coalesce(Subquery(rooms.annotate(value=Count("id")).values("value")), 0),
+            card_image=Subquery(images.values("image")[:1]),
+            card_image_derivatives=Subquery(images.values("derivatives")[:1]),
+            card_amenity_ids=ArraySubquery(amenities.values("amenity_id")),
+            card_average_rating=Subquery(
+                ratings.annotate(value=Avg(Cast("rating", FloatField()))).values("value"),
+                output_field=FloatField(),
+            ),
+        )
+
+    @staticmethod
+    def build_card(accommodation: Accommodation) -> AccommodationCard:
+        gps_info = getattr(accommodation, "gps_info", None)
+        address = AccommodationCardService.format_address(gps_info)
+        return AccommodationCard(
+            accommodation_id=accommodation.pk,
+            min_price=accommodation.card_min_price,
+            representative_image=accommodation.card_image or "",
+            representative_image_derivatives=accommodation.card_image_derivatives or {},
+            address=address,
+            average_rating=accommodation.card_average_rating,
+            room_count=accommodation.card_room_count,
+            amenity_ids=accommodation.card_amenity_ids,
+            search_title=accommodation.name,
+            search_text=AccommodationCardService.format_search_text(accommodation, address),
+        )
+
+    @staticmethod
+    def save_cards(cards: Iterable[AccommodationCard]) -> None:
+        AccommodationCard.objects.bulk_create(
+            cards,
+            update_conflicts=True,
+            unique_fields=["accommodation"],
+            update_fields=[*CARD_FIELDS, "updated_at"],
+        )
+
+    @staticmethod
+    def refresh(accommodation_id: int) -> None:
+        accommodation = AccommodationCardService.annotate_card_values(
+            Accommodation.objects.filter(pk=accommodation_id)
+        ).first()
+        if accommodation is None:
+            # 숙소가 삭제된 경우 카드는 cascade 로 함께 삭제된다
+            return
+        AccommodationCardService.save_cards([AccommodationCardService.build_card(accommodation)])
+
+    @staticmethod
+    def schedule_refresh(accommodation_id: int) -> None:
+        """트랜잭션이 커밋된 뒤 카드를 갱신 (롤백되면 갱신하지 않는다)"""
+        transaction.on_commit(lambda: AccommodationCardService.refresh(accommodation_id))
+
+    @staticmethod
+    def rebuild(batch_size: int = 1000) -> int:
+        """전체 카드 재생성 - 생성/갱신한 카드 수를 반환"""
+        queryset = AccommodationCardService.annotate_card_values(Accommodation.objects.order_by("pk"))
+
+        count = 0
+        batch = []
+        for accommodation in queryset.iterator(chunk_size=batch_size):
+            batch.append(AccommodationCardService.build_card(accommodation))
+            if len(batch) >= batch_size:
+                AccommodationCardService.save_cards(batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            AccommodationCardService.save_cards(batch)
+            count += len(batch)
+        return count
@@ -0,0 +1,96 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from apps.accommodations.models import (
+    Accommodation,
+    Accommodation_Image,
+    GPS_Info,
+    RefundPolicy,
+)
+from apps.accommodations.services.accommodation_card_service import (
+    AccommodationCardService,
+)
+from apps.amenities.models import AccommodationAmenity, RoomOption
+from apps.common.storage import release_files
+from apps.common.util.image_derivatives import ImageDerivativeService, derivative_names
+from apps.reviews.models import Rating, Review
+from apps.rooms.models import Room, Room_Image
+
+# bulk_create 처럼 model signal 이 발생하지 않는 변경 후 직접 보내는 signal (kwargs: accommodation_id)
+accommodation_changed = Signal()
+
+
+@receiver(accommodation_changed)
+def handle_accommodation_changed(sender, accommodation_id, **kwargs):
+    Accommodation.objects.filter(pk=accommodation_id).touch()
+    AccommodationCardService.schedule_refresh(accommodation_id)
+
+
+# 숙소 버전(updated_at) 갱신 - ETag / Last-Modified 검증값으로 사용
+@receiver(post_save, sender=Room)
+@receiver(post_delete, sender=Room)
+@receiver(post_save, sender=Accommodation_Image)
+@receiver(post_delete, sender=Accommodation_Image)
+@receiver(post_save, sender=GPS_Info)
+@receiver(post_delete, sender=GPS_Info)
+@receiver(post_save, sender=RefundPolicy)
+@receiver(post_delete, sender=RefundPolicy)
+@receiver(post_save, sender=AccommodationAmenity)
+@receiver(post_delete, sender=AccommodationAmenity)
+def touch_accommodation(sender, instance, **kwargs):
+    Accommodation.objects.filter(pk=instance.accommodation_id).touch()
+
+
+@receiver(post_save, sender=Room_Image)
+@receiver(post_delete, sender=Room_Image)
+@receiver(post_save, sender=RoomOption)
+@receiver(post_delete, sender=RoomOption)
+def touch_room_accommodation(sender, instance, **kwargs):
+    Accommodation.objects.filter(room__pk=instance.room_id).touch()
+
+
+# 숙소 카드 갱신
+@receiver(post_save, sender=Accommodation)
+def save_accommodation_card(sender, instance, **kwargs):
+    # 숙소명/설명/규칙은 카드의 검색 텍스트에 포함된다
+    AccommodationCardService.schedule_refresh(instance.pk)
+
+
+@receiver(post_save, sender=Room)
+@receiver(post_delete, sender=Room)
+@receiver(post_save, sender=Accommodation_Image)
+@receiver(post_delete, sender=Accommodation_Image)
+@receiver(post_save, sender=GPS_Info)
+@receiver(post_delete, sender=GPS_Info)
+@receiver(post_save, sender=AccommodationAmenity)
+@receiver(post_delete, sender=AccommodationAmenity)
+def refresh_accommodation_card(sender, instance, **kwargs):
+    AccommodationCardService.schedule_refresh(instance.accommodation_id)
+
+
+# 이미지 파생본 생성 (bulk_create 한 곳은 ImageDerivativeService.schedule 을 직접 호출한다)
+@receiver(post_save, sender=Accommodation_Image)
+@receiver(post_save, sender=Room_Image)
+def schedule_image_derivatives(sender, instance, **kwargs):
+    if not ImageDerivativeService.is_current(instance):
+        ImageDerivativeService.schedule([instance])
+
+
+# 이미지 행이 삭제되면(queryset delete / cascade 포함) 원본과 파생본의 파일 참조를 해제한다
+@receiver(post_delete, sender=Accommodation_Image)
+@receiver(post_delete, sender=Room_Image)
+def release_image_files(sender, instance, **kwargs):
+    release_files(instance.image.storage, [instance.image.name, *derivative_names(instance.derivatives)])
+
+
+@receiver(post_save, sender=Rating)
+@receiver(post_delete, sender=Rating)
+def refresh_accommodation_card_rating(sender, instance, **kwargs):
+    accommodation_id = Review.objects.filter(pk=instance.review_id).values_list("accommodation_id", flat=True).first()
+    if accommodation_id is not None:
+        AccommodationCardService.schedule_refresh(accommodation_id)
+
+
+@receiver(post_delete, sender=Review)
+def refresh_accommodation_card_review(sender, instance, **kwargs):
+    AccommodationCardService.schedule_refresh(instance.accommodation_id)
@@ -0,0 +1,85 @@
+from datetime import time
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from apps.accommodations.models import (
+    Accommodation,
+    Accommodation_Image,
+    AccommodationCard,
+    GPS_Info,
+)
+from apps.reviews.models import Rating, Review
+from apps.rooms.models import Room
+from apps.users.models import BusinessUser
+
+User = get_user_model()
+
+
+class AccommodationCardTests(TestCase):
+    """숙소 카드 갱신 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_superuser(email="card@test.com", password="testpass123")
+        self.host = BusinessUser.objects.create(user=self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.accommodation = Accommodation.objects.create(host=self.host, name="Card Hotel")
+
+    def create_room(self, price):
+        return Room.objects.create(
+            accommodation=self.accommodation,
+            name=f"room {price}",
+            capacity=2,
+            max_capacity=4,
+            price=price,
+            stay_type=True,
+            check_in_time=time(15, 0),
+            check_out_time=time(11, 0),
+        )
+
+    def test_card_created_with_accommodation(self):
+        self.assertTrue(AccommodationCard.objects.filter(pk=self.accommodation.pk).exists())
+
+    def test_room_writes_update_min_price_and_count(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            cheap = self.create_room(50000)
+            self.create_room(80000)
+
+        card = AccommodationCard.objects.get(pk=self.accommodation.pk)
+        self.assertEqual(card.min_price, 50000)
+        self.assertEqual(card.room_count, 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            cheap.delete()
+
+        card.refresh_from_db()
+        self.assertEqual(card.min_price, 80000)
+        self.assertEqual(card.room_count, 1)
+
+    def test_image_gps_and_rating_writes_update_card(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Accommodation_Image.objects.create(accommodation=self.accommodation, image="accommodation_images/a.jpg")
+            Accommodation_Image.objects.create(
+                accommodation=self.accommodation, image="accommodation_images/b.jpg", is_representative=True
+            )
+            GPS_Info.objects.create(
+                accommodation=self.accommodation, city="Seoul", states="Gangnam", road_name="Teheran-ro", address="1"
+            )
+            review = Review.objects.create(guest=self.user, accommodation=self.accommodation, contents="good")
+            Rating.objects.create(review=review, rating="4")
+
+        card = AccommodationCard.objects.get(pk=self.accommodation.pk)
+        self.assertEqual(card.representative_image, "accommodation_images/b.jpg")
+        self.assertEqual(card.address, "Seoul Gangnam Teheran-ro 1")
+        self.assertEqual(card.average_rating, 4.0)
+
+    def test_rebuild_command_restores_missing_cards(self):
+        self.create_room(70000)
+        AccommodationCard.objects.all().delete()
+
+        call_command("rebuild_accommodation_cards")
+
+        card = AccommodationCard.objects.get(pk=self.accommodation.pk)
+        self.assertEqual(card.min_price, 70000)
+        self.assertEqual(card.room_count, 1)
@@ -0,0 +1,116 @@
+from datetime import date, time, timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.accommodations.models import Accommodation, GPS_Info
+from apps.rooms.models import Room, RoomInventory
+from apps.users.models import BusinessUser
+
+User = get_user_model()
+
+
+class AccommodationSearchTests(TestCase):
+    """숙소 텍스트 검색 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_superuser(email="search@test.com", password="testpass123")
+        self.host = BusinessUser.objects.create(user=self.user)
+
+    def create_accommodation(self, name, description="", address=""):
+        with self.captureOnCommitCallbacks(execute=True):
+            accommodation = Accommodation.objects.create(host=self.host, name=name, description=description)
+            if address:
+                GPS_Info.objects.create(
+                    accommodation=accommodation, city="서울", states="강남구", road_name="", address=address
+                )
+            room = Room.objects.create(
+                accommodation=accommodation,
+                name="standard",
+                capacity=2,
+                max_capacity=4,
+                price=100000,
+                stay_type=True,
+                check_in_time=time(15, 0),
+                check_out_time=time(11, 0),
+            )
+            RoomInventory.objects.create(room=room, count_room=1)
+        return accommodation
+
+    def search(self, query):
+        return list(Accommodation.objects.text_search(query).values_list("name", flat=True))
+
+    def test_partial_match_uses_ilike_on_raw_columns(self):
+        # when
+        sql = str(Accommodation.objects.text_search("해운").query)
+
+        # then - UPPER(col) LIKE 는 gin_trgm_ops 인덱스를 쓰지 못한다
+        self.assertIn('"search_title" ILIKE', sql)
+        self.assertIn('"search_text" ILIKE', sql)
+        self.assertNotIn("UPPER(", sql)
+
+    def test_korean_partial_match(self):
+        # given
+        self.create_accommodation("강남역스테이 호텔")
+        self.create_accommodation("부산 해운대 리조트")
+
+        # then
+        self.assertEqual(self.search("강남"), ["강남역스테이 호텔"])
+
+    def test_typo_tolerant_match(self):
+        # given
+        self.create_accommodation("The Shilla Seoul")
+
+        # then
+        self.assertEqual(self.search("shila"), ["The Shilla Seoul"])
+
+    def test_matches_description_and_address(self):
+        # given
+        self.create_accommodation("A", description="오션뷰 수영장")
+        self.create_accommodation("B", address="테헤란로 123")
+
+        # then
+        self.assertEqual(self.search("수영장"), ["A"])
+        self.assertEqual(self.search("테헤란로"), ["B"])
+
+    def test_name_match_ranks_above_description_match(self):
+        # given
+        self.create_accommodation("hotel grace", description="quiet")
+        self.create_accommodation("quiet house", description="grace")
+
+        # then
+        self.assertEqual(self.search("grace"), ["hotel grace", "quiet house"])
+
+    def test_card_follows_name_change(self):
+        # given
+        accommodation = self.create_accommodation("old name")
+
+        # when
+        with self.captureOnCommitCallbacks(execute=True):
+            accommodation.name = "new name"
+            accommodation.save()
+
+        # then
+        self.assertEqual(self.search("new"), ["new name"])
+        self.assertEqual(self.search("old"), [])
+
+    def test_availability_search_composes_with_text_query(self):
+        # given
+        self.create_accommodation("강남 호텔")
+        self.create_accommodation("부산 호텔")
+        check_in = date.today() + timedelta(days=3)
+
+        # when
+        response = self.client.get(
+            reverse("pages:availability_search"),
+            {
+                "check_in_date": check_in,
+                "check_out_date": check_in + timedelta(days=1),
+                "guests_count": 2,
+                "q": "강남",
+            },
+        )
+
+        # then
+        self.assertEqual([result["accommodation_name"] for result in response.data["results"]], ["강남 호텔"])
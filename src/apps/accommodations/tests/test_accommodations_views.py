@@ -61,7 +61,7 @@ class ViewTests(APITestCase):
 
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data["results"]), 1)
 
     def test_update_accommodation(self):
         """숙소 정보 수정 테스트"""
@@ -1,7 +1,7 @@
 from django.contrib.auth import get_user_model
 from django.contrib.gis.geos import Point
 from django.db import transaction
-from django.db.models import Avg, Q
+from django.db.models import Avg, Count, Max, Q
 from django.shortcuts import get_object_or_404
 from rest_framework import filters, generics, status
 from rest_framework.exceptions import ValidationError
@@ -23,7 +23,12 @@ from apps.accommodations.serializers.accommodation_serializer import (
     AccommodationUpdateSerializer,
     GPSInfoSerializer,
 )
+from apps.accommodations.signals import accommodation_changed
 from apps.amenities.models import AccommodationAmenity, Amenity
+from apps.common.cache.conditional import ConditionalGetMixin
+from apps.common.serializers import DynamicFieldsViewMixin
+from apps.common.util.direct_upload import DirectUploadService
+from apps.common.util.image_derivatives import ImageDerivativeService
 from apps.users.models import BusinessUser
 
 User = get_user_model()
@@ -34,6 +39,10 @@ class BaseAccommodationView:
 
     permission_classes = [AllowAny]
 
+    def get_accommodation_last_modified(self, accommodation_id):
+        """숙소 버전 - 객실/이미지/부대시설 변경 시에도 갱신된다 (ETag / Last-Modified)"""
+        return Accommodation.objects.filter(pk=accommodation_id).values_list("updated_at", flat=True).first()
+
     def get_or_create_host(self):
         superuser = User.objects.filter(is_superuser=True).first()
         if not superuser:
@@ -47,12 +56,30 @@ class BaseAccommodationView:
         return host
 
 
-class AccommodationListCreateView(BaseAccommodationView, generics.ListCreateAPIView):
-    """숙소 목록 조회 및 생성"""
+class AccommodationListCreateView(
+    ConditionalGetMixin, DynamicFieldsViewMixin, BaseAccommodationView, generics.ListCreateAPIView
+):
+    """숙소 목록 조회 및 생성 (?fields= / ?expand= 로 필요한 필드만)"""
 
-    queryset = Accommodation.objects.all().select_related("accommodationtype", "gps_info").prefetch_related("images")
+    # 중첩 필드의 관계는 요청한 것만 DynamicFieldsViewMixin 이 읽는다
+    queryset = Accommodation.objects.all()
     serializer_class = AccommodationSerializer
     permission_classes = [AllowAny]
+    # keyset 페이지네이션 정렬 (?ordering=-created_at) - Accommodation(created_at, id) 인덱스
+    cursor_orderings = {
+        "id": ("id",),
+        "-created_at": ("-created_at", "-id"),
+        "created_at": ("created_at", "id"),
+    }
+
+    def get_last_modified(self):
+        summary = Accommodation.objects.aggregate(last_modified=Max("updated_at"), count=Count("id"))
+        self.accommodation_count = summary["count"]
+        return summary["last_modified"]
+
+    def get_etag_extra(self):
+        # 삭제는 최신 수정 시각을 바꾸지 않으므로 개수를 함께 반영
+        return str(self.accommodation_count)
 
     def validate_accommodation_data(self, request_data):
         if not request_data.get("name"):
@@ -108,7 +135,8 @@ class AccommodationListCreateView(BaseAccommodationView, generics.ListCreateAPIV
         else:
             raise ValidationError(accommodation_serializer.errors)
 
-        # 4. 이미지 처리
+        # 4. 이미지 처리 (presigned 직접 업로드는 upload_ids 로 확인)
+        upload_ids = DirectUploadService.get_upload_ids(request.data)
         images = request.FILES.getlist("images", [])
         total_size = sum(image.size for image in images)
 
@@ -122,8 +150,14 @@ class AccommodationListCreateView(BaseAccommodationView, generics.ListCreateAPIV
             if image.size > 10 * 1024 * 1024:  # 10MB
                 raise ValidationError({"images": f"{image.name}의 크기가 10MB를 초과합니다."})
             image_instances.append(Accommodation_Image(accommodation=accommodation, image=image))
+        if upload_ids:
+            for name in DirectUploadService.confirm(request.user, "accommodation_image", upload_ids):
+                image_instances.append(Accommodation_Image(accommodation=accommodation, image=name))
         if image_instances:
-            Accommodation_Image.objects.bulk_create(image_instances)
+            created_images = Accommodation_Image.objects.bulk_create(image_instances)
+            # bulk_create 는 model signal 을 보내지 않으므로 직접 알린다
+            accommodation_changed.send(sender=Accommodation_Image, accommodation_id=accommodation.pk)
+            ImageDerivativeService.schedule(created_images)
 
         # 5. 부대시설 처리
         amenities_data = request.data.get("amenities", [])
@@ -137,10 +171,15 @@ class AccommodationListCreateView(BaseAccommodationView, generics.ListCreateAPIV
         return Response(accommodation_serializer.data, status=status.HTTP_201_CREATED)
 
 
-class AccommodationRetrieveUpdateDestroyView(BaseAccommodationView, generics.RetrieveUpdateDestroyAPIView):
+class AccommodationRetrieveUpdateDestroyView(
+    ConditionalGetMixin, DynamicFieldsViewMixin, BaseAccommodationView, generics.RetrieveUpdateDestroyAPIView
+):
     """숙소 상세 조회, 수정, 삭제"""
 
-    queryset = Accommodation.objects.all().select_related("accommodationtype", "gps_info").prefetch_related("images")
+    queryset = Accommodation.objects.all()
+
+    def get_last_modified(self):
+        return self.get_accommodation_last_modified(self.kwargs["pk"])
 
     def get_serializer_class(self):
         if self.request.method in ["PUT", "PATCH"]:
@@ -175,9 +214,14 @@ class AccommodationRetrieveUpdateDestroyView(BaseAccommodationView, generics.Ret
 
 
 # 이미지 관리
-class AccommodationImageView(BaseAccommodationView, generics.ListCreateAPIView, generics.DestroyAPIView):
+class AccommodationImageView(
+    ConditionalGetMixin, BaseAccommodationView, generics.ListCreateAPIView, generics.DestroyAPIView
+):
     """숙소 이미지 관리"""
 
+    def get_last_modified(self):
+        return self.get_accommodation_last_modified(self.kwargs["pk"])
+
     def get_serializer_class(self):
         if self.request.method == "POST":
             return AccommodationImageUpdateSerializer
@@ -200,28 +244,35 @@ class AccommodationImageView(BaseAccommodationView, generics.ListCreateAPIView,
     def create(self, request, *args, **kwargs):
         accommodation = get_object_or_404(Accommodation, pk=self.kwargs["pk"])
 
-        # 이미지 처리 및 검증
-        if "images" not in request.FILES:
-            raise ValidationError({"images": "이미지 파일은 필수입니다."})
+        # presigned 직접 업로드(upload_ids)는 storage 에 올라온 파일을 확인만 한다
+        upload_ids = DirectUploadService.get_upload_ids(request.data)
+        if upload_ids:
+            images = DirectUploadService.confirm(request.user, "accommodation_image", upload_ids)
+        else:
+            # 이미지 처리 및 검증
+            if "images" not in request.FILES:
+                raise ValidationError({"images": "이미지 파일은 필수입니다."})
 
-        images = request.FILES.getlist("images")
-        total_size = sum(image.size for image in images)
+            images = request.FILES.getlist("images")
+            total_size = sum(image.size for image in images)
 
-        if total_size > 50 * 1024 * 1024:
-            raise ValidationError({"images": "전체 이미지 크기가 50MB를 초과할 수 없습니다."})
+            if total_size > 50 * 1024 * 1024:
+                raise ValidationError({"images": "전체 이미지 크기가 50MB를 초과할 수 없습니다."})
+
+            for image in images:
+                AccommodationImageUpdateSerializer(data={"image": image}).is_valid(raise_exception=True)
 
         # 기존 이미지 삭제 여부 확인
-        if request.data.get("delete_existing", "").lower() == "true":
+        if str(request.data.get("delete_existing", "")).lower() == "true":
             accommodation.images.all().delete()
 
         # 새 이미지 추가
-        image_instances = []
-        for image in images:
-            serializer = AccommodationImageUpdateSerializer(data={"image": image})
-            if serializer.is_valid(raise_exception=True):
-                image_instances.append(Accommodation_Image(accommodation=accommodation, image=image))
+        image_instances = [Accommodation_Image(accommodation=accommodation, image=image) for image in images]
 
         created_images = Accommodation_Image.objects.bulk_create(image_instances)
+        # bulk_create 는 model signal 을 보내지 않으므로 직접 알린다
+        accommodation_changed.send(sender=Accommodation_Image, accommodation_id=accommodation.pk)
+        ImageDerivativeService.schedule(created_images)
         response_serializer = AccommodationImageSerializer(created_images, many=True)
 
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
@@ -234,12 +285,15 @@ class AccommodationImageView(BaseAccommodationView, generics.ListCreateAPIView,
 
 
 # GPS 정보 관리
-class GPSInfoView(BaseAccommodationView, generics.RetrieveUpdateAPIView):
+class GPSInfoView(ConditionalGetMixin, BaseAccommodationView, generics.RetrieveUpdateAPIView):
     """GPS 정보 조회 및 수정"""
 
     serializer_class = GPSInfoSerializer
     queryset = Accommodation.objects.all().select_related("gps_info")
 
+    def get_last_modified(self):
+        return self.get_accommodation_last_modified(self.kwargs["accommodation_id"])
+
     def get_object(self):
         accommodation = get_object_or_404(Accommodation, id=self.kwargs.get("accommodation_id"))
         return accommodation.gps_info
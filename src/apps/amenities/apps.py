@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class AmenitiesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.amenities"
+
+    def ready(self):
+        from apps.amenities import signals  # noqa: F401
@@ -0,0 +1,48 @@
+from django.db import transaction
+
+from apps.amenities.models import Amenity, Option
+from apps.common.cache.backends import get_catalog_cache
+
+AMENITY_CATALOG_KEY = "amenity_catalog:amenities"
+OPTION_CATALOG_KEY = "amenity_catalog:options"
+AMENITY_TAG = "amenities"
+OPTION_TAG = "options"
+
+
+class AmenityCatalogService:
+    """
+    부대시설/옵션 전체 목록 (검색 facet 이름 등)
+    catalog 2단 캐시에 두어 워커 메모리에서 읽고, Amenity/Option 변경 시 태그로 모든 워커에서 무효화한다
+    """
+
+    @staticmethod
+    def _get(key: str, tag: str, queryset) -> list[dict]:
+        catalog = get_catalog_cache()
+        data = catalog.get(key)
+        if data is None:
+            # 목록을 읽는 동안 무효화되면 이전 목록을 저장하지 않도록 읽기 전에 태그 버전을 기록한다
+            snapshot = catalog.snapshot_tags([tag])
+            data = list(queryset)
+            catalog.set(key, data, snapshot=snapshot)
+        return data
+
+    @staticmethod
+    def amenities() -> list[dict]:
+        return AmenityCatalogService._get(
+            AMENITY_CATALOG_KEY,
+            AMENITY_TAG,
+            Amenity.objects.order_by("category", "id").values("id", "name", "category", "icon", "is_custom"),
+        )
+
+    @staticmethod
+    def options() -> list[dict]:
+        return AmenityCatalogService._get(
+            OPTION_CATALOG_KEY,
+            OPTION_TAG,
+            Option.objects.order_by("category", "id").values("id", "name", "category", "is_custom"),
+        )
+
+    @staticmethod
+    def schedule_invalidate(*tags: str) -> None:
+        # 커밋 전에 지우면 다른 요청이 커밋 전 목록으로 다시 채울 수 있다
+        transaction.on_commit(lambda: get_catalog_cache().invalidate_tags(*tags))
@@ -0,0 +1,48 @@
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db import connection
+from django.db.models import OuterRef, QuerySet
+
+from apps.accommodations.models import AccommodationCard
+from apps.amenities.models import RoomOption
+from apps.rooms.models import Room
+
+
+class AmenityIndexService:
+    """
+    부대시설/옵션 id 배열(AccommodationCard.amenity_ids, Room.option_ids) 관리와 facet 집계
+    숙소 부대시설은 숙소 카드 갱신 시 함께 계산되고, 객실 옵션은 RoomOption 변경 시 바로 갱신된다
+    """
+
+    @staticmethod
+    def refresh_room_options(room_id: int) -> None:
+        options = RoomOption.objects.filter(room_id=OuterRef("pk")).order_by("option_id").values("option_id")
+        Room.objects.filter(pk=room_id).update(option_ids=ArraySubquery(options))
+
+    @staticmethod
+    def _facets(table: str, column: str, key: str, ids_queryset: QuerySet) -> dict[int, int]:
+        ids_sql, params = ids_queryset.query.sql_with_params()
+        sql = f"""
+            SELECT value, COUNT(*)
+            FROM {table} t
+            CROSS JOIN LATERAL unnest(t.{column}) AS value
+            WHERE t.{key} IN ({ids_sql})
+            GROUP BY value
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return dict(cursor.fetchall())
+
+    @staticmethod
+    def amenity_facets(accommodations: QuerySet) -> dict[int, int]:
+        """숙소 결과 집합에서 부대시설별 숙소 수 {amenity_id: count} (한 번의 쿼리)"""
+        return AmenityIndexService._facets(
+            AccommodationCard._meta.db_table,
+            "amenity_ids",
+            "accommodation_id",
+            accommodations.order_by().values("pk"),
+        )
+
+    @staticmethod
+    def option_facets(rooms: QuerySet) -> dict[int, int]:
+        """객실 결과 집합에서 옵션별 객실 수 {option_id: count} (한 번의 쿼리)"""
+        return AmenityIndexService._facets(Room._meta.db_table, "option_ids", "id", rooms.order_by().values("pk"))
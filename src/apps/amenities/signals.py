@@ -0,0 +1,28 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.amenities.models import Amenity, Option, RoomOption
+from apps.amenities.services.amenity_catalog_service import (
+    AMENITY_TAG,
+    OPTION_TAG,
+    AmenityCatalogService,
+)
+from apps.amenities.services.amenity_index_service import AmenityIndexService
+
+
+@receiver(post_save, sender=RoomOption)
+@receiver(post_delete, sender=RoomOption)
+def refresh_room_option_ids(sender, instance, **kwargs):
+    AmenityIndexService.refresh_room_options(instance.room_id)
+
+
+@receiver(post_save, sender=Amenity)
+@receiver(post_delete, sender=Amenity)
+def invalidate_amenity_catalog(sender, instance, **kwargs):
+    AmenityCatalogService.schedule_invalidate(AMENITY_TAG)
+
+
+@receiver(post_save, sender=Option)
+@receiver(post_delete, sender=Option)
+def invalidate_option_catalog(sender, instance, **kwargs):
+    AmenityCatalogService.schedule_invalidate(OPTION_TAG)
@@ -7,6 +7,7 @@ from rest_framework import generics, permissions, status
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
+from apps.accommodations.signals import accommodation_changed
 from apps.amenities.models import AccommodationAmenity, Amenity, Option, RoomOption
 from apps.amenities.serializers.amenities_serializers import (
     AccommodationAmenityUpdateSerializer,
@@ -94,6 +95,8 @@ class AccommodationAmenityView(generics.RetrieveUpdateDestroyAPIView):
             )
 
         AccommodationAmenity.objects.bulk_create(amenity_instances)
+        # bulk_create 는 model signal 을 보내지 않으므로 직접 알린다
+        accommodation_changed.send(sender=AccommodationAmenity, accommodation_id=accommodation_id)
 
         # 업데이트된 데이터 반환
         updated_amenities = self.get_queryset()
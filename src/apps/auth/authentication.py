@@ -0,0 +1,113 @@
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.users.models import BusinessUser, User
+
+try:
+    from rest_framework_simplejwt.utils import get_md5_hash_password
+except ImportError:  # CHECK_REVOKE_TOKEN 이 없는 simplejwt 버전
+    get_md5_hash_password = None  # type: ignore[assignment]
+
+AUTH_USER_CACHE_KEY = "auth_user:{user_id}"
+# 비밀번호 해시는 캐시에 두지 않는다 (필요하면 deferred field 로 DB 에서 읽힌다)
+EXCLUDED_FIELDS = {"password"}
+
+
+class UserPrincipalCache:
+    """
+    인증 사용자 정보(User 필드 + 비즈니스 프로필 id) 캐시
+    catalog 2단 캐시에 짧은 TTL 로 두고, User/BusinessUser/탈퇴 변경 시 모든 워커에서 무효화한다
+    """
+
+    timeout = getattr(settings, "AUTH_USER_CACHE_TIMEOUT", 60 * 5)
+
+    @staticmethod
+    def make_key(user_id) -> str:
+        return AUTH_USER_CACHE_KEY.format(user_id=user_id)
+
+    @staticmethod
+    def field_names() -> list[str]:
+        return [field.attname for field in User._meta.concrete_fields if field.attname not in EXCLUDED_FIELDS]
+
+    @staticmethod
+    def load(user_id) -> Optional[dict]:
+        user = User.objects.filter(**{api_settings.USER_ID_FIELD: user_id}).select_related("business_profile").first()
+        if user is None:
+            return None
+        business_profile = getattr(user, "business_profile", None)
+        principal = {
+            "fields": {name: getattr(user, name) for name in UserPrincipalCache.field_names()},
+            "business_profile_id": business_profile.pk if business_profile else None,
+        }
+        if getattr(api_settings, "CHECK_REVOKE_TOKEN", False):
+            # 비밀번호 변경 확인용 - 해시 자체가 아니라 토큰에 넣는 것과 같은 md5 만 보관
+            principal["password_md5"] = get_md5_hash_password(user.password)
+        return principal
+
+    @staticmethod
+    def build_user(principal: dict) -> User:
+        """캐시한 값으로 DB 조회 없이 User 를 만든다 (비밀번호/비즈니스 프로필의 나머지 필드는 접근 시 지연 로딩)"""
+        fields = principal["fields"]
+        user = User.from_db(DEFAULT_DB_ALIAS, list(fields), list(fields.values()))
+        profile = None
+        if principal["business_profile_id"] is not None:
+            profile = BusinessUser.from_db(
+                DEFAULT_DB_ALIAS, ["id", "user_id"], [principal["business_profile_id"], user.pk]
+            )
+        # request.user.business_profile 이 추가 쿼리 없이 반환되도록 (없으면 None 으로 캐시 -> DoesNotExist)
+        User.business_profile.related.set_cached_value(user, profile)
+        return user
+
+    @staticmethod
+    def get(user_id) -> Optional[dict]:
+        catalog = caches["catalog"]
+        key = UserPrincipalCache.make_key(user_id)
+        principal = catalog.get(key)
+        if principal is None:
+            principal = UserPrincipalCache.load(user_id)
+            if principal is not None:
+                catalog.set(key, principal, UserPrincipalCache.timeout)
+        return principal
+
+    @staticmethod
+    def invalidate(user_id) -> None:
+        caches["catalog"].delete(UserPrincipalCache.make_key(user_id))
+
+    @staticmethod
+    def schedule_invalidate(user_id) -> None:
+        # 커밋 전에 지우면 다른 요청이 커밋 전 데이터로 캐시를 다시 채울 수 있다
+        transaction.on_commit(lambda: UserPrincipalCache.invalidate(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication 과 같지만 사용자를 UserPrincipalCache 에서 읽는다
+    캐시가 유지되는 동안 인증(및 IsHost 의 business_profile 확인)에 DB 쿼리가 없다
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+        principal = UserPrincipalCache.get(user_id)
+        if principal is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        user = UserPrincipalCache.build_user(principal)
+        if getattr(api_settings, "CHECK_USER_IS_ACTIVE", True) and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if getattr(api_settings, "CHECK_REVOKE_TOKEN", False):
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != principal.get("password_md5"):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+        return user
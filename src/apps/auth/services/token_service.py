@@ -6,9 +6,6 @@ from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
 from apps.common.util.redis_client import get_redis_client
 from apps.users.models import User
 
-# Redis 설정
-redis_client = get_redis_client()
-
 
 class TokenService:
 
@@ -24,11 +21,11 @@ class TokenService:
 
     @staticmethod
     def _store_refresh_token_in_redis(user_id: int, refresh_token: str, expiration) -> None:
-        redis_client.set(f"refresh_{user_id}", refresh_token, ex=expiration)
+        get_redis_client().set(f"refresh_{user_id}", refresh_token, ex=expiration)
 
     @staticmethod
     def _get_stored_refresh_token(user_id: int) -> str:
-        stored_refresh_token = redis_client.get(f"refresh_{user_id}")
+        stored_refresh_token = get_redis_client().get(f"refresh_{user_id}")
         if stored_refresh_token is None:
             raise AuthenticationFailed("Refresh token is invalid or has expired.")
 
@@ -52,7 +49,7 @@ class TokenService:
 
     @staticmethod
     def delete_refresh_token(user_id: int) -> None:
-        redis_client.delete(f"refresh_{user_id}")
+        get_redis_client().delete(f"refresh_{user_id}")
         print("삭제 완료")
 
     @staticmethod
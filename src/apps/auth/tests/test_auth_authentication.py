@@ -0,0 +1,60 @@
+from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.accommodations.models import Accommodation
+from apps.users.models import BusinessUser, User
+
+
+class CachedJWTAuthenticationTest(APITestCase):
+    def setUp(self):
+        caches["catalog"].clear()
+        self.user = User.objects.create_superuser(email="principal@test.com", password="test123")
+        self.host = BusinessUser.objects.create(user=self.user)
+        Accommodation.objects.create(host=self.host, name="my hotel")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(self.user).access_token}")
+        self.url = reverse("host_management:host-management-my-accommodations-list")
+
+    def test_steady_state_host_request_has_no_auth_queries(self):
+        # given - 첫 요청에서 사용자 캐시를 채운다
+        self.client.get(self.url)
+
+        # when - 숙소 목록 페이지와 대표 이미지 prefetch 만 실행된다
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(self.url)
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(len(captured), 2)
+        tables = (User._meta.db_table, BusinessUser._meta.db_table)
+        self.assertFalse([query for query in captured if any(f'FROM "{table}"' in query["sql"] for table in tables)])
+
+    def test_deactivation_invalidates_cached_user(self):
+        # given
+        self.client.get(self.url)
+
+        # when
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+        response = self.client.get(self.url)
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_business_profile_removal_invalidates_cached_user(self):
+        # given
+        self.client.get(self.url)
+
+        # when
+        with self.captureOnCommitCallbacks(execute=True):
+            self.host.delete()
+        response = self.client.get(self.url)
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
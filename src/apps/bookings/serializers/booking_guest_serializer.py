@@ -4,6 +4,7 @@ from datetime import date
 from rest_framework import serializers
 
 from apps.bookings.services.booking_guest_service import BookingService
+from apps.bookings.services.room_calendar_service import RoomCalendarService
 from apps.rooms.models import Room
 
 
@@ -30,7 +31,7 @@ class BookingRequestCreateSerializer(serializers.Serializer):
         check_out_date = data.pop("check_out_date")
 
         try:
-            room = Room.objects.get_by_room_id(room_id=room_id)
+            room = Room.objects.select_related("roominventory").get_by_room_id(room_id=room_id)
         except Room.DoesNotExist:
             raise serializers.ValidationError("Room does not exist.")
 
@@ -53,9 +54,8 @@ class BookingRequestCreateSerializer(serializers.Serializer):
         if check_in_date < date.today():
             raise serializers.ValidationError("Check-in date cannot be in the past.")
 
-        overlapping_bookings = BookingService.check_overlapping_bookings(room, check_in_date, check_out_date)
-
-        if room.roominventory.count_room < overlapping_bookings + 1:
+        # 숙박 기간의 날짜별 재고만 조회
+        if not RoomCalendarService.is_available(room, check_in_date, check_out_date):
             raise serializers.ValidationError("No rooms available for the selected dates.")
 
         max_booking_days = 30
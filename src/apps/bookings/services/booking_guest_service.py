@@ -1,12 +1,27 @@
 from datetime import date, datetime
 
+from django.db import transaction
+
 from apps.bookings.models import Booking
+from apps.bookings.services.room_calendar_service import RoomCalendarService
+from apps.common.constants.booking_constants import RELEASED_BOOKING_STATUSES
+from apps.rooms.models import Room
 from apps.users.models import User
 
 
 class BookingService:
     @staticmethod
+    @transaction.atomic
     def create_booking(data: dict, user: User):
+        """
+        날짜별 재고를 잠그고 점유한 뒤 예약을 만든다
+        마지막 객실을 동시에 요청하면 하나만 성공하고 나머지는 RoomSoldOutError 가 발생한다
+        """
+        room = Room.objects.select_related("roominventory").get(pk=data["room_id"])
+        check_in_date = RoomCalendarService.to_date(data["check_in_datetime"])
+        check_out_date = RoomCalendarService.to_date(data["check_out_datetime"])
+        RoomCalendarService.reserve(room, check_in_date, check_out_date)
+
         booking = Booking.objects.create(
             guest=user,
             check_in_datetime=data["check_in_datetime"],
@@ -43,6 +58,18 @@ class BookingService:
         if booking is None:
             raise Booking.DoesNotExist("Booking not found.")
 
-        booking.status = "cancelled_by_guest"
+        return BookingService.update_status(booking, "cancelled_by_guest")
+
+    @staticmethod
+    @transaction.atomic
+    def update_status(booking: Booking, status: str) -> Booking:
+        """예약 상태 변경 - 재고를 점유하던 예약이 취소/거절되면 날짜별 재고를 돌려준다"""
+        # 동시에 두 번 취소되어 재고가 두 번 반환되지 않도록 현재 상태를 잠그고 확인
+        current_status = Booking.objects.select_for_update().values_list("status", flat=True).get(pk=booking.pk)
+
+        booking.status = status
         booking.save()
+
+        if current_status not in RELEASED_BOOKING_STATUSES and status in RELEASED_BOOKING_STATUSES:
+            RoomCalendarService.release(booking.room_id, *RoomCalendarService.booking_dates(booking))
         return booking
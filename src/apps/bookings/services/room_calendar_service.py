@@ -0,0 +1,141 @@
+from datetime import date, datetime, timedelta
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from apps.bookings.models import Booking
+from apps.common.constants.booking_constants import RELEASED_BOOKING_STATUSES
+from apps.rooms.models import Room, RoomInventory, RoomNightInventory
+
+
+class RoomSoldOutError(Exception):
+    pass
+
+
+class RoomCalendarService:
+    """객실 날짜별 재고(RoomNightInventory) 관리"""
+
+    @staticmethod
+    def to_date(value: datetime) -> date:
+        if timezone.is_aware(value):
+            return timezone.localtime(value).date()
+        return value.date()
+
+    @staticmethod
+    def stay_nights(check_in_date: date, check_out_date: date) -> list[date]:
+        return [check_in_date + timedelta(days=i) for i in range((check_out_date - check_in_date).days)]
+
+    @staticmethod
+    def booking_dates(booking: Booking) -> tuple[date, date]:
+        return (
+            RoomCalendarService.to_date(booking.check_in_datetime),
+            RoomCalendarService.to_date(booking.check_out_datetime),
+        )
+
+    @staticmethod
+    def room_capacity(room: Room) -> int:
+        inventory = getattr(room, "roominventory", None)
+        return inventory.count_room if inventory else 0
+
+    @staticmethod
+    def ensure_nights(room: Room, check_in_date: date, check_out_date: date) -> None:
+        """숙박 기간의 재고 행이 없으면 현재 객실 수로 만든다"""
+        capacity = RoomCalendarService.room_capacity(room)
+        RoomNightInventory.objects.bulk_create(
+            [
+                RoomNightInventory(room=room, date=night, nights_available=capacity)
+                for night in RoomCalendarService.stay_nights(check_in_date, check_out_date)
+            ],
+            ignore_conflicts=True,
+        )
+
+    @staticmethod
+    def is_available(room: Room, check_in_date: date, check_out_date: date, quantity: int = 1) -> bool:
+        """숙박 기간의 재고 행만 범위 조회 (행이 없는 날은 판매 0)"""
+        if RoomCalendarService.room_capacity(room) < quantity:
+            return False
+        return not RoomNightInventory.objects.filter(
+            room=room,
+            date__gte=check_in_date,
+            date__lt=check_out_date,
+            nights_sold__gt=F("nights_available") - quantity,
+        ).exists()
+
+    @staticmethod
+    @transaction.atomic
+    def reserve(room: Room, check_in_date: date, check_out_date: date, quantity: int = 1) -> None:
+        """
+        숙박 기간의 재고를 점유한다 (호출하는 쪽 트랜잭션 안에서 실행)
+        해당 객실의 숙박 날짜 행만 날짜 순서대로 잠그므로 다른 객실/겹치지 않는 날짜의 예약과는 서로 기다리지 않는다
+        """
+        nights = RoomCalendarService.stay_nights(check_in_date, check_out_date)
+        RoomCalendarService.ensure_nights(room, check_in_date, check_out_date)
+
+        locked_nights = list(
+            RoomNightInventory.objects.select_for_update()
+            .filter(room_id=room.pk, date__gte=check_in_date, date__lt=check_out_date)
+            .order_by("date")
+        )
+        if len(locked_nights) != len(nights) or any(
+            night.nights_sold + quantity > night.nights_available for night in locked_nights
+        ):
+            raise RoomSoldOutError("No rooms available for the selected dates.")
+
+        RoomNightInventory.objects.filter(pk__in=[night.pk for night in locked_nights]).update(
+            nights_sold=F("nights_sold") + quantity
+        )
+
+    @staticmethod
+    @transaction.atomic
+    def release(room_id: int, check_in_date: date, check_out_date: date, quantity: int = 1) -> None:
+        RoomNightInventory.objects.filter(
+            room_id=room_id, date__gte=check_in_date, date__lt=check_out_date, nights_sold__gte=quantity
+        ).update(nights_sold=F("nights_sold") - quantity)
+
+    @staticmethod
+    def sync_capacity(inventory: RoomInventory) -> int:
+        """객실 수 변경 시 오늘 이후 재고 행의 nights_available 을 맞춘다"""
+        # 이미 판매된 수량 아래로는 줄이지 않는다 (nights_sold <= nights_available 제약)
+        return RoomNightInventory.objects.filter(room_id=inventory.room_id, date__gte=timezone.localdate()).update(
+            nights_available=Greatest(Value(inventory.count_room), F("nights_sold"))
+        )
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild(room_ids: Optional[Iterable[int]] = None) -> int:
+        """
+        Booking 으로부터 날짜별 재고를 다시 만든다 (generate_series 로 예약을 1박 단위로 펼쳐 한 번에 집계)
+        과거에 초과 판매된 날은 nights_available 을 판매 수량으로 맞춰 더 이상 판매되지 않게 한다
+        생성한 재고 행 수를 반환
+        """
+        inventory_table = RoomNightInventory._meta.db_table
+        room_filter = ""
+        params: list = []
+        if room_ids is not None:
+            room_ids = list(room_ids)
+            room_filter = "AND b.room_id = ANY(%s)"
+            params.append(room_ids)
+            RoomNightInventory.objects.filter(room_id__in=room_ids).delete()
+        else:
+            RoomNightInventory.objects.all().delete()
+
+        sql = f"""
+            INSERT INTO {inventory_table} (room_id, date, nights_available, nights_sold)
+            SELECT b.room_id, night::date, GREATEST(COALESCE(ri.count_room, 0), COUNT(*)), COUNT(*)
+            FROM {Booking._meta.db_table} b
+            CROSS JOIN LATERAL generate_series(
+                (b.check_in_datetime AT TIME ZONE %s)::date,
+                (b.check_out_datetime AT TIME ZONE %s)::date - 1,
+                interval '1 day'
+            ) AS night
+            LEFT JOIN {RoomInventory._meta.db_table} ri ON ri.room_id = b.room_id
+            WHERE b.status <> ALL(%s) {room_filter}
+            GROUP BY b.room_id, night::date, ri.count_room
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [settings.TIME_ZONE, settings.TIME_ZONE, list(RELEASED_BOOKING_STATUSES), *params])
+            return cursor.rowcount
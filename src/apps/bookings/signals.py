@@ -0,0 +1,11 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.bookings.services.room_calendar_service import RoomCalendarService
+from apps.rooms.models import RoomInventory
+
+
+# 객실 수 변경 시 날짜별 재고의 판매 가능 수량을 맞춘다
+@receiver(post_save, sender=RoomInventory)
+def sync_room_calendar_capacity(sender, instance, **kwargs):
+    RoomCalendarService.sync_capacity(instance)
@@ -0,0 +1,132 @@
+from datetime import date, datetime, time, timedelta
+
+from django.test import TestCase
+
+from apps.accommodations.models import Accommodation
+from apps.bookings.models import Booking
+from apps.bookings.services.booking_guest_service import BookingService
+from apps.bookings.services.room_calendar_service import (
+    RoomCalendarService,
+    RoomSoldOutError,
+)
+from apps.rooms.models import Room, RoomInventory, RoomNightInventory
+from apps.users.models import BusinessUser, User
+
+
+class RoomCalendarServiceTest(TestCase):
+    def setUp(self):
+        self.host_user = User.objects.create_superuser(email="host@test.com", password="test123")
+        self.guest = User.objects.create_superuser(email="guest@test.com", password="test123")
+        host = BusinessUser.objects.create(user=self.host_user)
+        accommodation = Accommodation.objects.create(host=host, name="calendar hotel")
+        self.room = Room.objects.create(
+            accommodation=accommodation,
+            name="twin",
+            capacity=1,
+            max_capacity=2,
+            price=100000,
+            stay_type=True,
+            check_in_time=time(15, 0),
+            check_out_time=time(11, 0),
+        )
+        RoomInventory.objects.create(room=self.room, count_room=1)
+        self.check_in = date.today() + timedelta(days=10)
+        self.check_out = self.check_in + timedelta(days=3)
+
+    def book(self, check_in=None, check_out=None):
+        check_in = check_in or self.check_in
+        check_out = check_out or self.check_out
+        return BookingService.create_booking(
+            {
+                "check_in_datetime": datetime.combine(check_in, self.room.check_in_time),
+                "check_out_datetime": datetime.combine(check_out, self.room.check_out_time),
+                "guests_count": 1,
+                "booker_name": "guest",
+                "booker_phone_number": "010-1234-5678",
+                "room_id": self.room.pk,
+                "total_price": 300000,
+            },
+            self.guest,
+        )
+
+    def test_booking_reserves_each_night(self):
+        # when
+        self.book()
+
+        # then
+        nights = RoomNightInventory.objects.filter(room=self.room).order_by("date")
+        self.assertEqual(
+            [night.date for night in nights], RoomCalendarService.stay_nights(self.check_in, self.check_out)
+        )
+        self.assertTrue(all(night.nights_sold == 1 for night in nights))
+        self.assertFalse(RoomCalendarService.is_available(self.room, self.check_in, self.check_out))
+        # 체크아웃 날부터는 다시 예약 가능
+        self.assertTrue(RoomCalendarService.is_available(self.room, self.check_out, self.check_out + timedelta(days=1)))
+
+    def test_cancel_releases_nights_once(self):
+        # given
+        booking = self.book()
+
+        # when
+        BookingService.cancel_booking(booking.pk)
+        BookingService.cancel_booking(booking.pk)
+
+        # then
+        self.assertEqual(set(RoomNightInventory.objects.values_list("nights_sold", flat=True)), {0})
+        self.assertTrue(RoomCalendarService.is_available(self.room, self.check_in, self.check_out))
+
+    def test_host_reject_releases_nights(self):
+        # given
+        booking = self.book()
+
+        # when
+        BookingService.update_status(booking, "cancelled_by_host")
+
+        # then
+        self.assertTrue(RoomCalendarService.is_available(self.room, self.check_in, self.check_out))
+
+    def test_rebuild_matches_bookings(self):
+        # given
+        self.book()
+        cancelled = self.book(self.check_out, self.check_out + timedelta(days=2))
+        BookingService.cancel_booking(cancelled.pk)
+        RoomNightInventory.objects.all().delete()
+
+        # when
+        RoomCalendarService.rebuild()
+
+        # then
+        nights = RoomNightInventory.objects.filter(room=self.room)
+        self.assertEqual(nights.count(), 3)
+        self.assertTrue(all(night.nights_sold == 1 and night.nights_available == 1 for night in nights))
+
+    def test_available_for_dates_excludes_sold_out_rooms(self):
+        # given
+        self.book()
+
+        # then
+        self.assertFalse(Room.objects.available_for_dates(self.check_in, self.check_out).exists())
+        self.assertTrue(Room.objects.available_for_dates(self.check_out, self.check_out + timedelta(days=1)).exists())
+
+    def test_inventory_change_updates_future_nights(self):
+        # given
+        self.book()
+
+        # when
+        inventory = self.room.roominventory
+        inventory.count_room = 2
+        inventory.save()
+
+        # then
+        self.assertTrue(RoomCalendarService.is_available(self.room, self.check_in, self.check_out))
+        self.assertEqual(Booking.objects.count(), 1)
+
+    def test_sold_out_reserve_rolls_back_booking(self):
+        # given
+        self.book()
+
+        # when / then
+        with self.assertRaises(RoomSoldOutError):
+            self.book(self.check_in + timedelta(days=1), self.check_out + timedelta(days=1))
+        self.assertEqual(Booking.objects.count(), 1)
+        self.assertFalse(RoomNightInventory.objects.filter(nights_sold__gt=1).exists())
@@ -0,0 +1,111 @@
+import os
+import time as clock
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, time, timedelta
+
+from django.db import connection
+from django.db.models import F
+from django.test import TransactionTestCase, tag
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.accommodations.models import Accommodation
+from apps.bookings.models import Booking
+from apps.common.constants.booking_constants import RELEASED_BOOKING_STATUSES
+from apps.rooms.models import Room, RoomInventory, RoomNightInventory
+from apps.users.models import BusinessUser, User
+
+
+# 일반 manage.py test 에서는 건너뛴다
+@unittest.skipUnless(os.getenv("STRESS"), "set STRESS=1 to run stress tests")
+@tag("stress")
+class BookingConcurrencyTest(TransactionTestCase):
+    """
+    같은 객실의 마지막 재고에 동시 예약 요청을 보내 초과 판매가 없는지 확인한다
+    (STRESS=1 python manage.py test --tag=stress)
+    """
+
+    count_room = 3
+    requests = 240
+    workers = 16
+
+    def setUp(self):
+        host = BusinessUser.objects.create(
+            user=User.objects.create_superuser(email="stress-host@test.com", password="test123")
+        )
+        self.accommodation = Accommodation.objects.create(host=host, name="stress hotel")
+        self.room = Room.objects.create(
+            accommodation=self.accommodation,
+            name="deluxe",
+            capacity=1,
+            max_capacity=2,
+            price=100000,
+            stay_type=True,
+            check_in_time=time(15, 0),
+            check_out_time=time(11, 0),
+        )
+        RoomInventory.objects.create(room=self.room, count_room=self.count_room)
+        self.guests = []
+        for i in range(self.workers):
+            guest = User.objects.create_superuser(email=f"stress-guest{i}@test.com", password="test123")
+            guest.phone_number = "010-1234-5678"
+            guest.save()
+            self.guests.append(guest)
+        self.url = reverse(
+            "bookings:booking_request", kwargs={"accommodation_id": self.accommodation.pk, "room_id": self.room.pk}
+        )
+        self.check_in = date.today() + timedelta(days=7)
+
+    def request_booking(self, i):
+        client = APIClient()
+        client.force_authenticate(user=self.guests[i % self.workers])
+        # 기간이 서로 겹치도록 1~3박을 섞는다
+        check_in = self.check_in + timedelta(days=i % 2)
+        check_out = check_in + timedelta(days=1 + i % 3)
+        try:
+            response = client.post(
+                self.url,
+                {"check_in_date": check_in, "check_out_date": check_out, "guests_count": 1},
+                format="json",
+            )
+            return response.status_code
+        finally:
+            connection.close()
+
+    def count_bookings_per_night(self) -> dict[date, int]:
+        nights = {self.check_in + timedelta(days=offset): 0 for offset in range(5)}
+        for check_in, check_out in Booking.objects.exclude(status__in=RELEASED_BOOKING_STATUSES).values_list(
+            "check_in_datetime", "check_out_datetime"
+        ):
+            for night in nights:
+                if timezone.localdate(check_in) <= night < timezone.localdate(check_out):
+                    nights[night] += 1
+        return nights
+
+    def test_no_overbooking_under_concurrent_requests(self):
+        # when
+        started = clock.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            status_codes = list(executor.map(self.request_booking, range(self.requests)))
+        elapsed = clock.perf_counter() - started
+
+        # then
+        created = status_codes.count(status.HTTP_201_CREATED)
+        self.assertTrue(created > 0)
+        self.assertEqual(Booking.objects.count(), created)
+        self.assertTrue(
+            set(status_codes) <= {status.HTTP_201_CREATED, status.HTTP_400_BAD_REQUEST, status.HTTP_409_CONFLICT}
+        )
+        self.assertFalse(RoomNightInventory.objects.filter(nights_sold__gt=F("nights_available")).exists())
+        self.assertTrue(all(night.nights_sold <= self.count_room for night in RoomNightInventory.objects.all()))
+        # 재고 테이블과 별개로 예약 행에서 직접 박마다 겹치는 예약 수를 센다
+        for night, booked in self.count_bookings_per_night().items():
+            with self.subTest(night=night):
+                self.assertLessEqual(booked, self.count_room)
+        print(
+            f"\n[stress] {self.requests} requests / {self.workers} workers: "
+            f"{created} booked, {self.requests / elapsed:.1f} req/s"
+        )
@@ -10,6 +10,7 @@ from apps.bookings.serializers.booking_guest_serializer import (
     BookingRequestCreateSerializer,
 )
 from apps.bookings.services.booking_guest_service import BookingService
+from apps.bookings.services.room_calendar_service import RoomSoldOutError
 
 
 # 예약 요청
@@ -29,7 +30,11 @@ class BookingRequestCreateView(GenericAPIView):
         serializer = self.get_serializer(data=user_data)
         serializer.is_valid(raise_exception=True)
         print(serializer.validated_data)
-        self.booking_service.create_booking(serializer.validated_data, request.user)
+        try:
+            self.booking_service.create_booking(serializer.validated_data, request.user)
+        except RoomSoldOutError as e:
+            # 검증 이후 다른 예약이 마지막 객실을 먼저 가져간 경우
+            return Response({"error": str(e)}, status=status.HTTP_409_CONFLICT)
 
         return Response({"message": "예약 완료"}, status=status.HTTP_201_CREATED)
 
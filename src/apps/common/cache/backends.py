@@ -0,0 +1,276 @@
+import json
+import logging
+import os
+import pickle
+import socket
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Optional, cast
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+logger = logging.getLogger(__name__)
+
+TAG_VERSION_KEY = "tag:{tag}"
+
+# 태그 -> 버전 (공유 계층에서 밀려난 태그는 None)
+TagVersions = dict[str, Optional[int]]
+# (로컬 계층 세대, 태그 버전) - TwoTierCache.snapshot_tags 참고
+TagSnapshot = tuple[int, TagVersions]
+
+
+class LocalTier:
+    """
+    프로세스(워커) 메모리 LRU
+    Django 의 caches[alias] 는 스레드마다 backend 인스턴스를 만들기 때문에 로컬 계층과 구독 스레드는 프로세스 단위로 공유한다
+    """
+
+    def __init__(self, max_entries: int, timeout: float):
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.entries: OrderedDict[str, tuple[bytes, float, frozenset]] = OrderedDict()
+        self.lock = threading.Lock()
+        # 무효화를 반영할 때마다 증가 - 공유 계층에서 읽는 동안 무효화된 값을 로컬에 채우지 않기 위해 사용
+        self.generation = 0
+        self.pid: Optional[int] = None
+        self.origin: Optional[str] = None
+
+    def get(self, key: str):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, value: Any, tags: Iterable[str], generation: Optional[int] = None) -> None:
+        # LocMemCache 처럼 pickle 해서 보관한다 (호출한 쪽이 값을 수정해도 다른 요청에 영향이 없도록)
+        entry = (pickle.dumps(value, pickle.HIGHEST_PROTOCOL), time.monotonic() + self.timeout, frozenset(tags))
+        with self.lock:
+            if generation is not None and generation != self.generation:
+                return
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, message: dict) -> None:
+        with self.lock:
+            self.generation += 1
+            if message.get("clear"):
+                self.entries.clear()
+                return
+            for key in message.get("keys", ()):
+                self.entries.pop(key, None)
+            tags = set(message.get("tags", ()))
+            if tags:
+                for key in [key for key, entry in self.entries.items() if entry[2] & tags]:
+                    del self.entries[key]
+
+    def start(self, channel: str, get_client: Callable) -> None:
+        """
+        pub/sub 구독 스레드 시작 (프로세스마다 한 번)
+        fork 된 워커에는 부모의 스레드가 없으므로 pid 가 바뀌면 로컬 계층을 비우고 다시 띄운다
+        """
+        if self.pid == os.getpid():
+            return
+        with self.lock:
+            if self.pid == os.getpid():
+                return
+            self.pid = os.getpid()
+            self.origin = f"{socket.gethostname()}:{self.pid}"
+            self.entries.clear()
+        if get_client() is not None:
+            threading.Thread(target=self.listen, args=(channel, get_client), daemon=True).start()
+
+    def listen(self, channel: str, get_client: Callable) -> None:
+        while True:
+            try:
+                pubsub = get_client().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(channel)
+                # 구독이 끊겨 있던 동안 놓친 무효화가 있을 수 있으므로 로컬 계층을 비우고 시작한다
+                self.invalidate({"clear": True})
+                for message in pubsub.listen():
+                    data = json.loads(message["data"])
+                    # 자기 프로세스의 무효화는 발행 시점에 이미 반영했다
+                    if data.get("origin") != self.origin:
+                        self.invalidate(data)
+            except Exception:
+                logger.warning("two tier cache subscriber disconnected", exc_info=True)
+                time.sleep(1)
+
+
+_local_tiers: dict[str, LocalTier] = {}
+_local_tiers_lock = threading.Lock()
+
+
+def get_local_tier(name: str, max_entries: int, timeout: float) -> LocalTier:
+    with _local_tiers_lock:
+        if name not in _local_tiers:
+            _local_tiers[name] = LocalTier(max_entries, timeout)
+        return _local_tiers[name]
+
+
+class TwoTierCache(BaseCache):
+    """
+    워커 메모리 LRU(로컬 계층) + 공유 캐시(Redis) 2단 캐시 backend
+    LOCATION 은 공유 계층으로 사용할 캐시 alias 이다 (clear() 가 공유 계층 전체를 비우므로 전용 alias 를 둔다)
+
+    - get: 로컬 계층에 있으면 네트워크 없이 반환, 없으면 공유 계층에서 읽어 로컬에 채운다
+    - set/delete/invalidate_tags: 공유 계층을 갱신한 뒤 Redis pub/sub 으로 모든 워커의 로컬 항목을 지운다
+    - 태그: set(..., tags=[...]) 로 저장한 항목은 invalidate_tags(tag) 로 한 번에 무효화된다
+      (공유 계층은 태그 버전 비교, 로컬 계층은 pub/sub 메시지로 삭제)
+      DB 에서 읽은 값을 저장할 때는 읽기 전에 snapshot_tags(tags) 를 받아 set(..., snapshot=...) 으로 넘긴다
+    pub/sub 메시지를 놓쳐도 로컬 항목은 LOCAL_TIMEOUT 이 지나면 공유 계층에서 다시 읽는다
+    공유 계층이 django_redis 가 아니면(테스트의 locmem 등) 같은 프로세스 안에서만 무효화된다
+    """
+
+    def __init__(self, server, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self._shared_alias = server
+        self._channel = options.get("CHANNEL", f"two_tier_cache:{server}")
+        self._local = get_local_tier(
+            f"{server}:{self.key_prefix}", options.get("LOCAL_MAX_ENTRIES", 1000), options.get("LOCAL_TIMEOUT", 60)
+        )
+
+    @property
+    def shared(self) -> BaseCache:
+        return caches[self._shared_alias]
+
+    def _redis(self):
+        try:
+            from django_redis import get_redis_connection
+
+            return get_redis_connection(self._shared_alias)
+        except (ImportError, NotImplementedError):
+            return None
+
+    def _publish(self, **message) -> None:
+        self._local.start(self._channel, self._redis)
+        self._local.invalidate(message)
+        client = self._redis()
+        if client is None:
+            return
+        try:
+            client.publish(self._channel, json.dumps({**message, "origin": self._local.origin}))
+        except Exception:
+            # 다른 워커는 LOCAL_TIMEOUT 이 지나면 공유 계층의 값을 다시 읽는다
+            logger.warning("two tier cache invalidation publish failed", exc_info=True)
+
+    # 태그
+    def _tag_versions(self, tags: Iterable[str]) -> TagVersions:
+        tag_keys = {TAG_VERSION_KEY.format(tag=tag): tag for tag in tags}
+        if not tag_keys:
+            return {}
+        for tag_key in tag_keys:
+            # 캐시에서 밀려났다 다시 만들어져도 이전 값과 겹치지 않도록 시간값 사용
+            self.shared.add(tag_key, time.time_ns(), None)
+        versions = self.shared.get_many(list(tag_keys))
+        return {tag: versions.get(tag_key) for tag_key, tag in tag_keys.items()}
+
+    def snapshot_tags(self, tags: Iterable[str]) -> TagSnapshot:
+        """
+        DB 에서 값을 읽기 전에 태그 버전과 로컬 계층 세대를 기록한다
+        set(..., snapshot=...) 은 그 사이에 무효화가 있었으면 저장하지 않으므로 읽는 동안 바뀐 값이 새 버전으로 저장되지 않는다
+        """
+        self._local.start(self._channel, self._redis)
+        return self._local.generation, self._tag_versions(tags)
+
+    def _is_valid(self, tag_versions: TagVersions) -> bool:
+        if not tag_versions:
+            return True
+        return self._tag_versions(tag_versions) == tag_versions
+
+    def invalidate_tags(self, *tags: str) -> None:
+        for tag in tags:
+            try:
+                self.shared.incr(TAG_VERSION_KEY.format(tag=tag))
+            except ValueError:
+                # 태그 버전이 없으면 그 태그로 저장된 항목도 이미 유효하지 않다
+                pass
+        self._publish(tags=list(tags))
+
+    # cache API
+    def get(self, key, default=None, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        self._local.start(self._channel, self._redis)
+        entry = self._local.get(key)
+        if entry is not None:
+            return pickle.loads(entry[0])
+
+        generation = self._local.generation
+        stored = self.shared.get(key)
+        if stored is None:
+            return default
+        value, tag_versions = stored
+        if not self._is_valid(tag_versions):
+            return default
+        self._local.set(key, value, tag_versions, generation)
+        return value
+
+    def set(
+        self,
+        key,
+        value,
+        timeout=DEFAULT_TIMEOUT,
+        version=None,
+        tags: Iterable[str] = (),
+        snapshot: Optional[TagSnapshot] = None,
+    ):
+        key = self.make_and_validate_key(key, version=version)
+        self._local.start(self._channel, self._redis)
+        generation: Optional[int]
+        if snapshot is None:
+            generation, tag_versions = None, self._tag_versions(tags)
+        else:
+            generation, tag_versions = snapshot
+            # 값을 읽는 동안 태그가 무효화됐다 - 이전 값이므로 저장하지 않는다
+            if not self._is_valid(tag_versions):
+                return
+        self.shared.set(key, (value, tag_versions), self.get_backend_timeout(timeout))
+        self._publish(keys=[key])
+        # 스냅샷 이후 자기 발행 외의 무효화가 로컬 계층에 도착했으면 로컬에는 채우지 않는다 (다음 get 이 공유 계층에서 검증한다)
+        self._local.set(key, value, tag_versions, None if generation is None else generation + 1)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None, tags: Iterable[str] = ()):
+        key = self.make_and_validate_key(key, version=version)
+        tag_versions = self._tag_versions(tags)
+        added = self.shared.add(key, (value, tag_versions), self.get_backend_timeout(timeout))
+        if added:
+            self._publish(keys=[key])
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        return self.shared.touch(key, self.get_backend_timeout(timeout))
+
+    def delete(self, key, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        deleted = self.shared.delete(key)
+        self._publish(keys=[key])
+        return deleted
+
+    def has_key(self, key, version=None):
+        sentinel = object()
+        return self.get(key, sentinel, version=version) is not sentinel
+
+    def clear(self):
+        self.shared.clear()
+        self._publish(clear=True)
+
+    def get_backend_timeout(self, timeout=DEFAULT_TIMEOUT):
+        # 공유 계층 backend 에 그대로 넘기므로 Django 형식의 timeout(초)을 유지한다
+        if timeout == DEFAULT_TIMEOUT:
+            return self.default_timeout
+        return timeout
+
+
+def get_catalog_cache() -> TwoTierCache:
+    """settings.CACHES["catalog"] - 태그 스냅샷/무효화 API 는 TwoTierCache 에만 있다"""
+    return cast(TwoTierCache, caches["catalog"])
@@ -0,0 +1,65 @@
+import hashlib
+from datetime import datetime
+from typing import Optional
+from urllib.parse import urlencode
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+
+class NotModified(Exception):
+    def __init__(self, response):
+        self.response = response
+
+
+class ConditionalGetMixin:
+    """
+    ETag / Last-Modified 조건부 GET mixin
+    인증/권한 확인 직후 get_last_modified() 로 검증값을 만들고, 클라이언트가 가진 값과 같으면
+    get_object() 나 직렬화 없이 304 를 반환한다.
+    """
+
+    def get_last_modified(self) -> Optional[datetime]:
+        raise NotImplementedError("get_last_modified() must be implemented.")
+
+    def get_etag_extra(self) -> str:
+        """수정 시각만으로 구분되지 않는 변경(예: 목록에서의 삭제)을 ETag 에 반영할 때 사용"""
+        return ""
+
+    def get_etag(self, last_modified: datetime) -> str:
+        request = self.request  # type: ignore[attr-defined]
+        query = urlencode(sorted(request.query_params.items()))
+        raw = f"{request.path}?{query}:{last_modified.timestamp()}:{self.get_etag_extra()}"
+        return 'W/"%s"' % hashlib.md5(raw.encode()).hexdigest()
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.conditional_validators = None
+        if request.method not in ("GET", "HEAD"):
+            return
+
+        last_modified = self.get_last_modified()
+        if last_modified is None:
+            return
+
+        etag = self.get_etag(last_modified)
+        self.conditional_validators = (etag, last_modified)
+        response = get_conditional_response(request, etag=etag, last_modified=int(last_modified.timestamp()))
+        if response is not None:
+            raise NotModified(response)
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        validators = getattr(self, "conditional_validators", None)
+        if validators and response.status_code in (200, 304):
+            etag, last_modified = validators
+            response["ETag"] = etag
+            response["Last-Modified"] = http_date(last_modified.timestamp())
+            # 저장은 하되 매번 검증하도록
+            patch_cache_control(response, no_cache=True)
+        return response
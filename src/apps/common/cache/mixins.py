@@ -0,0 +1,36 @@
+from urllib.parse import urlencode
+
+from rest_framework.response import Response
+
+from apps.common.cache.response_cache import ResponseCache
+
+
+class ResponseCacheMixin:
+    """
+    RetrieveAPIView 응답 캐시 mixin
+    get_response_cache_tags() 에서 무효화에 사용할 태그를 반환해야 한다
+    태그 버전을 get_object() 전에 기록해야 하므로 태그는 인스턴스가 아닌 URL 인자(self.kwargs)로 만든다
+    """
+
+    response_cache_name: str = ""
+
+    def get_response_cache_key(self) -> str:
+        request = self.request  # type: ignore[attr-defined]
+        query = urlencode(sorted(request.query_params.items()))
+        return ResponseCache.make_key(self.response_cache_name, request.path, query)
+
+    def get_response_cache_tags(self) -> list[str]:
+        raise NotImplementedError("get_response_cache_tags() must be implemented.")
+
+    def retrieve(self, request, *args, **kwargs):
+        key = self.get_response_cache_key()
+        data = ResponseCache.get(key)
+        if data is not None:
+            return Response(data, headers={"X-Cache": "HIT"})
+
+        # 읽기 전에 태그 버전을 기록 - 읽은 뒤 커밋된 변경의 무효화가 set 전에 도착해도 이전 값이 저장되지 않는다
+        snapshot = ResponseCache.snapshot_tags(self.get_response_cache_tags())
+        instance = self.get_object()
+        data = self.get_serializer(instance).data
+        ResponseCache.set(key, data, snapshot)
+        return Response(data, headers={"X-Cache": "MISS"})
@@ -0,0 +1,108 @@
+import hashlib
+import threading
+import time
+from collections import Counter
+from typing import Any, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.db import transaction
+
+from apps.common.cache.backends import TagSnapshot, get_catalog_cache
+
+RESPONSE_CACHE_KEY = "response_cache:{name}:{digest}"
+STATS_KEY = "response_cache:stats:{name}"
+# 로컬 계층 hit 에 네트워크 왕복이 생기지 않도록 통계는 프로세스에서 모아 주기적으로 공유 캐시에 더한다
+STATS_FLUSH_INTERVAL = 5
+
+_pending_stats: Counter = Counter()
+_pending_stats_lock = threading.Lock()
+_stats_flushed_at = time.monotonic()
+
+
+def accommodation_tag(accommodation_id: int) -> str:
+    return f"accommodation:{accommodation_id}"
+
+
+def room_tag(room_id: int) -> str:
+    return f"room:{room_id}"
+
+
+class ResponseCache:
+    """
+    직렬화된 응답 캐시 (catalog 2단 캐시 - 워커 메모리 LRU + Redis)
+    각 항목은 DB 에서 읽기 전의 태그 버전(snapshot_tags)을 함께 기록하고, 조회 시 현재 태그 버전과 다르면 miss 로 처리한다.
+    태그 무효화는 태그 버전을 올리고 모든 워커의 로컬 항목을 지우는 것으로 끝나므로 태그에 묶인 키 목록을 관리할 필요가 없다.
+    """
+
+    timeout = getattr(settings, "RESPONSE_CACHE_TIMEOUT", 60 * 60)
+
+    @staticmethod
+    def make_key(name: str, *parts: Any) -> str:
+        digest = hashlib.md5(":".join(str(part) for part in parts).encode()).hexdigest()
+        return RESPONSE_CACHE_KEY.format(name=name, digest=digest)
+
+    @staticmethod
+    def _record(name: str) -> None:
+        with _pending_stats_lock:
+            _pending_stats[name] += 1
+            should_flush = time.monotonic() - _stats_flushed_at > STATS_FLUSH_INTERVAL
+        if should_flush:
+            ResponseCache.flush_stats()
+
+    @staticmethod
+    def flush_stats() -> None:
+        global _stats_flushed_at
+        with _pending_stats_lock:
+            pending = dict(_pending_stats)
+            _pending_stats.clear()
+            _stats_flushed_at = time.monotonic()
+        for name, count in pending.items():
+            key = STATS_KEY.format(name=name)
+            try:
+                cache.incr(key, count)
+            except ValueError:
+                # 첫 기록 - 다른 프로세스가 먼저 만들었으면 incr 로 다시 시도
+                if not cache.add(key, count, None):
+                    cache.incr(key, count)
+
+    @staticmethod
+    def get(key: str) -> Optional[Any]:
+        data = caches["catalog"].get(key)
+        ResponseCache._record("hits" if data is not None else "misses")
+        return data
+
+    @staticmethod
+    def snapshot_tags(tags: Iterable[str]) -> TagSnapshot:
+        """DB 에서 읽기 전에 호출 - 읽는 동안 무효화된 태그가 있으면 set 이 저장하지 않는다"""
+        return get_catalog_cache().snapshot_tags(tags)
+
+    @staticmethod
+    def set(key: str, data: Any, snapshot: TagSnapshot) -> None:
+        get_catalog_cache().set(key, data, ResponseCache.timeout, snapshot=snapshot)
+
+    @staticmethod
+    def invalidate_tags(*tags: str) -> None:
+        get_catalog_cache().invalidate_tags(*tags)
+
+    @staticmethod
+    def schedule_invalidate(*tags: str) -> None:
+        """
+        트랜잭션 커밋 후 무효화
+        커밋 전에 지우면 다른 요청이 커밋 전 데이터로 캐시를 다시 채울 수 있다
+        """
+        transaction.on_commit(lambda: ResponseCache.invalidate_tags(*tags))
+
+    @staticmethod
+    def stats() -> dict:
+        ResponseCache.flush_stats()
+        hits = cache.get(STATS_KEY.format(name="hits"), 0)
+        misses = cache.get(STATS_KEY.format(name="misses"), 0)
+        total = hits + misses
+        return {"hits": hits, "misses": misses, "hit_ratio": round(hits / total, 4) if total else None}
+
+    @staticmethod
+    def reset_stats() -> None:
+        with _pending_stats_lock:
+            _pending_stats.clear()
+        cache.delete_many([STATS_KEY.format(name="hits"), STATS_KEY.format(name="misses")])
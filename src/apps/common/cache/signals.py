@@ -0,0 +1,83 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.accommodations.models import (
+    Accommodation,
+    Accommodation_Image,
+    GPS_Info,
+    RefundPolicy,
+)
+from apps.accommodations.signals import accommodation_changed
+from apps.amenities.models import AccommodationAmenity
+from apps.common.cache.response_cache import (
+    ResponseCache,
+    accommodation_tag,
+    room_tag,
+)
+from apps.pages.services.map_cluster_service import MapClusterService
+from apps.rooms.models import Room, Room_Image
+
+
+# 응답 캐시 태그 무효화
+@receiver(accommodation_changed)
+def invalidate_changed_accommodation(sender, accommodation_id, **kwargs):
+    ResponseCache.schedule_invalidate(accommodation_tag(accommodation_id))
+
+
+@receiver(post_save, sender=Accommodation)
+@receiver(post_delete, sender=Accommodation)
+def invalidate_accommodation(sender, instance, **kwargs):
+    ResponseCache.schedule_invalidate(accommodation_tag(instance.pk))
+
+
+@receiver(post_save, sender=Accommodation_Image)
+@receiver(post_delete, sender=Accommodation_Image)
+@receiver(post_save, sender=GPS_Info)
+@receiver(post_delete, sender=GPS_Info)
+@receiver(post_save, sender=RefundPolicy)
+@receiver(post_delete, sender=RefundPolicy)
+@receiver(post_save, sender=AccommodationAmenity)
+@receiver(post_delete, sender=AccommodationAmenity)
+def invalidate_accommodation_child(sender, instance, **kwargs):
+    ResponseCache.schedule_invalidate(accommodation_tag(instance.accommodation_id))
+
+
+@receiver(post_save, sender=Room)
+@receiver(post_delete, sender=Room)
+def invalidate_room(sender, instance, **kwargs):
+    # 숙소 상세 페이지에 객실 목록이 포함되므로 숙소 태그도 함께 무효화
+    ResponseCache.schedule_invalidate(room_tag(instance.pk), accommodation_tag(instance.accommodation_id))
+
+
+@receiver(post_save, sender=Room_Image)
+@receiver(post_delete, sender=Room_Image)
+def invalidate_room_image(sender, instance, **kwargs):
+    tags = [room_tag(instance.room_id)]
+    accommodation_id = Room.objects.filter(pk=instance.room_id).values_list("accommodation_id", flat=True).first()
+    if accommodation_id is not None:
+        tags.append(accommodation_tag(accommodation_id))
+    ResponseCache.schedule_invalidate(*tags)
+
+
+# 지도 타일 캐시 무효화 (이동 전/후 위치)
+@receiver(pre_save, sender=GPS_Info)
+def remember_previous_location(sender, instance, **kwargs):
+    instance._previous_location = (
+        GPS_Info.objects.filter(pk=instance.pk).values_list("location", flat=True).first() if instance.pk else None
+    )
+
+
+@receiver(post_save, sender=GPS_Info)
+@receiver(post_delete, sender=GPS_Info)
+def invalidate_map_tiles(sender, instance, **kwargs):
+    MapClusterService.schedule_invalidate(getattr(instance, "_previous_location", None), instance.location)
+
+
+@receiver(post_save, sender=Accommodation)
+def invalidate_accommodation_map_tiles(sender, instance, created, **kwargs):
+    # 비활성화/재활성화 - 새로 만든 숙소는 GPS_Info 저장 시 처리된다
+    if created:
+        return
+    location = GPS_Info.objects.filter(accommodation_id=instance.pk).values_list("location", flat=True).first()
+    if location is not None:
+        MapClusterService.schedule_invalidate(location)
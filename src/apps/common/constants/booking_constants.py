@@ -0,0 +1,2 @@
+# 객실 재고를 돌려주는(점유하지 않는) 예약 상태
+RELEASED_BOOKING_STATUSES = ("cancelled_by_guest", "cancelled_by_host", "refunded")
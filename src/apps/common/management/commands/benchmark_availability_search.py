@@ -0,0 +1,136 @@
+import random
+import statistics
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.accommodations.models import Accommodation
+from apps.bookings.models import Booking
+from apps.bookings.services.room_calendar_service import RoomCalendarService
+from apps.pages.services.availability_search_service import (
+    AvailabilitySearchService,
+)
+from apps.rooms.models import Room, RoomInventory
+from apps.users.models import BusinessUser, User
+
+
+class Command(BaseCommand):
+    help = "Benchmark the availability search query on a synthetic dataset (rolled back unless --keep)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rooms", type=int, default=100_000)
+        parser.add_argument("--bookings", type=int, default=1_000_000)
+        parser.add_argument("--rooms-per-accommodation", type=int, default=10)
+        parser.add_argument("--runs", type=int, default=20)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--keep", action="store_true", help="Keep the generated data")
+
+    def handle(self, *args, **options):
+        random.seed(options["seed"])
+        with transaction.atomic():
+            started = time.perf_counter()
+            self.seed(options["rooms"], options["bookings"], options["rooms_per_accommodation"])
+            self.stdout.write(f"seeded in {time.perf_counter() - started:.1f}s")
+
+            self.run(options["runs"])
+
+            if not options["keep"]:
+                transaction.set_rollback(True)
+
+    def seed(self, room_count: int, booking_count: int, rooms_per_accommodation: int) -> None:
+        user = User.objects.create_user(
+            email=f"benchmark-{time.time_ns()}@test.com",
+            first_name="benchmark",
+            last_name="host",
+            phone_number="010-0000-0000",
+            gender="other",
+            birth_date="1990-01-01",
+            password="benchmark",
+        )
+        host = BusinessUser.objects.create(user=user)
+        accommodation_count = max(room_count // rooms_per_accommodation, 1)
+
+        # 대량 데이터는 generate_series 로 DB 안에서 바로 만든다
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {Accommodation._meta.db_table}
+                    (host_id, name, phone_number, description, rules, is_active, created_at, updated_at)
+                SELECT %s, 'benchmark ' || g, '', '', '', true, now(), now()
+                FROM generate_series(1, %s) AS g
+                """,
+                [host.pk, accommodation_count],
+            )
+            cursor.execute(
+                f"""
+                INSERT INTO {Room._meta.db_table}
+                    (accommodation_id, name, capacity, max_capacity, price, stay_type,
+                     check_in_time, check_out_time, is_available, option_ids)
+                SELECT a.id, 'room ' || g, 1 + (random() * 2)::int, 4 + (random() * 2)::int,
+                       30000 + (random() * 300)::int * 1000, true, '15:00', '11:00', true, '{{}}'
+                FROM {Accommodation._meta.db_table} a
+                CROSS JOIN generate_series(1, %s) AS g
+                WHERE a.host_id = %s
+                LIMIT %s
+                """,
+                [rooms_per_accommodation, host.pk, room_count],
+            )
+            cursor.execute(
+                f"""
+                INSERT INTO {RoomInventory._meta.db_table} (room_id, count_room)
+                SELECT r.id, 1 + (random() * 4)::int
+                FROM {Room._meta.db_table} r
+                JOIN {Accommodation._meta.db_table} a ON a.id = r.accommodation_id
+                WHERE a.host_id = %s
+                """,
+                [host.pk],
+            )
+            room_ids = list(Room.objects.filter(accommodation__host=host).values_list("id", flat=True))
+            cursor.execute(
+                f"""
+                INSERT INTO {Booking._meta.db_table}
+                    (guest_id, room_id, check_in_datetime, check_out_datetime, total_price, status,
+                     guests_count, booker_name, booker_phone_number)
+                SELECT %s, room_id, check_in, check_in + (1 + (random() * 3)::int) * interval '1 day', 100000,
+                       'confirmed', 2, 'benchmark', '010-0000-0000'
+                FROM (
+                    SELECT (%s::int[])[1 + (random() * (%s - 1))::int] AS room_id,
+                           date_trunc('day', now()) + (random() * 180)::int * interval '1 day'
+                               + interval '15 hours' AS check_in
+                    FROM generate_series(1, %s)
+                ) AS b
+                """,
+                [user.pk, room_ids, len(room_ids), booking_count],
+            )
+
+        nights = RoomCalendarService.rebuild(room_ids=room_ids)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        self.stdout.write(
+            f"{accommodation_count} accommodations, {len(room_ids)} rooms, {booking_count} bookings, {nights} nights"
+        )
+
+    def run(self, runs: int) -> None:
+        timings = []
+        for _ in range(runs):
+            check_in = timezone.localdate() + timedelta(days=random.randint(1, 170))
+            check_out = check_in + timedelta(days=random.randint(1, 5))
+            queryset = AvailabilitySearchService.search(check_in, check_out, random.randint(1, 4))
+
+            started = time.perf_counter()
+            count = queryset.count()
+            list(queryset[:20])
+            timings.append((time.perf_counter() - started) * 1000)
+
+        timings.sort()
+        p95 = timings[max(int(len(timings) * 0.95) - 1, 0)]
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{runs} searches (count + first page, last count={count}): "
+                f"p50 {statistics.median(timings):.1f}ms, p95 {p95:.1f}ms, max {timings[-1]:.1f}ms"
+            )
+        )
+        self.stdout.write(queryset[:20].explain(analyze=True))
@@ -0,0 +1,65 @@
+import statistics
+import time
+import tracemalloc
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.common.renderers import FastJSONRenderer, orjson, stream_json_array
+
+
+class Command(BaseCommand):
+    help = "Compare JSONRenderer / FastJSONRenderer / streaming for a large list response (render time, peak memory)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10_000)
+        parser.add_argument("--runs", type=int, default=10)
+
+    def handle(self, *args, **options):
+        rows, runs = options["rows"], options["runs"]
+        self.stdout.write(f"rows={rows} runs={runs} orjson={'yes' if orjson else 'no (fallback)'}")
+
+        # 호스트 예약 내역(BookingSerializer) 과 같은 모양의 행
+        now = timezone.now()
+
+        def make_rows():
+            for i in range(rows):
+                yield {
+                    "id": i,
+                    "guest": i % 500,
+                    "room": i % 2000,
+                    "check_in_datetime": now + timedelta(days=i % 365),
+                    "check_out_datetime": now + timedelta(days=i % 365 + 2),
+                    "total_price": Decimal("120000.00"),
+                    "status": "confirmed",
+                    "request": "늦은 체크인 예정입니다",
+                    "guests_count": 2,
+                    "guest_name": f"guest {i % 500}",
+                    "accommodation_name": f"숙소 {i % 200}",
+                    "room_name": f"객실 {i % 2000}",
+                }
+
+        results = [
+            ("JSONRenderer (list)", lambda: JSONRenderer().render(list(make_rows()))),
+            ("FastJSONRenderer (list)", lambda: FastJSONRenderer().render(list(make_rows()))),
+            ("stream_json_array", lambda: sum(len(chunk) for chunk in stream_json_array(make_rows()))),
+        ]
+        for name, render in results:
+            timings = []
+            for _ in range(runs):
+                started = time.perf_counter()
+                render()
+                timings.append((time.perf_counter() - started) * 1000)
+
+            tracemalloc.start()
+            render()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            self.stdout.write(
+                f"{name:<26} median {statistics.median(timings):8.1f} ms"
+                f"  min {min(timings):8.1f} ms  peak {peak / 1024 / 1024:7.2f} MiB"
+            )
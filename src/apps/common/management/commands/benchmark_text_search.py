@@ -0,0 +1,106 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from apps.accommodations.models import Accommodation, AccommodationCard
+from apps.users.models import BusinessUser, User
+
+PLACES = ["강남", "홍대", "명동", "해운대", "서면", "제주", "애월", "속초", "강릉", "전주", "경주", "여수"]
+KINDS = ["호텔", "리조트", "게스트하우스", "펜션", "모텔", "스테이", "hotel", "resort", "stay"]
+FEATURES = ["오션뷰", "수영장", "바베큐", "조식", "주차", "스파", "루프탑", "반려견", "ocean view", "pool"]
+
+# (설명, 검색어) - 전문 검색 / 한글 부분 일치 / 오타
+QUERIES = [
+    ("full text", "해운대 리조트"),
+    ("korean partial", "해운"),
+    ("typo", "resrt"),
+    ("description", "루프탑"),
+]
+
+
+class Command(BaseCommand):
+    help = "Benchmark accommodation text search on a synthetic dataset (rolled back unless --keep)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--accommodations", type=int, default=200_000)
+        parser.add_argument("--runs", type=int, default=20)
+        parser.add_argument("--keep", action="store_true", help="Keep the generated data")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            started = time.perf_counter()
+            self.seed(options["accommodations"])
+            self.stdout.write(
+                f"seeded {options['accommodations']} accommodations in {time.perf_counter() - started:.1f}s"
+            )
+
+            for label, query in QUERIES:
+                self.run(label, query, options["runs"])
+
+            if not options["keep"]:
+                transaction.set_rollback(True)
+
+    def seed(self, count: int) -> None:
+        user = User.objects.create_user(
+            email=f"benchmark-{time.time_ns()}@test.com",
+            first_name="benchmark",
+            last_name="host",
+            phone_number="010-0000-0000",
+            gender="other",
+            birth_date="1990-01-01",
+            password="benchmark",
+        )
+        host = BusinessUser.objects.create(user=user)
+
+        def pick(words: list[str]) -> str:
+            array = "ARRAY[" + ", ".join(f"'{word}'" for word in words) + "]"
+            return f"({array})[1 + floor(random() * {len(words)})::int]"
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {Accommodation._meta.db_table}
+                    (host_id, name, phone_number, description, rules, is_active, created_at, updated_at)
+                SELECT %s, {pick(PLACES)} || ' ' || {pick(KINDS)} || ' ' || g,
+                       '', {pick(FEATURES)} || ' ' || {pick(FEATURES)}, '', true, now(), now()
+                FROM generate_series(1, %s) AS g
+                """,
+                [host.pk, count],
+            )
+            cursor.execute(
+                f"""
+                INSERT INTO {AccommodationCard._meta.db_table}
+                    (accommodation_id, representative_image, representative_image_derivatives, address, room_count,
+                     amenity_ids, search_title, search_text, updated_at)
+                SELECT a.id, '', '{{}}', '', 0, '{{}}', a.name, a.description, now()
+                FROM {Accommodation._meta.db_table} a
+                WHERE a.host_id = %s
+                """,
+                [host.pk],
+            )
+            cursor.execute(f"ANALYZE {Accommodation._meta.db_table}, {AccommodationCard._meta.db_table}")
+
+    def run(self, label: str, query: str, runs: int) -> None:
+        timings = []
+        for _ in range(runs):
+            queryset = Accommodation.objects.active().text_search(query)
+            started = time.perf_counter()
+            count = queryset.count()
+            list(queryset[:20])
+            timings.append((time.perf_counter() - started) * 1000)
+
+        timings.sort()
+        p95 = timings[max(int(len(timings) * 0.95) - 1, 0)]
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"[{label}] {query!r}: {count} matches, p50 {statistics.median(timings):.1f}ms, "
+                f"p95 {p95:.1f}ms, max {timings[-1]:.1f}ms"
+            )
+        )
+        plan = queryset[:20].explain(analyze=True)
+        self.stdout.write(plan)
+        # 검색 조건 4개(tsvector, ILIKE 2개, word similarity)가 모두 GIN 인덱스를 타면 카드 테이블을 순차 탐색하지 않는다
+        if f"Seq Scan on {AccommodationCard._meta.db_table}" in plan:
+            self.stdout.write(self.style.WARNING(f"[{label}] card table is sequentially scanned"))
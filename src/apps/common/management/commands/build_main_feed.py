@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from apps.pages.services.main_feed_service import MainFeedService
+
+
+class Command(BaseCommand):
+    help = "Rebuild the cached main feed (active accommodation ids)"
+
+    # cron / scheduler 에서 MAIN_FEED_TIMEOUT 보다 짧은 주기로 실행하면 요청 경로에서 재생성이 일어나지 않는다
+    def handle(self, *args, **kwargs):
+        feed = MainFeedService.build_feed()
+        self.stdout.write(self.style.SUCCESS(f"Main feed rebuilt with {len(feed['ids'])} accommodations."))
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from apps.common.util.media_gc import MediaGCService, get_media_gc_settings
+
+
+class Command(BaseCommand):
+    help = "Delete media files that no image/document row references (orphans) and expired direct uploads"
+
+    def add_arguments(self, parser):
+        config = get_media_gc_settings()
+        parser.add_argument("--dry-run", action="store_true", help="Only report the orphans that would be deleted")
+        parser.add_argument(
+            "--min-age",
+            type=int,
+            default=config["MIN_AGE"],
+            help="Keep files written or referenced within this many seconds",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=config["BATCH_SIZE"], help="Storage entries compared per batch"
+        )
+
+    def handle(self, *args, **options):
+        stats = MediaGCService.collect(
+            dry_run=options["dry_run"], min_age=options["min_age"], batch_size=options["batch_size"]
+        )
+        self.stdout.write(
+            f"scanned {stats['scanned']} files ({stats['scanned_bytes'] / 1024 / 1024:.1f}MB) "
+            f"in {stats['elapsed']:.1f}s - {stats['files_per_second']:.0f} files/s"
+        )
+        action = "to delete" if options["dry_run"] else "deleted"
+        self.stdout.write(
+            f"orphans: {stats['orphans']} ({stats['orphan_bytes'] / 1024 / 1024:.1f}MB), "
+            f"{action}: {stats['orphans'] if options['dry_run'] else stats['deleted']}, failed: {stats['failed']}"
+        )
+        self.stdout.write(f"expired upload records {action}: {stats['expired_uploads']}")
+        self.stdout.write(self.style.SUCCESS("done"))
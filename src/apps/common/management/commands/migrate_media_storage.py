@@ -0,0 +1,96 @@
+import time
+
+from django.core.cache import caches
+from django.core.management.base import BaseCommand
+
+from apps.accommodations.models import Accommodation_Image
+from apps.accommodations.services.accommodation_card_service import (
+    AccommodationCardService,
+)
+from apps.rooms.models import Room_Image
+
+
+class Command(BaseCommand):
+    help = (
+        "Move existing accommodation/room images (and their derivatives) from flat upload directories "
+        "to the content-addressed sharded storage, deduplicating identical files"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500, help="Image rows updated per bulk_update")
+        parser.add_argument("--dry-run", action="store_true", help="Only count the images that would be moved")
+        parser.add_argument(
+            "--delete-old", action="store_true", help="Delete the old files after every row points to the new ones"
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        old_names = []
+        for model in (Accommodation_Image, Room_Image):
+            moved, names = self.migrate_model(model, options["batch_size"], options["dry_run"])
+            old_names.extend(names)
+            self.stdout.write(f"{model._meta.label}: {moved} images {'to move' if options['dry_run'] else 'moved'}")
+
+        if options["dry_run"]:
+            return
+
+        # 숙소 카드의 대표 이미지 경로와 캐시된 응답이 새 경로를 가리키도록
+        AccommodationCardService.rebuild()
+        caches["catalog"].clear()
+
+        if options["delete_old"]:
+            # 옛 파일은 참조를 기록하지 않았으므로 storage.delete 가 바로 지운다
+            storage = Accommodation_Image._meta.get_field("image").storage
+            for name in old_names:
+                storage.delete(name)
+            self.stdout.write(f"{len(old_names)} old files deleted")
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"done in {elapsed:.1f}s"))
+
+    def migrate_model(self, model, batch_size: int, dry_run: bool) -> tuple[int, list[str]]:
+        storage = model._meta.get_field("image").storage
+        queryset = model.objects.exclude(image="").only("id", "image", "derivatives").order_by("pk")
+
+        moved, old_names, batch = 0, [], []
+        for instance in queryset.iterator(chunk_size=batch_size):
+            if storage.is_content_addressed(instance.image.name):
+                continue
+            moved += 1
+            if dry_run:
+                continue
+
+            old_names.append(instance.image.name)
+            instance.image.name = self.move(storage, instance.image.name)
+            derivatives = dict(instance.derivatives or {})
+            for key, variant in derivatives.items():
+                if not isinstance(variant, dict):
+                    continue
+                variant = dict(variant)
+                for image_format in ("webp", "jpeg"):
+                    if variant.get(image_format):
+                        old_names.append(variant[image_format])
+                        variant[image_format] = self.move(storage, variant[image_format])
+                derivatives[key] = variant
+            if derivatives:
+                derivatives["source"] = instance.image.name
+            instance.derivatives = derivatives
+            batch.append(instance)
+
+            if len(batch) >= batch_size:
+                # bulk_update 는 signal 을 보내지 않는다 (카드/캐시는 마지막에 한 번에 갱신)
+                model.objects.bulk_update(batch, ["image", "derivatives"])
+                batch = []
+        if batch:
+            model.objects.bulk_update(batch, ["image", "derivatives"])
+        return moved, old_names
+
+    def move(self, storage, name: str) -> str:
+        if storage.is_content_addressed(name):
+            return name
+        try:
+            with storage.open(name, "rb") as file:
+                return storage.save(name, file)
+        except FileNotFoundError:
+            self.stderr.write(f"missing file, kept as is: {name}")
+            return name
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from apps.accommodations.services.accommodation_card_service import (
+    AccommodationCardService,
+)
+
+
+class Command(BaseCommand):
+    help = "Rebuild the denormalized accommodation card table"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="Cards written per upsert")
+
+    def handle(self, *args, **options):
+        count = AccommodationCardService.rebuild(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"{count} accommodation cards rebuilt."))
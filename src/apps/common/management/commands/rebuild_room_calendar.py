@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.bookings.services.room_calendar_service import RoomCalendarService
+
+
+class Command(BaseCommand):
+    help = "Rebuild the per-night room inventory calendar from bookings"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--room", type=int, action="append", dest="room_ids", help="Rebuild only these rooms")
+
+    def handle(self, *args, **options):
+        count = RoomCalendarService.rebuild(room_ids=options["room_ids"])
+        self.stdout.write(self.style.SUCCESS(f"{count} room nights rebuilt."))
@@ -0,0 +1,42 @@
+import uuid
+
+from django.conf import settings
+from django.db import models
+
+
+class StoredBlob(models.Model):
+    """
+    content-addressed storage 에 저장된 파일과 참조 수 (apps.common.storage)
+    같은 내용의 업로드는 하나의 파일을 공유하고, 참조가 0 이 되면 파일을 지운다
+    """
+
+    name = models.CharField(max_length=255, unique=True)
+    size = models.BigIntegerField(default=0)
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} ({self.ref_count})"
+
+
+class PendingUpload(models.Model):
+    """
+    presigned URL 로 클라이언트가 object storage 에 직접 올리는 파일 (apps.common.util.direct_upload)
+    확인(confirm) 전까지는 어떤 모델에서도 참조하지 않는다
+    """
+
+    STATUS_CHOICES = [("pending", "pending"), ("confirmed", "confirmed")]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="pending_uploads")
+    purpose = models.CharField(max_length=50)
+    name = models.CharField(max_length=255)
+    content_type = models.CharField(max_length=100)
+    size = models.BigIntegerField()
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
+    expires_at = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "expires_at"], name="pending_upload_status_idx")]
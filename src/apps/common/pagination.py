@@ -0,0 +1,52 @@
+import base64
+import json
+from typing import Optional
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+def encode_cursor(data: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data, separators=(",", ":")).encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[dict]:
+    if not cursor:
+        return None
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except (TypeError, ValueError, UnicodeDecodeError):
+        raise NotFound("Invalid cursor")
+    if not isinstance(data, dict):
+        raise NotFound("Invalid cursor")
+    return data
+
+
+class KeysetPagination(CursorPagination):
+    """
+    기본 페이지네이션 - 정렬 키 기준 keyset(cursor) 방식
+    OFFSET 대신 WHERE key > 마지막 값 으로 다음 페이지를 읽으므로 몇 번째 페이지든 비용이 같다.
+    허용할 정렬은 뷰의 cursor_orderings = {"price": ("price", "id")} 로 지정하고 ?ordering=price 로 고른다
+    (첫 항목이 기본값, 정렬 키는 인덱스가 있는 컬럼이어야 한다)
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("id",)
+    ordering_param = "ordering"
+
+    def get_ordering(self, request, queryset, view):
+        orderings = getattr(view, "cursor_orderings", None) or {"id": self.ordering}
+        name = request.query_params.get(self.ordering_param)
+        if name not in orderings:
+            name = next(iter(orderings))
+        return tuple(orderings[name])
+
+
+class CountedPageNumberPagination(PageNumberPagination):
+    """전체 개수가 꼭 필요한 화면(검색 결과 등)에서만 사용하는 페이지 번호 방식"""
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
@@ -0,0 +1,80 @@
+"""
+JSON 렌더러 / 스트리밍 응답
+
+orjson 이 설치되어 있으면 orjson 으로 직렬화하고, 없으면 DRF JSONRenderer(표준 json)로 동작한다 (pip install orjson).
+"""
+
+from typing import Iterable, Iterator
+
+from django.http import StreamingHttpResponse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson 미설치 환경은 표준 json 으로 fallback
+    orjson = None  # type: ignore[assignment]
+
+# datetime 은 DRF 와 같은 형식(밀리초, Z)으로 맞추기 위해 JSONEncoder.default 로 넘긴다
+ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME) if orjson else 0
+
+_encoder = JSONEncoder()
+
+
+def dumps(data) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, default=_encoder.default, option=ORJSON_OPTIONS)
+    return JSONRenderer().render(data)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """orjson 기반 기본 렌더러 (들여쓰기 요청이나 orjson 미설치 시 JSONRenderer 와 동일)"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        # JSONRenderer 와 같이 JavaScript 에서 문자열 종료로 해석되는 문자는 이스케이프
+        return dumps(data).replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+
+def stream_json_array(rows: Iterable, batch_size: int = 500) -> Iterator[bytes]:
+    """행 단위로 JSON 배열을 만든다 (batch_size 행씩 묶어서 내보냄)"""
+    yield b"["
+    batch = []
+    first = True
+    for row in rows:
+        batch.append(dumps(row))
+        if len(batch) >= batch_size:
+            yield (b"" if first else b",") + b",".join(batch)
+            first = False
+            batch = []
+    if batch:
+        yield (b"" if first else b",") + b",".join(batch)
+    yield b"]"
+
+
+class StreamingListMixin:
+    """
+    ?stream=1 이면 페이지네이션 없이 queryset.iterator() 로 읽으면서 JSON 배열을 바로 내보내는 view mixin
+    전체 목록을 메모리에 만들지 않으므로 대량 목록(호스트 예약 내역, 재고 등) 다운로드에 사용한다
+    """
+
+    stream_query_param = "stream"
+    stream_chunk_size = 2000
+
+    def should_stream(self, request) -> bool:
+        return request.query_params.get(self.stream_query_param) in ("1", "true")
+
+    def stream_response(self, queryset, serializer_class=None) -> StreamingHttpResponse:
+        serializer_class = serializer_class or self.get_serializer_class()  # type: ignore[attr-defined]
+        # 행마다 serializer 를 만들지 않고 하나로 to_representation 만 반복한다
+        serializer = serializer_class(context=self.get_serializer_context())  # type: ignore[attr-defined]
+        rows = (serializer.to_representation(obj) for obj in queryset.iterator(chunk_size=self.stream_chunk_size))
+        return StreamingHttpResponse(stream_json_array(rows), content_type="application/json")
+
+    def list(self, request, *args, **kwargs):
+        if self.should_stream(request):
+            return self.stream_response(self.filter_queryset(self.get_queryset()))
+        return super().list(request, *args, **kwargs)
@@ -0,0 +1,102 @@
+from typing import NamedTuple, Optional
+
+from rest_framework import serializers
+
+from apps.common.util.direct_upload import UPLOAD_PURPOSES
+
+
+class Expandable(NamedTuple):
+    """중첩 필드를 직렬화할 때 필요한 관계 (select_related / prefetch_related 대상)"""
+
+    select_related: tuple = ()
+    prefetch_related: tuple = ()
+
+
+def parse_field_list(value: Optional[str]) -> Optional[set]:
+    if value is None:
+        return None
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+class DynamicFieldsMixin:
+    """
+    ?fields=id,name,price / ?expand=images 로 응답 필드를 고르는 ModelSerializer mixin
+    Meta.expandable_fields 에 적은 중첩 필드는 요청했을 때만 직렬화하고, 뷰는 optimize_queryset() 으로
+    해당 관계만 select_related / prefetch_related 한다 (요청하지 않은 중첩 필드는 쿼리도 실행하지 않는다)
+    - 둘 다 없으면 기존처럼 전체 필드
+    - fields 만 있으면 fields 에 적은 필드만 (중첩 필드도 fields 에 적으면 포함)
+    - expand 가 있으면 중첩 필드는 expand 에 적은 것만
+    조회(GET/HEAD) 응답의 최상위 serializer 에만 적용된다
+    """
+
+    fields_query_param = "fields"
+    expand_query_param = "expand"
+
+    @classmethod
+    def get_expandable_fields(cls) -> dict:
+        return getattr(cls.Meta, "expandable_fields", {})
+
+    @classmethod
+    def get_requested_fields(cls, request) -> tuple[Optional[set], Optional[set]]:
+        if request is None or request.method not in ("GET", "HEAD"):
+            return None, None
+        return (
+            parse_field_list(request.query_params.get(cls.fields_query_param)),
+            parse_field_list(request.query_params.get(cls.expand_query_param)),
+        )
+
+    @classmethod
+    def is_field_requested(cls, name: str, fields: Optional[set], expand: Optional[set]) -> bool:
+        if name in cls.get_expandable_fields() and expand is not None:
+            return name in expand
+        return fields is None or name in fields
+
+    @classmethod
+    def optimize_queryset(cls, queryset, request):
+        """요청한 중첩 필드의 관계만 미리 읽는다"""
+        fields, expand = cls.get_requested_fields(request)
+        for name, expandable in cls.get_expandable_fields().items():
+            if not cls.is_field_requested(name, fields, expand):
+                continue
+            if expandable.select_related:
+                queryset = queryset.select_related(*expandable.select_related)
+            if expandable.prefetch_related:
+                queryset = queryset.prefetch_related(*expandable.prefetch_related)
+        return queryset
+
+    def is_root_serializer(self) -> bool:
+        parent = self.parent  # type: ignore[attr-defined]
+        return parent is None or (isinstance(parent, serializers.ListSerializer) and parent.parent is None)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self.is_root_serializer():
+            return fields
+
+        requested, expand = self.get_requested_fields(self.context.get("request"))
+        if requested is None and expand is None:
+            return fields
+        for name in list(fields):
+            if not self.is_field_requested(name, requested, expand):
+                fields.pop(name)
+        return fields
+
+
+class DynamicFieldsViewMixin:
+    """serializer_class 의 optimize_queryset() 으로 요청한 관계만 미리 읽는 generic view mixin"""
+
+    def optimize_queryset(self, queryset):
+        serializer_class = self.get_serializer_class()
+        if issubclass(serializer_class, DynamicFieldsMixin):
+            queryset = serializer_class.optimize_queryset(queryset, self.request)
+        return queryset
+
+    def get_queryset(self):
+        return self.optimize_queryset(super().get_queryset())
+
+
+class DirectUploadRequestSerializer(serializers.Serializer):
+    purpose = serializers.ChoiceField(choices=list(UPLOAD_PURPOSES))
+    filename = serializers.CharField(max_length=255)
+    content_type = serializers.CharField(max_length=100)
+    size = serializers.IntegerField(min_value=1)
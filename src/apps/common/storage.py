@@ -0,0 +1,239 @@
+"""
+content-addressed media storage
+
+업로드 파일을 내용의 sha256 으로 이름 짓고 하위 디렉터리로 나눠 저장한다.
+
+    accommodation_images/photo.jpg -> blobs/3f/a2/3fa2...c9.jpg
+
+- 같은 내용을 다시 올리면 파일을 새로 쓰지 않고 기존 파일을 가리킨다 (StoredBlob.ref_count 증가)
+- storage.delete(name) 은 참조를 하나 해제하고, 참조가 0 이 되면 파일을 지운다
+- 한 디렉터리의 파일 수는 (전체 파일 수 / 16^(DEPTH*WIDTH)) 정도로 유지된다
+"""
+
+import hashlib
+import logging
+import os
+import re
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage, Storage, storages
+from django.core.files.utils import validate_file_name
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.common.models import StoredBlob
+
+# 파일 삭제를 다시 시도할 storage 오류
+STORAGE_ERRORS: tuple[type[Exception], ...]
+
+try:
+    from botocore.exceptions import BotoCoreError, ClientError
+    from storages.backends.s3 import S3Storage
+
+    STORAGE_ERRORS = (OSError, BotoCoreError, ClientError)
+except ImportError:  # pragma: no cover - django-storages 미설치 환경은 파일시스템 storage 만 사용
+    S3Storage = None
+    STORAGE_ERRORS = (OSError,)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONTENT_ADDRESSED_STORAGE_SETTINGS = {
+    "PREFIX": "blobs",
+    "DEPTH": 2,  # 하위 디렉터리 단계 수
+    "WIDTH": 2,  # 단계마다 사용하는 hash 글자 수 (2 -> 256 개)
+}
+
+
+def get_content_addressed_settings() -> dict:
+    return {**DEFAULT_CONTENT_ADDRESSED_STORAGE_SETTINGS, **getattr(settings, "CONTENT_ADDRESSED_STORAGE", {})}
+
+
+def get_image_storage():
+    """숙소/객실 이미지 필드의 storage (settings.STORAGES["images"])"""
+    return storages["images"]
+
+
+def lock_blob_name(name: str) -> None:
+    """
+    이름 단위 advisory 잠금 - 호출한 transaction 이 끝날 때까지 유지된다
+    StoredBlob 행이 아직 없거나 방금 지워진 이름도 잠글 수 있어 참조 추가와 media GC 삭제를 직렬화한다
+    """
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", [name])
+
+
+def acquire_blob(name: str, size: int) -> bool:
+    """
+    참조를 하나 늘리고, 행을 새로 만들었으면 True (이전 파일이 지워졌을 수 있으므로 파일을 다시 써야 한다)
+    잠금은 호출한 transaction 이 끝날 때까지 유지된다
+    """
+    lock_blob_name(name)
+    while True:
+        blob = StoredBlob.objects.select_for_update().filter(name=name).first()
+        if blob is not None:
+            # updated_at 을 갱신해 두면 media GC 가 방금 다시 참조된 파일을 지우지 않는다
+            blob.ref_count += 1
+            blob.save(update_fields=["ref_count", "updated_at"])
+            return False
+        try:
+            with transaction.atomic():
+                StoredBlob.objects.create(name=name, size=size, ref_count=1)
+            return True
+        except IntegrityError:
+            # 동시에 같은 파일이 처음 올라온 경우 - 그 행을 잠그고 다시 시도한다
+            continue
+
+
+def release_blob(name: str) -> bool:
+    """참조를 하나 해제하고, 파일을 지워도 되면 True (참조가 0 이 되었거나 참조를 기록하지 않은 파일)"""
+    with transaction.atomic():
+        lock_blob_name(name)
+        blob = StoredBlob.objects.select_for_update().filter(name=name).first()
+        if blob is None:
+            return True
+        if blob.ref_count > 1:
+            blob.ref_count -= 1
+            blob.save(update_fields=["ref_count", "updated_at"])
+            return False
+        blob.delete()
+        return True
+
+
+def get_storage_alias(storage) -> Optional[str]:
+    """settings.STORAGES 에 등록된 storage 의 alias (task 에는 storage 객체 대신 alias 를 넘긴다)"""
+    for alias in settings.STORAGES:
+        if storages[alias] is storage:
+            return alias
+    return None
+
+
+def check_storage_location(storage) -> None:
+    """
+    파일시스템 storage 의 위치가 없으면 오류 - 볼륨을 마운트하지 않은 worker 에서 삭제가 조용히 넘어가거나
+    media GC 가 빈 디렉터리를 훑고 끝나지 않게 한다
+    """
+    if isinstance(storage, FileSystemStorage) and not os.path.isdir(storage.location):
+        raise ImproperlyConfigured(f"storage location {storage.location} does not exist (is the media volume mounted?)")
+
+
+def delete_files(storage, names: Iterable[str]) -> list[str]:
+    """파일 참조를 해제하고 지우지 못한 이름을 반환 (이미 해제한 이름을 다시 해제하지 않도록 실패한 것만 재시도한다)"""
+    failed = []
+    for name in names:
+        try:
+            storage.delete(name)
+        except STORAGE_ERRORS:
+            logger.warning("cannot delete %s", name, exc_info=True)
+            failed.append(name)
+    return failed
+
+
+def release_files(storage, names: Iterable[str]) -> None:
+    """커밋된 뒤 파일 참조 해제를 queue 에 넣는다 (요청에서는 storage 를 호출하지 않고, 롤백되면 파일을 그대로 둔다)"""
+    names = [name for name in names if name]
+    if not names:
+        return
+    alias = get_storage_alias(storage)
+
+    def enqueue():
+        if alias is None:
+            # 등록되지 않은 storage 는 worker 에서 다시 만들 수 없으므로 바로 지운다
+            delete_files(storage, names)
+            return
+        from apps.common.tasks import delete_storage_files
+
+        delete_storage_files.delay(alias, names)
+
+    transaction.on_commit(enqueue)
+
+
+class ContentAddressedStorageMixin:
+    """
+    Storage 클래스 앞에 섞어서 사용하는 content-addressed 동작
+    save() 에 넘긴 이름은 확장자를 정하는 데만 쓰인다
+    """
+
+    def __init__(self, *args, prefix=None, depth=None, width=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        config = get_content_addressed_settings()
+        self.prefix = config["PREFIX"] if prefix is None else prefix
+        self.depth = config["DEPTH"] if depth is None else depth
+        self.width = config["WIDTH"] if width is None else width
+        self.name_pattern = re.compile(
+            rf"^{re.escape(self.prefix)}/" + rf"[0-9a-f]{{{self.width}}}/" * self.depth + r"[0-9a-f]{64}(\.\w+)?$"
+        )
+
+    @staticmethod
+    def hash_content(content: File) -> str:
+        hasher = hashlib.sha256()
+        for chunk in content.chunks():
+            hasher.update(chunk)
+        content.seek(0)
+        return hasher.hexdigest()
+
+    def content_name(self, name: str, digest: str) -> str:
+        extension = os.path.splitext(name)[1].lower()
+        shards = [digest[i * self.width : (i + 1) * self.width] for i in range(self.depth)]
+        return "/".join([self.prefix, *shards, f"{digest}{extension}"])
+
+    def is_content_addressed(self, name: str) -> bool:
+        return bool(self.name_pattern.match(name or ""))
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, "chunks"):
+            content = File(content, name)
+        name = self.content_name(name, self.hash_content(content))
+        validate_file_name(name, allow_relative_path=True)
+        # 행 잠금을 잡은 뒤에 파일을 확인해 동시에 실행된 delete() 가 확인과 참조 사이에 파일을 지우지 못하게 한다
+        with transaction.atomic():
+            if acquire_blob(name, content.size):
+                # 행이 새로 생겼으면 남아 있는 파일(지우다 만 파일 등)을 믿지 않고 다시 쓴다
+                if self.exists(name):
+                    super().delete(name)
+                name = self._save(name, content)
+            elif not self.exists(name):
+                name = self._save(name, content)
+        return name
+
+    def delete_file(self, name):
+        """참조 수와 상관없이 파일만 지운다 (media GC 가 참조가 없음을 확인한 뒤 사용)"""
+        super().delete(name)
+
+    def delete(self, name):
+        if not name:
+            return
+        # 파일을 지울 때까지 행 잠금을 유지한다 (지우다 실패하면 참조 해제도 롤백되어 다시 시도할 수 있다)
+        with transaction.atomic():
+            if release_blob(name):
+                super().delete(name)
+
+
+class ContentAddressedFileSystemStorage(ContentAddressedStorageMixin, FileSystemStorage):
+    pass
+
+
+if S3Storage is not None:
+
+    class ContentAddressedS3Storage(ContentAddressedStorageMixin, S3Storage):
+        pass
+
+
+def adopt_file(storage: Storage, name: str) -> str:
+    """
+    storage 에 이미 올라와 있는 파일(presigned 직접 업로드)을 content-addressed 이름으로 옮기고 새 이름을 반환
+    같은 내용의 파일이 있으면 그 파일을 공유하고 올라온 파일은 지운다
+    """
+    if not isinstance(storage, ContentAddressedStorageMixin) or storage.is_content_addressed(name):
+        return name
+    with storage.open(name, "rb") as file:
+        new_name = storage.save(name, file)
+    # 올라온 파일은 참조를 기록하지 않았으므로 바로 지워진다
+    storage.delete(name)
+    return new_name
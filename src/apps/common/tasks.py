@@ -0,0 +1,42 @@
+import smtplib
+
+from celery import shared_task
+from django.core.files.storage import storages
+
+from apps.common.storage import check_storage_location, delete_files
+from apps.common.util.email.services.email_queue_service import EmailQueueService
+from apps.common.util.image_derivatives import ImageDerivativeService
+from apps.common.util.media_gc import MediaGCService, MediaGCStats
+
+
+# SMTP 오류는 지수 backoff(최대 5분, jitter)로 재시도 - 실패한 메일은 flush() 가 outbox 에 되돌려 둔다
+@shared_task(
+    autoretry_for=(smtplib.SMTPException, OSError),
+    retry_backoff=True,
+    retry_backoff_max=60 * 5,
+    retry_jitter=True,
+    max_retries=8,
+)
+def send_queued_emails() -> int:
+    return EmailQueueService.flush()
+
+
+# storage 일시 오류(OSError)만 재시도 - 이미지로 읽을 수 없는 파일은 generate() 가 건너뛴다
+@shared_task(autoretry_for=(OSError,), retry_backoff=True, max_retries=3)
+def generate_image_derivatives(model_label: str, pk: int) -> None:
+    ImageDerivativeService.generate(model_label, pk)
+
+
+# 삭제에 실패한 파일만 다시 시도한다 (성공한 파일의 참조를 두 번 해제하지 않도록)
+@shared_task(bind=True, max_retries=5)
+def delete_storage_files(self, alias: str, names: list[str]) -> None:
+    storage = storages[alias]
+    check_storage_location(storage)
+    failed = delete_files(storage, names)
+    if failed:
+        raise self.retry(args=(alias, failed), countdown=60 * 2**self.request.retries)
+
+
+@shared_task
+def collect_media_garbage() -> MediaGCStats:
+    return MediaGCService.collect()
@@ -0,0 +1,106 @@
+from django.core.cache import caches
+from django.test import SimpleTestCase
+
+from apps.common.cache.backends import LocalTier
+
+
+class TwoTierCacheTest(SimpleTestCase):
+    def setUp(self):
+        self.catalog = caches["catalog"]
+        self.catalog.clear()
+
+    def test_local_tier_serves_without_shared_tier(self):
+        # given
+        self.catalog.set("amenities", [{"id": 1, "name": "wifi"}], tags=["amenities"])
+
+        # when
+        caches["catalog_shared"].clear()
+
+        # then
+        self.assertEqual(self.catalog.get("amenities"), [{"id": 1, "name": "wifi"}])
+
+    def test_returned_value_is_a_copy(self):
+        # given
+        self.catalog.set("ids", [1, 2, 3])
+
+        # when
+        self.catalog.get("ids").append(4)
+
+        # then
+        self.assertEqual(self.catalog.get("ids"), [1, 2, 3])
+
+    def test_invalidate_tags_drops_local_and_shared_entries(self):
+        # given
+        self.catalog.set("room:1", {"price": 1000}, tags=["room:1"])
+        self.catalog.set("room:2", {"price": 2000}, tags=["room:2"])
+
+        # when
+        self.catalog.invalidate_tags("room:1")
+
+        # then
+        self.assertIsNone(self.catalog.get("room:1"))
+        self.assertEqual(self.catalog.get("room:2"), {"price": 2000})
+
+    def test_value_read_before_tag_invalidation_is_not_stored(self):
+        # given - DB 에서 읽기 전에 태그 버전을 기록
+        snapshot = self.catalog.snapshot_tags(["room:1"])
+        stale = {"price": 1000}
+
+        # when - 읽은 뒤 set 전에 변경이 커밋되어 태그가 무효화된다
+        self.catalog.invalidate_tags("room:1")
+        self.catalog.set("room:1", stale, snapshot=snapshot)
+
+        # then - 로컬/공유 계층 어디에도 이전 값이 남지 않는다
+        self.assertIsNone(self.catalog.get("room:1"))
+        self.assertIsNone(self.catalog._local.get(self.catalog.make_key("room:1")))
+
+    def test_value_with_current_snapshot_is_stored(self):
+        # given
+        snapshot = self.catalog.snapshot_tags(["room:2"])
+
+        # when - 다른 태그의 무효화는 영향이 없다
+        self.catalog.invalidate_tags("room:3")
+        self.catalog.set("room:2", {"price": 2000}, snapshot=snapshot)
+
+        # then
+        self.assertEqual(self.catalog.get("room:2"), {"price": 2000})
+
+    def test_message_from_other_worker_drops_local_entry(self):
+        # given
+        self.catalog.set("feed", [1, 2])
+        caches["catalog_shared"].set(self.catalog.make_key("feed"), ([3, 4], {}))
+
+        # when - 다른 워커가 set 하면서 보낸 pub/sub 메시지
+        self.catalog._local.invalidate({"keys": [self.catalog.make_key("feed")]})
+
+        # then
+        self.assertEqual(self.catalog.get("feed"), [3, 4])
+
+
+class LocalTierTest(SimpleTestCase):
+    def test_lru_evicts_least_recently_used(self):
+        # given
+        tier = LocalTier(max_entries=2, timeout=60)
+        tier.set("a", 1, ())
+        tier.set("b", 2, ())
+
+        # when
+        tier.get("a")
+        tier.set("c", 3, ())
+
+        # then
+        self.assertIsNotNone(tier.get("a"))
+        self.assertIsNone(tier.get("b"))
+        self.assertIsNotNone(tier.get("c"))
+
+    def test_value_read_before_invalidation_is_not_stored(self):
+        # given
+        tier = LocalTier(max_entries=10, timeout=60)
+        generation = tier.generation
+
+        # when - 공유 계층에서 읽는 사이에 무효화가 도착
+        tier.invalidate({"tags": ["amenities"]})
+        tier.set("amenities", ["stale"], ["amenities"], generation)
+
+        # then
+        self.assertIsNone(tier.get("amenities"))
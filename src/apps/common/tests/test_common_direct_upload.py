@@ -0,0 +1,129 @@
+from django.core.files.storage import storages
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from moto import mock_aws
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIClient
+
+from apps.common.models import PendingUpload
+from apps.common.util.direct_upload import DirectUploadService
+from apps.users.models import User
+
+BUCKET = "test-media"
+S3_STORAGES = {
+    "default": {"BACKEND": "storages.backends.s3.S3Storage", "OPTIONS": {"bucket_name": BUCKET}},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    "images": {"BACKEND": "apps.common.storage.ContentAddressedS3Storage", "OPTIONS": {"bucket_name": BUCKET}},
+}
+
+
+@override_settings(STORAGES=S3_STORAGES, AWS_S3_REGION_NAME="us-east-1")
+class DirectUploadTest(TestCase):
+    def setUp(self):
+        self.mock = mock_aws()
+        self.mock.start()
+        self.storage = storages["images"]
+        self.s3 = self.storage.connection.meta.client
+        self.s3.create_bucket(Bucket=BUCKET)
+        self.user = User.objects.create_superuser(email="upload@test.com", password="test123")
+        self.other = User.objects.create_superuser(email="other@test.com", password="test123")
+
+    def tearDown(self):
+        self.mock.stop()
+
+    def upload(self, data: dict, body: bytes = b"\xff\xd8 jpeg bytes", content_type: str = "image/jpeg"):
+        # 클라이언트가 presigned POST 로 올린 것처럼 object 를 만든다
+        self.s3.put_object(Bucket=BUCKET, Key=data["fields"]["key"], Body=body, ContentType=content_type)
+
+    def test_presigned_post_limits_size_and_content_type(self):
+        # when
+        data = DirectUploadService.create(self.user, "room_image", "Photo.JPG", "image/jpeg", 1024)
+
+        # then
+        upload = PendingUpload.objects.get(pk=data["upload_id"])
+        self.assertEqual(upload.name, f"uploads/room_image/{data['upload_id']}.jpg")
+        self.assertEqual(data["fields"]["key"], upload.name)
+        self.assertEqual(data["fields"]["Content-Type"], "image/jpeg")
+        self.assertIn("policy", data["fields"])
+
+    def test_rejects_files_over_purpose_limit_before_presigning(self):
+        with self.assertRaises(ValidationError):
+            DirectUploadService.create(self.user, "room_image", "big.jpg", "image/jpeg", 6 * 1024 * 1024)
+        with self.assertRaises(ValidationError):
+            DirectUploadService.create(self.user, "room_image", "doc.pdf", "application/pdf", 1024)
+        self.assertFalse(PendingUpload.objects.exists())
+
+    def test_confirm_returns_names_in_request_order_once(self):
+        # given
+        first = DirectUploadService.create(self.user, "accommodation_image", "a.jpg", "image/jpeg", 1024)
+        second = DirectUploadService.create(self.user, "accommodation_image", "b.jpg", "image/jpeg", 1024)
+        self.upload(first)
+        self.upload(second)
+
+        # when
+        names = DirectUploadService.confirm(self.user, "accommodation_image", [second["upload_id"], first["upload_id"]])
+
+        # then
+        self.assertEqual(names, [second["fields"]["key"], first["fields"]["key"]])
+        self.assertEqual(set(PendingUpload.objects.values_list("status", flat=True)), {"confirmed"})
+        with self.assertRaises(ValidationError):
+            DirectUploadService.confirm(self.user, "accommodation_image", [first["upload_id"]])
+
+    def test_confirm_rejects_duplicate_upload_ids(self):
+        # given
+        data = DirectUploadService.create(self.user, "room_image", "a.jpg", "image/jpeg", 1024)
+        self.upload(data)
+
+        # when / then - 한 파일을 두 이미지 행이 가리키지 않도록 확인하지 않는다
+        with self.assertRaises(ValidationError):
+            DirectUploadService.confirm(self.user, "room_image", [data["upload_id"], data["upload_id"].upper()])
+        self.assertEqual(PendingUpload.objects.get().status, "pending")
+
+    def test_confirm_rejects_missing_foreign_or_mismatched_uploads(self):
+        # given
+        missing = DirectUploadService.create(self.user, "room_image", "a.jpg", "image/jpeg", 1024)
+        mismatched = DirectUploadService.create(self.user, "room_image", "b.jpg", "image/jpeg", 1024)
+        self.upload(mismatched, content_type="text/html")
+
+        # then
+        for user, upload_id in (
+            (self.user, missing["upload_id"]),  # 아직 올리지 않음
+            (self.other, mismatched["upload_id"]),  # 다른 사용자
+            (self.user, mismatched["upload_id"]),  # Content-Type 이 다름
+            (self.user, "not-a-uuid"),
+        ):
+            with self.assertRaises(ValidationError):
+                DirectUploadService.confirm(user, "room_image", [upload_id])
+        self.assertEqual(PendingUpload.objects.filter(status="pending").count(), 2)
+
+    def test_create_endpoint_requires_authentication(self):
+        # given
+        client = APIClient()
+        payload = {"purpose": "room_image", "filename": "a.png", "content_type": "image/png", "size": 100}
+
+        # when
+        anonymous = client.post(reverse("common:direct-upload-create"), payload, format="json")
+        client.force_authenticate(self.user)
+        response = client.post(reverse("common:direct-upload-create"), payload, format="json")
+
+        # then
+        self.assertEqual(anonymous.status_code, 401)
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(PendingUpload.objects.filter(pk=response.data["upload_id"], user=self.user).exists())
+
+
+class DirectUploadUnavailableTest(TestCase):
+    def test_filesystem_storage_returns_503(self):
+        # given - 테스트 기본 storage 는 파일시스템이라 presigned 업로드를 쓸 수 없다
+        client = APIClient()
+        client.force_authenticate(User.objects.create_superuser(email="fs@test.com", password="test123"))
+
+        # when
+        response = client.post(
+            reverse("common:direct-upload-create"),
+            {"purpose": "room_image", "filename": "a.png", "content_type": "image/png", "size": 100},
+            format="json",
+        )
+
+        # then
+        self.assertEqual(response.status_code, 503)
@@ -0,0 +1,141 @@
+import json
+import smtplib
+from unittest.mock import patch
+
+from django.core import mail
+from django.core.mail import get_connection
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import SimpleTestCase, override_settings
+
+from apps.common.util.email.services.email_queue_service import (
+    EMAIL_FLUSH_LOCK_KEY,
+    EMAIL_FLUSH_SCHEDULED_KEY,
+    EMAIL_OUTBOX_KEY,
+    EMAIL_PROCESSING_KEY,
+    EmailQueueService,
+    _smtp_connection,
+)
+from apps.common.util.email.services.otp_service import OTPService
+from apps.common.util.redis_client import get_redis_client, reset_redis_client
+
+
+@override_settings(
+    REDIS_CLIENT={"IN_MEMORY": True},
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+    EMAIL_QUEUE={"BATCH_SIZE": 2, "MAX_ATTEMPTS": 2},
+)
+class EmailQueueTest(SimpleTestCase):
+    def setUp(self):
+        reset_redis_client()
+        _smtp_connection.close()
+        self.client = get_redis_client()
+
+    def tearDown(self):
+        _smtp_connection.close()
+        reset_redis_client()
+
+    def test_enqueue_schedules_one_flush_and_flush_sends_batches_over_one_connection(self):
+        # given
+        with patch.object(EmailQueueService, "schedule_flush") as schedule_flush:
+            for i in range(3):
+                EmailQueueService.enqueue("subject", f"body {i}", [f"user{i}@test.com"])
+
+        # then - 요청에서는 outbox 에 넣기만 하고 task 예약은 한 번
+        self.assertEqual(schedule_flush.call_count, 1)
+        self.assertEqual(self.client.llen(EMAIL_OUTBOX_KEY), 3)
+        self.assertEqual(len(mail.outbox), 0)
+
+        # when
+        with patch(
+            "apps.common.util.email.services.email_queue_service.get_connection", wraps=get_connection
+        ) as connect:
+            sent = EmailQueueService.flush()
+
+        # then
+        self.assertEqual(sent, 3)
+        self.assertEqual(connect.call_count, 1)
+        self.assertEqual([message.body for message in mail.outbox], ["body 0", "body 1", "body 2"])
+        self.assertEqual(self.client.llen(EMAIL_OUTBOX_KEY), 0)
+        self.assertFalse(self.client.exists(EMAIL_FLUSH_SCHEDULED_KEY))
+
+    def test_failed_messages_are_requeued_in_order_and_dropped_after_max_attempts(self):
+        # given
+        with patch.object(EmailQueueService, "schedule_flush"):
+            for i in range(3):
+                EmailQueueService.enqueue("subject", f"body {i}", [f"user{i}@test.com"])
+        send_messages = EmailBackend.send_messages
+        calls = []
+
+        def fail_after_first(backend, messages):
+            calls.append(messages)
+            if len(calls) > 1:
+                raise smtplib.SMTPDataError(451, "try again")
+            return send_messages(backend, messages)
+
+        # when
+        with patch.object(EmailBackend, "send_messages", fail_after_first):
+            with self.assertRaises(smtplib.SMTPException):
+                EmailQueueService.flush()
+
+        # then - 보낸 메일은 다시 넣지 않고, 실패한 배치의 나머지는 시도 횟수를 올려 outbox 앞에 되돌린다
+        self.assertEqual([message.body for message in mail.outbox], ["body 0"])
+        self.assertEqual(self.client.llen(EMAIL_PROCESSING_KEY), 0)
+        requeued = [json.loads(item) for item in self.client.lpop(EMAIL_OUTBOX_KEY, 10)]
+        self.assertEqual([payload["body"] for payload in requeued], ["body 1", "body 2"])
+        self.assertEqual([payload["attempts"] for payload in requeued], [1, 0])
+
+        # when - MAX_ATTEMPTS 에 도달하면 버린다
+        EmailQueueService._requeue(requeued, max_attempts=2)
+
+        # then
+        remaining = [json.loads(item) for item in self.client.lpop(EMAIL_OUTBOX_KEY, 10)]
+        self.assertEqual([payload["body"] for payload in remaining], ["body 2"])
+
+    def test_batch_left_in_processing_list_by_crashed_worker_is_sent_first(self):
+        # given - 이전 워커가 배치를 processing list 로 옮긴 뒤 보내지 못하고 죽은 상태
+        with patch.object(EmailQueueService, "schedule_flush"):
+            for i in range(3):
+                EmailQueueService.enqueue("subject", f"body {i}", [f"user{i}@test.com"])
+        EmailQueueService._claim(self.client, 2)
+
+        # when
+        sent = EmailQueueService.flush()
+
+        # then - 되돌린 메일을 원래 순서대로 보내고, 보낸 메일은 processing list 에서 지운다
+        self.assertEqual(sent, 3)
+        self.assertEqual([message.body for message in mail.outbox], ["body 0", "body 1", "body 2"])
+        self.assertEqual(self.client.llen(EMAIL_PROCESSING_KEY), 0)
+        self.assertEqual(self.client.llen(EMAIL_OUTBOX_KEY), 0)
+
+    def test_flush_stops_claiming_when_lock_is_taken_over(self):
+        # given
+        with patch.object(EmailQueueService, "schedule_flush"):
+            for i in range(3):
+                EmailQueueService.enqueue("subject", f"body {i}", [f"user{i}@test.com"])
+        send_batch = EmailQueueService._send_batch
+
+        def expire_lock_after_batch(client, items, config):
+            sent = send_batch(client, items, config)
+            # 배치를 보내는 동안 lock 이 만료되어 다른 flush 가 잡은 상황
+            self.client.set(EMAIL_FLUSH_LOCK_KEY, "other", ex=60)
+            return sent
+
+        # when
+        with patch.object(EmailQueueService, "_send_batch", side_effect=expire_lock_after_batch):
+            with patch.object(EmailQueueService, "schedule_flush"):
+                sent = EmailQueueService.flush()
+
+        # then - 남은 메일은 꺼내지 않고 새 lock 도 지우지 않는다
+        self.assertEqual(sent, 2)
+        self.assertEqual(self.client.llen(EMAIL_OUTBOX_KEY), 1)
+        self.assertEqual(self.client.get(EMAIL_FLUSH_LOCK_KEY), b"other")
+
+    def test_send_otp_email_is_delivered_by_eager_task(self):
+        # when - 테스트 설정은 CELERY_TASK_ALWAYS_EAGER 이므로 예약한 task 가 바로 실행된다
+        OTPService().send_otp_email("otp@test.com")
+
+        # then
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["otp@test.com"])
+        otp = self.client.get("otp:otp@test.com").decode()
+        self.assertIn(otp, mail.outbox[0].body)
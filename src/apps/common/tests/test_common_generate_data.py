@@ -0,0 +1,104 @@
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
+from django.db.models import F
+from django.test import TestCase
+
+from apps.accommodations.models import Accommodation, AccommodationCard
+from apps.amenities.models import Amenity, RoomOption
+from apps.bookings.models import Booking
+from apps.common.util.data_seeder import DataSeeder
+from apps.rooms.models import Room, RoomNightInventory
+from apps.users.models import User
+
+COUNTS = {"guests": 40, "hosts": 4, "accommodations": 6, "rooms_per_accommodation": 2, "bookings": 300}
+REFERENCE_DATE = date(2025, 6, 1)
+
+
+class DataSeederTest(TestCase):
+    def seed(self, seed: int = 7) -> DataSeeder:
+        seeder = DataSeeder(dict(COUNTS), seed=seed, batch_size=50, reference_date=REFERENCE_DATE, log=lambda _: None)
+        seeder.run()
+        return seeder
+
+    def snapshot(self, seeder: DataSeeder) -> dict:
+        # id 기준값(base)을 뺀 상대 값으로 비교한다
+        return {
+            "users": list(
+                User.objects.filter(pk__gte=seeder.user_base)
+                .order_by("pk")
+                .values_list("first_name", "last_name", "phone_number", "user_type")
+            ),
+            "rooms": list(
+                Room.objects.filter(pk__gte=seeder.room_base).order_by("pk").values_list("name", "price", "option_ids")
+            ),
+            "bookings": sorted(
+                (guest_id - seeder.user_base, room_id - seeder.room_base, check_in, total_price, status)
+                for guest_id, room_id, check_in, total_price, status in Booking.objects.values_list(
+                    "guest_id", "room_id", "check_in_datetime", "total_price", "status"
+                )
+            ),
+        }
+
+    def delete_seeded(self, seeder: DataSeeder) -> None:
+        Booking.objects.all().delete()
+        Accommodation.objects.filter(pk__gte=seeder.accommodation_base).delete()
+        User.objects.filter(pk__gte=seeder.user_base).delete()
+
+    def test_seeds_requested_counts_and_derived_tables(self):
+        # when
+        seeder = self.seed()
+
+        # then
+        self.assertEqual(User.objects.filter(pk__gte=seeder.user_base).count(), 44)
+        self.assertEqual(Room.objects.count(), 12)
+        self.assertEqual(Booking.objects.count(), 300)
+        self.assertEqual(AccommodationCard.objects.count(), 6)
+        self.assertTrue(RoomNightInventory.objects.exists())
+        # 부대시설은 연결마다 만들지 않고 기본 목록을 공유한다
+        self.assertFalse(Amenity.objects.filter(is_custom=True).exists())
+        for room in Room.objects.all():
+            options = sorted(RoomOption.objects.filter(room=room).values_list("option_id", flat=True))
+            self.assertEqual(room.option_ids, options)
+        # 어떤 날짜도 객실 재고보다 많이 팔지 않는다
+        self.assertFalse(
+            RoomNightInventory.objects.filter(nights_sold__gt=F("room__roominventory__count_room")).exists()
+        )
+        # 기준일 이후 예약은 완료 상태가 아니다
+        self.assertFalse(
+            Booking.objects.filter(check_in_datetime__date__gt=REFERENCE_DATE, status="completed").exists()
+        )
+        # 새로 만든 행이 직접 넣은 id 와 겹치지 않는다 (sequence 재설정)
+        user = User.objects.create_superuser(email="after-seed@test.com", password="test123")
+        self.assertGreater(user.pk, seeder.user_base + 43)
+
+    def test_same_seed_reproduces_the_same_rows(self):
+        # given
+        first = self.seed(seed=7)
+        expected = self.snapshot(first)
+        self.delete_seeded(first)
+
+        # when
+        second = self.seed(seed=7)
+
+        # then
+        self.assertEqual(self.snapshot(second), expected)
+        self.delete_seeded(second)
+        self.assertNotEqual(self.snapshot(self.seed(seed=8))["bookings"], expected["bookings"])
+
+    def test_command_accepts_scale_overrides(self):
+        # when
+        call_command(
+            "generate_data",
+            "--accommodations=2",
+            "--guests=5",
+            "--hosts=1",
+            "--bookings=10",
+            "--reference-date=2025-06-01",
+            stdout=StringIO(),
+        )
+
+        # then
+        self.assertEqual(Accommodation.objects.count(), 2)
+        self.assertEqual(Booking.objects.count(), 10)
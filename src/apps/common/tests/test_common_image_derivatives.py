@@ -0,0 +1,143 @@
+import shutil
+import tempfile
+from io import BytesIO
+
+from django.core.cache import cache, caches
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db.models.fields.files import FieldFile
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from PIL import Image
+
+from apps.accommodations.models import Accommodation, Accommodation_Image
+from apps.common.util.image_derivatives import (
+    IMAGE_DERIVATIVE_SIZES,
+    build_derivatives,
+    derivative_name,
+    select_image,
+)
+from apps.users.models import BusinessUser, User
+
+
+def make_image(size=(2400, 1200), mode="RGBA", image_format="PNG") -> bytes:
+    buffer = BytesIO()
+    Image.new(mode, size, (200, 80, 40, 128) if mode == "RGBA" else (200, 80, 40)).save(buffer, image_format)
+    return buffer.getvalue()
+
+
+class ImageDerivativeBuildTest(SimpleTestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.storage = FileSystemStorage(location=self.media_root)
+
+    def tearDown(self):
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def test_builds_every_size_in_webp_and_jpeg_with_dimensions(self):
+        # given
+        name = self.storage.save("room_images/photo.png", ContentFile(make_image()))
+        field_file = FieldFile(None, Accommodation_Image._meta.get_field("image"), name)
+        field_file.storage = self.storage
+
+        # when
+        derivatives = build_derivatives(field_file)
+
+        # then
+        self.assertEqual(derivatives["source"], name)
+        self.assertEqual(derivatives["original"], {"width": 2400, "height": 1200})
+        for size, max_side in IMAGE_DERIVATIVE_SIZES.items():
+            variant = derivatives[size]
+            self.assertEqual((variant["width"], variant["height"]), (max_side, max_side // 2))
+            self.assertEqual(variant["webp"], derivative_name(name, size, "webp"))
+            with self.storage.open(variant["jpeg"]) as file:
+                jpeg = Image.open(file)
+                self.assertEqual((jpeg.format, jpeg.mode, jpeg.size), ("JPEG", "RGB", (max_side, max_side // 2)))
+
+    def test_small_original_is_not_upscaled(self):
+        # given
+        name = self.storage.save("room_images/small.jpg", ContentFile(make_image((200, 100), "RGB", "JPEG")))
+        field_file = FieldFile(None, Accommodation_Image._meta.get_field("image"), name)
+        field_file.storage = self.storage
+
+        # when
+        derivatives = build_derivatives(field_file)
+
+        # then
+        self.assertEqual((derivatives["full"]["width"], derivatives["full"]["height"]), (200, 100))
+
+    def test_select_image_falls_back_to_original_until_derivatives_exist(self):
+        derivatives = {"card": {"width": 720, "height": 360, "webp": "a_card.webp", "jpeg": "a_card.jpg"}}
+
+        self.assertEqual(select_image("a.png", {}, "card"), "a.png")
+        self.assertEqual(select_image("a.png", derivatives, "card"), "a_card.webp")
+        self.assertEqual(select_image("a.png", derivatives, "card", "jpeg"), "a_card.jpg")
+        self.assertEqual(select_image("a.png", derivatives, "thumbnail"), "a.png")
+        self.assertIsNone(select_image("", derivatives, "card"))
+
+
+class ImageDerivativePipelineTest(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+        cache.clear()
+        caches["catalog"].clear()
+        user = User.objects.create_superuser(email="derivative@test.com", password="test123")
+        self.accommodation = Accommodation.objects.create(host=BusinessUser.objects.create(user=user), name="hotel")
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def test_upload_generates_derivatives_after_commit_and_feed_uses_thumbnail(self):
+        # when - 테스트 설정은 CELERY_TASK_ALWAYS_EAGER 이므로 커밋 후 예약한 task 가 바로 실행된다
+        with self.captureOnCommitCallbacks(execute=True):
+            image = Accommodation_Image.objects.create(
+                accommodation=self.accommodation,
+                image=SimpleUploadedFile("photo.png", make_image(), content_type="image/png"),
+                is_representative=True,
+            )
+
+        # then
+        image.refresh_from_db()
+        self.assertEqual(image.derivatives["source"], image.image.name)
+        self.accommodation.card.refresh_from_db()
+        self.assertEqual(self.accommodation.card.representative_image_derivatives, image.derivatives)
+
+        response = self.client.get(reverse("pages:main_list"))
+        self.assertEqual(response.data["results"][0]["hotel_img"], image.derivatives["thumbnail"]["webp"])
+        response = self.client.get(reverse("pages:main_list"), {"image_format": "jpeg"})
+        self.assertEqual(response.data["results"][0]["hotel_img"], image.derivatives["thumbnail"]["jpeg"])
+
+    def test_unreadable_upload_keeps_original(self):
+        # when
+        with self.captureOnCommitCallbacks(execute=True):
+            image = Accommodation_Image.objects.create(
+                accommodation=self.accommodation,
+                image=SimpleUploadedFile("broken.jpg", b"not an image", content_type="image/jpeg"),
+            )
+
+        # then
+        image.refresh_from_db()
+        self.assertEqual(image.derivatives, {})
+
+    def test_adopted_direct_upload_is_saved_even_if_derivatives_fail(self):
+        # given - presigned 로 올라온(아직 content-addressed 이름이 아닌) 이미지
+        name = FileSystemStorage(location=self.media_root).save(
+            "uploads/accommodation_image/upload.jpg", ContentFile(b"not an image")
+        )
+
+        # when
+        with self.captureOnCommitCallbacks(execute=True):
+            image = Accommodation_Image.objects.create(accommodation=self.accommodation, image=name)
+
+        # then - 옮긴 경로가 save() 되어 숙소 카드도 지워진 업로드 파일이 아닌 새 경로를 가리킨다
+        image.refresh_from_db()
+        self.assertFalse(image.image.name.startswith("uploads/"))
+        self.assertTrue(image.image.storage.exists(image.image.name))
+        self.assertFalse(image.image.storage.exists(name))
+        self.assertEqual(image.derivatives, {"source": image.image.name})
+        self.accommodation.card.refresh_from_db()
+        self.assertEqual(self.accommodation.card.representative_image, image.image.name)
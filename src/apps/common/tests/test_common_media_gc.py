@@ -0,0 +1,133 @@
+import os
+import shutil
+import tempfile
+import time
+from datetime import timedelta
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.base import ContentFile
+from django.core.files.storage import storages
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.accommodations.models import Accommodation, Accommodation_Image
+from apps.common.models import PendingUpload, StoredBlob
+from apps.common.tasks import delete_storage_files
+from apps.common.util.media_gc import MediaGCService
+from apps.users.models import BusinessUser, User
+
+DAY = 60 * 60 * 24
+
+
+class MediaGCTest(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+        self.storage = storages["images"]
+        self.user = User.objects.create_superuser(email="gc@test.com", password="test123")
+        self.accommodation = Accommodation.objects.create(
+            host=BusinessUser.objects.create(user=self.user), name="hotel"
+        )
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def write(self, name: str, age: int = 2 * DAY) -> str:
+        path = os.path.join(self.media_root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as file:
+            file.write(b"bytes of " + name.encode())
+        mtime = time.time() - age
+        os.utime(path, (mtime, mtime))
+        return name
+
+    def age(self, name: str) -> str:
+        mtime = time.time() - 2 * DAY
+        os.utime(self.storage.path(name), (mtime, mtime))
+        StoredBlob.objects.filter(name=name).update(updated_at=timezone.now() - timedelta(days=2))
+        return name
+
+    def test_deletes_only_old_unreferenced_files_under_managed_prefixes(self):
+        # given
+        image = Accommodation_Image.objects.create(
+            accommodation=self.accommodation,
+            image=SimpleUploadedFile("a.jpg", b"referenced", content_type="image/jpeg"),
+        )
+        referenced = self.age(image.image.name)
+        leaked_blob = self.age(self.storage.save("b.jpg", ContentFile(b"leaked reference")))
+        legacy_orphan = self.write("room_images/old.jpg")
+        recent_orphan = self.write("room_images/new.jpg", age=60)
+        unmanaged = self.write("exports/report.csv")
+        PendingUpload.objects.create(
+            user=self.user,
+            purpose="room_image",
+            name=self.write("uploads/room_image/expired.jpg"),
+            content_type="image/jpeg",
+            size=10,
+            expires_at=timezone.now() - timedelta(days=2),
+        )
+
+        # when
+        dry_run = MediaGCService.collect(dry_run=True, min_age=DAY)
+
+        # then - 아무것도 지우지 않고 개수만 보고한다
+        self.assertEqual((dry_run["scanned"], dry_run["orphans"], dry_run["deleted"]), (5, 3, 0))
+        self.assertEqual(dry_run["expired_uploads"], 1)
+        self.assertTrue(self.storage.exists(leaked_blob))
+
+        # when
+        stats = MediaGCService.collect(min_age=DAY)
+
+        # then
+        self.assertEqual((stats["orphans"], stats["deleted"], stats["failed"]), (3, 3, 0))
+        self.assertGreater(stats["files_per_second"], 0)
+        for name in (leaked_blob, legacy_orphan, "uploads/room_image/expired.jpg"):
+            self.assertFalse(self.storage.exists(name), name)
+        for name in (referenced, recent_orphan, unmanaged):
+            self.assertTrue(self.storage.exists(name), name)
+        self.assertFalse(StoredBlob.objects.filter(name=leaked_blob).exists())
+        self.assertFalse(PendingUpload.objects.exists())
+
+    def test_recently_reacquired_blob_is_kept(self):
+        # given - 스캔 전에 같은 내용이 다시 올라와 참조 수가 갱신된 blob
+        name = self.age(self.storage.save("c.jpg", ContentFile(b"shared")))
+        self.storage.save("d.jpg", ContentFile(b"shared"))
+        os.utime(self.storage.path(name), (time.time() - 2 * DAY, time.time() - 2 * DAY))
+
+        # when
+        stats = MediaGCService.collect(min_age=DAY)
+
+        # then
+        self.assertEqual((stats["orphans"], stats["deleted"]), (1, 0))
+        self.assertTrue(self.storage.exists(name))
+
+    def test_deleting_image_rows_releases_files_through_queue_after_commit(self):
+        # given
+        image = Accommodation_Image.objects.create(
+            accommodation=self.accommodation, image=SimpleUploadedFile("e.jpg", b"to delete", content_type="image/jpeg")
+        )
+        name = image.image.name
+
+        # when - 테스트 설정은 CELERY_TASK_ALWAYS_EAGER 이므로 커밋 후 넣은 task 가 바로 실행된다
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            self.accommodation.images.all().delete()
+
+        # then - 커밋 전에는 파일이 남아 있다
+        self.assertTrue(self.storage.exists(name))
+        for callback in callbacks:
+            callback()
+        self.assertFalse(self.storage.exists(name))
+        self.assertFalse(StoredBlob.objects.filter(name=name).exists())
+
+    def test_missing_media_root_fails_instead_of_scanning_nothing(self):
+        # given - 미디어 볼륨을 마운트하지 않은 worker
+        shutil.rmtree(self.media_root)
+
+        # when / then
+        with self.assertRaises(ImproperlyConfigured):
+            MediaGCService.collect(min_age=DAY)
+        with self.assertRaises(ImproperlyConfigured):
+            delete_storage_files("images", ["blobs/00/00/missing.jpg"])
@@ -0,0 +1,75 @@
+import asyncio
+
+from django.test import SimpleTestCase, override_settings
+from rest_framework.exceptions import ValidationError
+
+from apps.common.util.email.services.otp_service import OTPService
+from apps.common.util.redis_client import (
+    acompare_and_delete,
+    compare_and_delete,
+    get_async_redis_client,
+    get_many,
+    get_redis_client,
+    reset_redis_client,
+    set_many,
+)
+
+
+@override_settings(REDIS_CLIENT={"IN_MEMORY": True})
+class RedisClientTest(SimpleTestCase):
+    def setUp(self):
+        reset_redis_client()
+        self.client = get_redis_client()
+
+    def tearDown(self):
+        reset_redis_client()
+
+    def test_compare_and_delete_only_deletes_matching_value(self):
+        # given
+        self.client.set("otp:a@test.com", "123456", ex=60)
+
+        # when
+        mismatch = compare_and_delete("otp:a@test.com", "000000")
+        match = compare_and_delete("otp:a@test.com", "123456")
+
+        # then
+        self.assertFalse(mismatch)
+        self.assertTrue(match)
+        self.assertIsNone(self.client.get("otp:a@test.com"))
+
+    def test_set_many_and_get_many(self):
+        # when
+        set_many({"a": 1, "b": "two"}, ex=60)
+
+        # then
+        self.assertEqual(get_many(["a", "b", "c"]), {"a": b"1", "b": b"two", "c": None})
+        self.assertGreater(self.client.ttl("a"), 0)
+
+    def test_async_client_shares_store(self):
+        # given
+        self.client.set("token", "value")
+
+        # when
+        async def run():
+            value = await get_async_redis_client().get("token")
+            deleted = await acompare_and_delete("token", "value")
+            return value, deleted
+
+        value, deleted = asyncio.run(run())
+
+        # then
+        self.assertEqual(value, b"value")
+        self.assertTrue(deleted)
+        self.assertIsNone(self.client.get("token"))
+
+    def test_verify_otp_consumes_code_once(self):
+        # given
+        self.client.set("otp:b@test.com", "654321", ex=60)
+        service = OTPService()
+
+        # when
+        service.verify_otp("b@test.com", "654321")
+
+        # then
+        with self.assertRaises(ValidationError):
+            service.verify_otp("b@test.com", "654321")
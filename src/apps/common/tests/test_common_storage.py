@@ -0,0 +1,81 @@
+import shutil
+import tempfile
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.test import TestCase
+
+from apps.common.models import StoredBlob
+from apps.common.storage import ContentAddressedFileSystemStorage
+
+
+class ContentAddressedStorageTest(TestCase):
+    def setUp(self):
+        self.location = tempfile.mkdtemp()
+        self.storage = ContentAddressedFileSystemStorage(location=self.location)
+
+    def tearDown(self):
+        shutil.rmtree(self.location, ignore_errors=True)
+
+    def test_names_files_by_content_hash_in_sharded_directories(self):
+        # when
+        name = self.storage.save("room_images/Photo.JPG", ContentFile(b"photo bytes"))
+
+        # then
+        digest = ContentAddressedFileSystemStorage.hash_content(ContentFile(b"photo bytes"))
+        self.assertEqual(name, f"blobs/{digest[:2]}/{digest[2:4]}/{digest}.jpg")
+        self.assertTrue(self.storage.is_content_addressed(name))
+        self.assertFalse(self.storage.is_content_addressed("room_images/photo.jpg"))
+        with self.storage.open(name) as file:
+            self.assertEqual(file.read(), b"photo bytes")
+
+    def test_duplicate_uploads_share_one_file_until_last_reference_is_released(self):
+        # given - 같은 사진을 세 객실에 올림
+        names = [self.storage.save(f"room_images/{i}.jpg", ContentFile(b"same photo")) for i in range(3)]
+        other = self.storage.save("room_images/other.jpg", ContentFile(b"other photo"))
+
+        # then
+        self.assertEqual(len(set(names)), 1)
+        self.assertEqual(StoredBlob.objects.get(name=names[0]).ref_count, 3)
+
+        # when
+        self.storage.delete(names[0])
+        self.storage.delete(names[0])
+
+        # then - 참조가 남아 있으면 파일을 유지
+        self.assertTrue(self.storage.exists(names[0]))
+        self.assertEqual(StoredBlob.objects.get(name=names[0]).ref_count, 1)
+
+        # when
+        self.storage.delete(names[0])
+
+        # then
+        self.assertFalse(self.storage.exists(names[0]))
+        self.assertFalse(StoredBlob.objects.filter(name=names[0]).exists())
+        self.assertTrue(self.storage.exists(other))
+
+    def test_untracked_legacy_file_is_deleted_immediately(self):
+        # given - content-addressed storage 도입 전 평평한 디렉터리에 저장된 파일
+        legacy = FileSystemStorage(location=self.location).save("room_images/legacy.jpg", ContentFile(b"legacy"))
+
+        # when
+        self.storage.delete(legacy)
+
+        # then
+        self.assertFalse(self.storage.exists(legacy))
+
+    def test_file_is_rewritten_when_blob_row_was_recreated(self):
+        # given - 참조가 0 이 되어 행은 지워졌지만 파일 삭제가 끝나지 않아 (깨진) 파일이 남은 상태
+        name = self.storage.save("room_images/photo.jpg", ContentFile(b"photo bytes"))
+        StoredBlob.objects.filter(name=name).delete()
+        with open(self.storage.path(name), "wb") as file:
+            file.write(b"partial")
+
+        # when
+        saved = self.storage.save("room_images/again.jpg", ContentFile(b"photo bytes"))
+
+        # then - 같은 이름으로 파일을 다시 쓰고 참조를 새로 기록한다
+        self.assertEqual(saved, name)
+        self.assertEqual(StoredBlob.objects.get(name=name).ref_count, 1)
+        with self.storage.open(name) as file:
+            self.assertEqual(file.read(), b"photo bytes")
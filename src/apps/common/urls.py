@@ -0,0 +1,9 @@
+from django.urls import path
+
+from apps.common.views import DirectUploadCreateView
+
+app_name = "common"
+
+urlpatterns = [
+    path("uploads/", DirectUploadCreateView.as_view(), name="direct-upload-create"),
+]
@@ -0,0 +1,494 @@
+"""
+대량 시드 데이터 생성 (generate_data 명령, 벤치마크 데이터셋)
+
+- 모든 행은 (seed, 단계, chunk 번호) 로 만든 난수로 생성한다 - worker 수와 관계없이 같은 seed 는 같은 데이터를 만든다
+- 다른 행이 참조하는 행(User, BusinessUser, Accommodation, Room)은 id 를 직접 정해 chunk 끼리 서로 기다리지 않는다
+- bulk_create 는 signal 을 보내지 않으므로 파생 테이블(객실 달력, 숙소 카드)은 마지막에 한 번에 다시 만든다
+- 예약은 월/요일 가중치(성수기, 주말)와 예약 곡선(먼 미래일수록 적다)으로 체크인 날짜를 뽑는다
+"""
+
+import logging
+import random
+import time
+from collections import Counter
+from datetime import date, datetime
+from datetime import time as dt_time
+from datetime import timedelta
+from functools import lru_cache
+from itertools import accumulate
+from multiprocessing import get_context
+from typing import Callable, Optional
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.gis.geos import Point
+from django.core.cache import caches
+from django.core.management.color import no_style
+from django.db import connection, connections, transaction
+from django.db.models import Max
+from django.utils import timezone
+from faker import Faker
+
+from apps.accommodations.models import Accommodation, AccommodationType, GPS_Info
+from apps.accommodations.services.accommodation_card_service import (
+    AccommodationCardService,
+)
+from apps.amenities.models import AccommodationAmenity, Amenity, Option, RoomOption
+from apps.bookings.models import Booking
+from apps.bookings.services.room_calendar_service import RoomCalendarService
+from apps.common.choices import (
+    ACCOMMODATION_TYPE_CHOICES,
+    AMENITY_CHOICES_BY_CATEGORY,
+    OPTION_CHOICES_BY_CATEGORY,
+    ROOM_TYPE_CHOICES,
+)
+from apps.common.constants.booking_constants import RELEASED_BOOKING_STATUSES
+from apps.rooms.models import Room, RoomInventory, RoomType
+from apps.users.models import BusinessUser, User
+
+logger = logging.getLogger(__name__)
+
+SEED_SCALES = {
+    "small": {"guests": 1_000, "hosts": 50, "accommodations": 200, "rooms_per_accommodation": 3, "bookings": 5_000},
+    "medium": {
+        "guests": 20_000,
+        "hosts": 1_000,
+        "accommodations": 5_000,
+        "rooms_per_accommodation": 4,
+        "bookings": 200_000,
+    },
+    "large": {
+        "guests": 200_000,
+        "hosts": 10_000,
+        "accommodations": 50_000,
+        "rooms_per_accommodation": 5,
+        "bookings": 2_000_000,
+    },
+    "xlarge": {
+        "guests": 1_000_000,
+        "hosts": 50_000,
+        "accommodations": 200_000,
+        "rooms_per_accommodation": 5,
+        "bookings": 10_000_000,
+    },
+}
+
+# chunk 경계가 바뀌면 생성되는 데이터도 바뀌므로 batch 크기와 분리된 고정값
+SEED_CHUNK_SIZE = 5_000
+SEED_PASSWORD = "seed-password"
+
+HISTORY_DAYS = 365  # 기준일 이전 예약 이력
+FUTURE_DAYS = 120  # 기준일 이후 예약
+
+# (도시, 시/도, 경도, 위도, 가중치)
+CITY_CENTERS = [
+    ("서울", "서울특별시", 126.9780, 37.5665, 30),
+    ("부산", "부산광역시", 129.0756, 35.1796, 15),
+    ("제주", "제주특별자치도", 126.5312, 33.4996, 15),
+    ("서귀포", "제주특별자치도", 126.5600, 33.2541, 8),
+    ("강릉", "강원특별자치도", 128.8761, 37.7519, 8),
+    ("속초", "강원특별자치도", 128.5918, 38.2070, 5),
+    ("경주", "경상북도", 129.2247, 35.8562, 6),
+    ("여수", "전라남도", 127.6622, 34.7604, 5),
+    ("전주", "전북특별자치도", 127.1480, 35.8242, 4),
+    ("인천", "인천광역시", 126.7052, 37.4563, 4),
+]
+NAME_WORDS = [
+    "바다",
+    "숲",
+    "하늘",
+    "별빛",
+    "노을",
+    "소나무",
+    "파도",
+    "달빛",
+    "한옥",
+    "정원",
+    "호수",
+    "언덕",
+    "온천",
+    "포레스트",
+]
+TYPE_LABELS = {
+    "hotel": "호텔",
+    "resort": "리조트",
+    "pension": "펜션",
+    "guesthouse": "게스트하우스",
+    "hostel": "호스텔",
+    "motel": "모텔",
+}
+ROOM_NAMES = [
+    "스탠다드 더블",
+    "스탠다드 트윈",
+    "디럭스 더블",
+    "디럭스 트윈",
+    "패밀리",
+    "스위트",
+    "온돌",
+    "오션뷰 디럭스",
+]
+
+# 성수기(7-8월, 연말연시)와 금/토 체크인이 많다
+MONTH_WEIGHTS = (1.1, 0.8, 0.8, 1.0, 1.1, 1.0, 1.5, 1.7, 1.0, 1.2, 0.8, 1.2)
+WEEKDAY_WEIGHTS = (0.8, 0.8, 0.85, 0.9, 1.3, 1.5, 1.0)
+PEAK_MONTHS = (7, 8, 12)
+STAY_NIGHTS = ((1, 2, 3, 4, 5, 7), (45, 28, 12, 6, 4, 2))
+BOOKING_ATTEMPTS = 10  # 만실인 날짜에 걸린 예약을 다시 뽑는 횟수 (모두 만실이면 건너뛴다)
+CHECK_IN_TIMES = (dt_time(15), dt_time(15), dt_time(16))
+CHECK_OUT_TIMES = (dt_time(11), dt_time(11), dt_time(12))
+
+# fork 한 worker process 가 사용하는 seeder (Pool 로 seeder 를 pickle 해서 넘기지 않는다)
+_worker_seeder: Optional["DataSeeder"] = None
+
+
+def run_worker_chunk(task: tuple[str, int]) -> int:
+    assert _worker_seeder is not None
+    return _worker_seeder.run_chunk(task)
+
+
+@lru_cache
+def get_pools(seed: int) -> dict:
+    """Faker 로 만든 이름/주소 후보 (seed 마다 한 번) - 행마다 Faker 를 부르지 않고 후보에서 고른다"""
+    fake = Faker("ko_KR")
+    fake.seed_instance(seed)
+    return {
+        "first_names": [fake.first_name() for _ in range(300)],
+        "last_names": [fake.last_name() for _ in range(100)],
+        "streets": [fake.street_name() for _ in range(500)],
+        "texts": [fake.text(max_nb_chars=300) for _ in range(200)],
+    }
+
+
+def get_seed_counts(scale: str, **overrides) -> dict:
+    counts = dict(SEED_SCALES[scale])
+    counts.update({key: value for key, value in overrides.items() if value is not None})
+    return counts
+
+
+class DataSeeder:
+    """
+    seeder = DataSeeder(get_seed_counts("large"), seed=42)
+    seeder.run(workers=4)
+    """
+
+    PHASES = ("users", "accommodations", "rooms", "bookings")
+
+    def __init__(
+        self,
+        counts: dict,
+        seed: int = 0,
+        batch_size: int = 2_000,
+        reference_date: Optional[date] = None,
+        log: Callable[[str], None] = logger.info,
+    ):
+        self.counts = counts
+        self.seed = seed
+        self.batch_size = batch_size
+        self.reference_date = reference_date or timezone.localdate()
+        self.log = log
+        self.start_date = self.reference_date - timedelta(days=HISTORY_DAYS)
+        self.day_cum_weights = list(accumulate(self.day_weight(day) for day in range(HISTORY_DAYS + FUTURE_DAYS)))
+        self.host_cum_weights = list(accumulate(1 / (rank + 1) ** 0.8 for rank in range(counts["hosts"])))
+
+    # 준비 --------------------------------------------------------------
+
+    def day_weight(self, day: int) -> float:
+        current = self.start_date + timedelta(days=day)
+        weight = MONTH_WEIGHTS[current.month - 1] * WEEKDAY_WEIGHTS[current.weekday()]
+        days_ahead = (current - self.reference_date).days
+        if days_ahead > 0:
+            # 먼 미래 날짜일수록 아직 예약이 덜 찼다
+            weight *= max(0.1, 1 - days_ahead / FUTURE_DAYS)
+        return weight
+
+    def rng(self, phase: str, chunk: int) -> random.Random:
+        return random.Random(f"{self.seed}:{phase}:{chunk}")
+
+    @staticmethod
+    def next_id(model) -> int:
+        return (model.objects.aggregate(max_id=Max("id"))["max_id"] or 0) + 1
+
+    @staticmethod
+    def ensure_catalog(model, choices_by_category: dict) -> list[int]:
+        """기본 부대시설/옵션 목록 - 이미 있으면 재사용한다 (연결마다 새 행을 만들지 않는다)"""
+        existing = {(row.category, row.name): row.pk for row in model.objects.filter(is_custom=False)}
+        missing = [
+            model(name=name, category=category, is_custom=False)
+            for category, choices in choices_by_category.items()
+            for name, _ in choices
+            if (category, name) not in existing
+        ]
+        model.objects.bulk_create(missing)
+        return sorted(model.objects.filter(is_custom=False).values_list("pk", flat=True))
+
+    def prepare(self) -> None:
+        self.user_base = self.next_id(User)
+        self.business_base = self.next_id(BusinessUser)
+        self.accommodation_base = self.next_id(Accommodation)
+        self.room_base = self.next_id(Room)
+        self.amenity_ids = self.ensure_catalog(Amenity, AMENITY_CHOICES_BY_CATEGORY)
+        self.option_ids = self.ensure_catalog(Option, OPTION_CHOICES_BY_CATEGORY)
+        # 모든 시드 사용자가 같은 비밀번호 hash 를 쓴다 (행마다 PBKDF2 를 돌리지 않는다)
+        self.password = make_password(SEED_PASSWORD, salt=f"seed{self.seed}")
+        get_pools(self.seed)
+
+    def tasks(self, phase: str) -> list[tuple[str, int]]:
+        total = {
+            "users": self.counts["hosts"] + self.counts["guests"],
+            "accommodations": self.counts["accommodations"],
+            "rooms": self.counts["accommodations"],
+            "bookings": self.counts["accommodations"] * self.counts["rooms_per_accommodation"],
+        }[phase]
+        return [(phase, chunk) for chunk in range((total + SEED_CHUNK_SIZE - 1) // SEED_CHUNK_SIZE)]
+
+    # 실행 --------------------------------------------------------------
+
+    def run(self, workers: int = 1) -> dict:
+        started = time.perf_counter()
+        self.prepare()
+        totals: dict[str, float] = {}
+        for phase in self.PHASES:
+            phase_started = time.perf_counter()
+            rows = self.run_phase(phase, workers)
+            elapsed = time.perf_counter() - phase_started
+            totals[phase] = rows
+            self.log(f"{phase}: {rows:,} rows in {elapsed:.1f}s ({rows / elapsed if elapsed else 0:,.0f} rows/s)")
+
+        self.finish()
+        totals["elapsed"] = round(time.perf_counter() - started, 1)
+        return totals
+
+    def run_phase(self, phase: str, workers: int) -> int:
+        tasks = self.tasks(phase)
+        if workers <= 1 or len(tasks) <= 1:
+            return sum(self.run_chunk(task) for task in tasks)
+
+        global _worker_seeder
+        _worker_seeder = self
+        # fork 한 process 가 부모의 DB 연결을 같이 쓰지 않도록 닫고 시작한다 (각 process 가 새로 연결)
+        connections.close_all()
+        try:
+            with get_context("fork").Pool(workers) as pool:
+                return sum(pool.imap_unordered(run_worker_chunk, tasks))
+        finally:
+            _worker_seeder = None
+
+    def run_chunk(self, task: tuple[str, int]) -> int:
+        phase, chunk = task
+        with transaction.atomic():
+            return getattr(self, f"seed_{phase}")(chunk, self.rng(phase, chunk), get_pools(self.seed))
+
+    def finish(self) -> None:
+        # id 를 직접 넣었으므로 sequence 를 최댓값 뒤로 옮긴다
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), [User, BusinessUser, Accommodation, Room]):
+                cursor.execute(sql)
+
+        started = time.perf_counter()
+        nights = RoomCalendarService.rebuild()
+        cards = AccommodationCardService.rebuild(batch_size=self.batch_size)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        caches["catalog"].clear()
+        self.log(f"{nights:,} room nights, {cards:,} cards rebuilt in {time.perf_counter() - started:.1f}s")
+
+    def chunk_range(self, chunk: int, total: int) -> range:
+        return range(chunk * SEED_CHUNK_SIZE, min((chunk + 1) * SEED_CHUNK_SIZE, total))
+
+    @staticmethod
+    def phone(rng: random.Random) -> str:
+        return f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}"
+
+    # 단계별 생성 ------------------------------------------------------------
+
+    def seed_users(self, chunk: int, rng: random.Random, pools: dict) -> int:
+        hosts = self.counts["hosts"]
+        users, business_users = [], []
+        for index in self.chunk_range(chunk, hosts + self.counts["guests"]):
+            pk = self.user_base + index
+            is_host = index < hosts
+            users.append(
+                User(
+                    id=pk,
+                    email=f"user{pk}@example.com",
+                    password=self.password,
+                    first_name=rng.choice(pools["first_names"]),
+                    last_name=rng.choice(pools["last_names"]),
+                    phone_number=self.phone(rng),
+                    gender=rng.choice(("male", "female", "other")),
+                    birth_date=date(1960, 1, 1) + timedelta(days=rng.randint(0, 365 * 45)),
+                    user_type="host" if is_host else "guest",
+                    social_login=rng.choices(("none", "google", "facebook", "twitter"), (70, 20, 7, 3))[0],
+                    verified_email=rng.random() < 0.9,
+                    is_active=rng.random() < 0.97,
+                )
+            )
+            if is_host:
+                city, state, *_ = rng.choices(CITY_CENTERS, [center[4] for center in CITY_CENTERS])[0]
+                business_users.append(
+                    BusinessUser(
+                        id=self.business_base + index,
+                        user_id=pk,
+                        business_number=f"{rng.randint(100, 999)}-{rng.randint(10, 99)}-{rng.randint(10000, 99999)}",
+                        business_document="business_documents/seed.pdf",
+                        business_email=f"host{pk}@example.com",
+                        business_phonenumber=self.phone(rng),
+                        business_address=f"{state} {city} {rng.choice(pools['streets'])} {rng.randint(1, 300)}",
+                        verification_status=rng.choices(("approved", "pending", "in_review"), (85, 10, 5))[0],
+                    )
+                )
+        User.objects.bulk_create(users, batch_size=self.batch_size)
+        BusinessUser.objects.bulk_create(business_users, batch_size=self.batch_size)
+        return len(users) + len(business_users)
+
+    def seed_accommodations(self, chunk: int, rng: random.Random, pools: dict) -> int:
+        accommodations, types, gps_infos = [], [], []
+        amenities: list[AccommodationAmenity] = []
+        host_ranks = range(self.counts["hosts"])
+        for index in self.chunk_range(chunk, self.counts["accommodations"]):
+            pk = self.accommodation_base + index
+            city, state, longitude, latitude, _ = rng.choices(CITY_CENTERS, [center[4] for center in CITY_CENTERS])[0]
+            type_name = rng.choices([choice[0] for choice in ACCOMMODATION_TYPE_CHOICES])[0]
+            road_name = rng.choice(pools["streets"])
+            label = TYPE_LABELS.get(type_name, type_name)
+            # 소수의 호스트가 많은 숙소를 운영한다 (zipf 분포)
+            host_rank = rng.choices(host_ranks, cum_weights=self.host_cum_weights)[0]
+            accommodations.append(
+                Accommodation(
+                    id=pk,
+                    host_id=self.business_base + host_rank,
+                    name=f"{city} {rng.choice(NAME_WORDS)} {label}",
+                    phone_number=self.phone(rng),
+                    description=f"{city} {road_name} 근처의 {label}입니다. {rng.choice(pools['texts'])}",
+                    rules=rng.choice(pools["texts"]),
+                    is_active=rng.random() < 0.95,
+                )
+            )
+            types.append(AccommodationType(accommodation_id=pk, type_name=type_name))
+            gps_infos.append(
+                GPS_Info(
+                    accommodation_id=pk,
+                    city=city,
+                    states=state,
+                    road_name=road_name,
+                    address=f"{state} {city} {road_name} {rng.randint(1, 300)}",
+                    location=Point(longitude + rng.gauss(0, 0.05), latitude + rng.gauss(0, 0.04), srid=4326),
+                )
+            )
+            amenities.extend(
+                AccommodationAmenity(accommodation_id=pk, amenity_id=amenity_id)
+                for amenity_id in rng.sample(self.amenity_ids, min(rng.randint(3, 12), len(self.amenity_ids)))
+            )
+        Accommodation.objects.bulk_create(accommodations, batch_size=self.batch_size)
+        AccommodationType.objects.bulk_create(types, batch_size=self.batch_size)
+        GPS_Info.objects.bulk_create(gps_infos, batch_size=self.batch_size)
+        AccommodationAmenity.objects.bulk_create(amenities, batch_size=self.batch_size)
+        return len(accommodations) + len(types) + len(gps_infos) + len(amenities)
+
+    def seed_rooms(self, chunk: int, rng: random.Random, pools: dict) -> int:
+        per_accommodation = self.counts["rooms_per_accommodation"]
+        rooms, types, inventories = [], [], []
+        options: list[RoomOption] = []
+        for index in self.chunk_range(chunk, self.counts["accommodations"]):
+            # 숙소 등급에 따라 객실 가격대가 정해진다
+            base_price = rng.lognormvariate(11.3, 0.45)
+            for position in range(per_accommodation):
+                pk = self.room_base + index * per_accommodation + position
+                option_ids = sorted(rng.sample(self.option_ids, min(rng.randint(2, 8), len(self.option_ids))))
+                max_capacity = rng.choice((2, 2, 3, 4, 4, 6))
+                rooms.append(
+                    Room(
+                        id=pk,
+                        accommodation_id=self.accommodation_base + index,
+                        name=rng.choice(ROOM_NAMES),
+                        capacity=min(2, max_capacity),
+                        max_capacity=max_capacity,
+                        price=int(base_price * (1 + 0.25 * position) / 1000) * 1000,
+                        stay_type=rng.random() < 0.9,
+                        description=rng.choice(pools["texts"]),
+                        check_in_time=rng.choice(CHECK_IN_TIMES),
+                        check_out_time=rng.choice(CHECK_OUT_TIMES),
+                        is_available=rng.random() < 0.97,
+                        option_ids=option_ids,
+                    )
+                )
+                types.append(RoomType(room_id=pk, type_name=rng.choice(ROOM_TYPE_CHOICES)[0]))
+                inventories.append(RoomInventory(room_id=pk, count_room=rng.randint(1, 8)))
+                options.extend(RoomOption(room_id=pk, option_id=option_id) for option_id in option_ids)
+        Room.objects.bulk_create(rooms, batch_size=self.batch_size)
+        RoomType.objects.bulk_create(types, batch_size=self.batch_size)
+        RoomInventory.objects.bulk_create(inventories, batch_size=self.batch_size)
+        RoomOption.objects.bulk_create(options, batch_size=self.batch_size)
+        return len(rooms) + len(types) + len(inventories) + len(options)
+
+    def seed_bookings(self, chunk: int, rng: random.Random, pools: dict) -> int:
+        room_total = self.counts["accommodations"] * self.counts["rooms_per_accommodation"]
+        indexes = self.chunk_range(chunk, room_total)
+        rooms = list(
+            Room.objects.filter(id__gte=self.room_base + indexes.start, id__lt=self.room_base + indexes.stop)
+            .order_by("id")
+            .values_list("id", "price", "max_capacity", "check_in_time", "check_out_time", "roominventory__count_room")
+        )
+        # chunk 의 객실 수에 비례해 예약 수를 나눈다 (만실로 건너뛴 예약을 빼면 합계가 --bookings 와 같다)
+        count = (
+            self.counts["bookings"] * indexes.stop // room_total - self.counts["bookings"] * indexes.start // room_total
+        )
+        if not rooms or count <= 0:
+            return 0
+        # 객실마다 인기도가 다르다
+        popularity = list(accumulate(rng.lognormvariate(0, 0.8) for _ in rooms))
+        guests_start = self.user_base + self.counts["hosts"]
+        days = range(HISTORY_DAYS + FUTURE_DAYS)
+        # (객실, 숙박일) 별 판매 수 - 객실은 한 chunk 에만 속하므로 chunk 안에서 세면 충분하다
+        sold: Counter = Counter()
+
+        bookings = []
+        for _ in range(count):
+            for _ in range(BOOKING_ATTEMPTS):
+                room_id, price, max_capacity, check_in_time, check_out_time, count_room = rng.choices(
+                    rooms, cum_weights=popularity
+                )[0]
+                check_in = self.start_date + timedelta(days=rng.choices(days, cum_weights=self.day_cum_weights)[0])
+                nights = rng.choices(*STAY_NIGHTS)[0]
+                if check_in.month in PEAK_MONTHS and rng.random() < 0.3:
+                    nights += 1
+                check_out = check_in + timedelta(days=nights)
+                status = self.booking_status(rng, check_in, check_out)
+                if status in RELEASED_BOOKING_STATUSES:
+                    # 취소/환불된 예약은 재고를 차지하지 않는다
+                    break
+                stay = [(room_id, check_in + timedelta(days=night)) for night in range(nights)]
+                if all(sold[key] < (count_room or 0) for key in stay):
+                    sold.update(stay)
+                    break
+            else:
+                continue
+            season = 1.3 if check_in.month in PEAK_MONTHS else 1.0
+            bookings.append(
+                Booking(
+                    guest_id=guests_start + rng.randrange(self.counts["guests"]),
+                    room_id=room_id,
+                    check_in_datetime=timezone.make_aware(datetime.combine(check_in, check_in_time)),
+                    check_out_datetime=timezone.make_aware(datetime.combine(check_out, check_out_time)),
+                    total_price=int(price * nights * season / 100) * 100,
+                    status=status,
+                    guests_count=rng.randint(1, max_capacity),
+                    booker_name=f"{rng.choice(pools['last_names'])}{rng.choice(pools['first_names'])}",
+                    booker_phone_number=self.phone(rng),
+                )
+            )
+        Booking.objects.bulk_create(bookings, batch_size=self.batch_size)
+        return len(bookings)
+
+    def booking_status(self, rng: random.Random, check_in: date, check_out: date) -> str:
+        roll = rng.random()
+        if roll < 0.07:
+            return "cancelled_by_guest"
+        if roll < 0.08:
+            return "cancelled_by_host"
+        if roll < 0.09:
+            return "refunded"
+        if check_out <= self.reference_date:
+            return "no_show" if rng.random() < 0.02 else "completed"
+        if check_in <= self.reference_date:
+            return "check_in"
+        return rng.choices(("confirmed", "paid", "pending"), (50, 40, 10))[0]
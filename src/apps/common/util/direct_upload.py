@@ -0,0 +1,173 @@
+"""
+presigned URL 직접 업로드
+
+1. 클라이언트가 업로드 URL 을 요청하면(DirectUploadService.create) PendingUpload 를 만들고 presigned POST 를 반환한다
+2. 클라이언트는 파일을 object storage(S3 호환)에 바로 올린다 - gunicorn 워커는 파일 바이트를 받지 않는다
+3. 이미지/서류 API 에 upload_id 를 넘기면(DirectUploadService.confirm) HEAD 로 크기와 Content-Type 을 확인하고 경로를 기록한다
+   이미지는 이후 파생본 task 가 content-addressed 이름으로 옮긴다 (apps.common.storage.adopt_file)
+
+presigned 업로드는 S3 호환 storage(django-storages S3Storage)에서만 사용할 수 있다 (로컬 개발은 MinIO, 테스트는 moto).
+"""
+
+import os
+import uuid
+from datetime import timedelta
+from typing import Iterable, TypedDict
+
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.core.files.storage import storages
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError
+
+from apps.common.models import PendingUpload
+
+# 직접 업로드로 올린 파일은 확인 전까지 이 경로 아래에 둔다
+DIRECT_UPLOAD_PREFIX = "uploads"
+
+IMAGE_CONTENT_TYPES = ("image/jpeg", "image/png", "image/webp", "image/gif")
+
+
+class UploadPurpose(TypedDict):
+    storage: str  # settings.STORAGES alias
+    max_size: int  # bytes
+    content_types: tuple[str, ...]
+
+
+# 용도별 storage alias / 최대 크기 / 허용 Content-Type (기존 multipart 업로드의 검증과 같다)
+UPLOAD_PURPOSES: dict[str, UploadPurpose] = {
+    "accommodation_image": {"storage": "images", "max_size": 10 * 1024 * 1024, "content_types": IMAGE_CONTENT_TYPES},
+    "room_image": {"storage": "images", "max_size": 5 * 1024 * 1024, "content_types": IMAGE_CONTENT_TYPES},
+    "business_document": {
+        "storage": "default",
+        "max_size": 10 * 1024 * 1024,
+        "content_types": ("application/pdf", *IMAGE_CONTENT_TYPES),
+    },
+}
+
+DEFAULT_DIRECT_UPLOAD_SETTINGS = {
+    "EXPIRES_IN": 60 * 10,  # presigned URL 유효 시간(초)
+    "MAX_FILES": 10,  # 한 번에 확인할 수 있는 업로드 수
+}
+
+
+def get_direct_upload_settings() -> dict:
+    return {**DEFAULT_DIRECT_UPLOAD_SETTINGS, **getattr(settings, "DIRECT_UPLOAD", {})}
+
+
+class DirectUploadUnavailable(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Direct upload requires S3 compatible storage."
+    default_code = "direct_upload_unavailable"
+
+
+class DirectUploadService:
+    @staticmethod
+    def get_storage(purpose: str):
+        storage = storages[UPLOAD_PURPOSES[purpose]["storage"]]
+        if not hasattr(storage, "bucket_name"):
+            raise DirectUploadUnavailable()
+        return storage
+
+    @staticmethod
+    def get_key(storage, name: str) -> str:
+        # storage 의 location(키 prefix)을 포함한 실제 object key
+        return storage._normalize_name(name)
+
+    @staticmethod
+    def create(user, purpose: str, filename: str, content_type: str, size: int) -> dict:
+        config = UPLOAD_PURPOSES[purpose]
+        if content_type not in config["content_types"]:
+            raise ValidationError({"content_type": f"{content_type} 은(는) 허용되지 않는 파일 형식입니다."})
+        if size > config["max_size"]:
+            raise ValidationError(
+                {"size": f"파일 크기는 {config['max_size'] // (1024 * 1024)}MB를 초과할 수 없습니다."}
+            )
+
+        storage = DirectUploadService.get_storage(purpose)
+        expires_in = get_direct_upload_settings()["EXPIRES_IN"]
+        upload_id = uuid.uuid4()
+        extension = os.path.splitext(filename)[1].lower()
+        name = f"{DIRECT_UPLOAD_PREFIX}/{purpose}/{upload_id}{extension}"
+
+        # presigned POST 는 크기 범위와 Content-Type 을 조건으로 걸 수 있다 (PUT 은 크기를 제한할 수 없다)
+        presigned = storage.connection.meta.client.generate_presigned_post(
+            Bucket=storage.bucket_name,
+            Key=DirectUploadService.get_key(storage, name),
+            Fields={"Content-Type": content_type},
+            Conditions=[{"Content-Type": content_type}, ["content-length-range", 1, config["max_size"]]],
+            ExpiresIn=expires_in,
+        )
+        PendingUpload.objects.create(
+            id=upload_id,
+            user=user,
+            purpose=purpose,
+            name=name,
+            content_type=content_type,
+            size=size,
+            expires_at=timezone.now() + timedelta(seconds=expires_in),
+        )
+        return {
+            "upload_id": upload_id,
+            "url": presigned["url"],
+            "fields": presigned["fields"],
+            "expires_in": expires_in,
+        }
+
+    @staticmethod
+    def get_upload_ids(data, field: str = "upload_ids") -> list[str]:
+        """요청 데이터(JSON 목록 / multipart 반복 필드 / 단일 값)에서 upload id 목록을 읽는다"""
+        if hasattr(data, "getlist"):
+            values = data.getlist(field)
+        else:
+            values = data.get(field) or []
+        if not isinstance(values, (list, tuple)):
+            values = [values]
+        return [str(value) for value in values if value]
+
+    @staticmethod
+    @transaction.atomic
+    def confirm(user, purpose: str, upload_ids: Iterable) -> list[str]:
+        """업로드가 끝난 파일을 확인하고 storage 이름 목록을 반환 (upload_ids 순서)"""
+        upload_ids = [str(upload_id) for upload_id in upload_ids]
+        try:
+            upload_ids = [str(uuid.UUID(upload_id)) for upload_id in upload_ids]
+        except ValueError:
+            raise ValidationError({"upload_ids": "유효하지 않은 업로드 id 입니다."})
+        # 같은 업로드를 두 번 확인하면 한 파일을 두 행이 가리키게 된다
+        if len(set(upload_ids)) != len(upload_ids):
+            raise ValidationError({"upload_ids": "중복된 업로드 id 가 있습니다."})
+        if len(upload_ids) > get_direct_upload_settings()["MAX_FILES"]:
+            raise ValidationError({"upload_ids": "한 번에 확인할 수 있는 파일 수를 초과했습니다."})
+
+        uploads = {
+            str(upload.pk): upload for upload in PendingUpload.objects.select_for_update().filter(pk__in=upload_ids)
+        }
+        config = UPLOAD_PURPOSES[purpose]
+        storage = DirectUploadService.get_storage(purpose)
+        client = storage.connection.meta.client
+
+        names = []
+        for upload_id in upload_ids:
+            upload = uploads.get(upload_id)
+            if (
+                upload is None
+                or upload.user_id != getattr(user, "pk", None)
+                or upload.purpose != purpose
+                or upload.status != "pending"
+            ):
+                raise ValidationError({"upload_ids": f"유효하지 않은 업로드입니다: {upload_id}"})
+            try:
+                head = client.head_object(
+                    Bucket=storage.bucket_name, Key=DirectUploadService.get_key(storage, upload.name)
+                )
+            except ClientError:
+                raise ValidationError({"upload_ids": f"업로드가 완료되지 않았습니다: {upload_id}"})
+            if head["ContentLength"] > config["max_size"] or head.get("ContentType") != upload.content_type:
+                raise ValidationError({"upload_ids": f"업로드한 파일이 요청과 다릅니다: {upload_id}"})
+            names.append(upload.name)
+
+        PendingUpload.objects.filter(pk__in=upload_ids).update(status="confirmed")
+        return names
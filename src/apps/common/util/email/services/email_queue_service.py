@@ -0,0 +1,202 @@
+import json
+import logging
+import smtplib
+import threading
+import time
+import uuid
+from typing import Optional
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+
+from apps.common.util.redis_client import (
+    compare_and_delete,
+    compare_and_expire,
+    get_redis_client,
+)
+
+logger = logging.getLogger(__name__)
+
+EMAIL_OUTBOX_KEY = "email:outbox"
+# flush 가 outbox 에서 꺼내 보내는 중인 메일 - 보낸 뒤에 지우므로 워커가 죽어도 다음 flush 가 outbox 로 되돌린다
+EMAIL_PROCESSING_KEY = "email:processing"
+# processing list 를 한 번에 하나의 flush 만 다루도록 잡는 lock - 배치를 꺼낼 때마다 만료 시간을 연장한다
+EMAIL_FLUSH_LOCK_KEY = "email:flush_lock"
+FLUSH_LOCK_TIMEOUT = 60 * 5
+# 발송 task 가 예약되어 있는 동안 존재하는 key - 그 사이 들어온 메일은 task 를 다시 예약하지 않는다
+EMAIL_FLUSH_SCHEDULED_KEY = "email:flush_scheduled"
+# 예약한 task 가 유실돼도 이 시간이 지나면 다음 메일이 다시 예약한다
+FLUSH_SCHEDULED_TIMEOUT = 60
+
+DEFAULT_EMAIL_QUEUE_SETTINGS = {
+    "BATCH_SIZE": 50,
+    "FLUSH_DELAY": 1,
+    "MAX_ATTEMPTS": 5,
+    "CONNECTION_MAX_AGE": 60,
+}
+
+
+def get_email_queue_settings() -> dict:
+    return {**DEFAULT_EMAIL_QUEUE_SETTINGS, **getattr(settings, "EMAIL_QUEUE", {})}
+
+
+class SMTPConnectionHolder:
+    """
+    워커 프로세스에서 SMTP 연결을 열어 둔 채 재사용 (메일마다 연결/TLS/로그인을 반복하지 않는다)
+    서버가 유휴 연결을 끊기 전에 다시 열도록 CONNECTION_MAX_AGE 가 지나면 닫는다
+    """
+
+    def __init__(self):
+        self.connection = None
+        self.opened_at = 0.0
+        self.lock = threading.Lock()
+
+    def get(self, max_age: float):
+        if self.connection is not None and time.monotonic() - self.opened_at > max_age:
+            self.close()
+        if self.connection is None:
+            connection = get_connection(fail_silently=False)
+            # 직접 open() 한 연결은 send_messages() 가 닫지 않는다
+            connection.open()
+            self.connection, self.opened_at = connection, time.monotonic()
+        return self.connection
+
+    def close(self) -> None:
+        if self.connection is None:
+            return
+        try:
+            self.connection.close()
+        except Exception:
+            pass
+        self.connection = None
+
+
+_smtp_connection = SMTPConnectionHolder()
+
+
+class EmailQueueService:
+    """
+    메일 발송 큐
+    요청에서는 enqueue() 로 Redis outbox 에 넣고(한 번의 왕복) 발송은 Celery task(send_queued_emails)가 한다
+    task 는 FLUSH_DELAY 동안 쌓인 메일을 BATCH_SIZE 씩 꺼내 하나의 SMTP 연결로 보낸다
+    """
+
+    @staticmethod
+    def enqueue(subject: str, message: str, recipient_list: list[str], from_email: Optional[str] = None) -> None:
+        config = get_email_queue_settings()
+        payload = json.dumps(
+            {
+                "subject": subject,
+                "body": message,
+                "from_email": from_email or settings.EMAIL_HOST_USER,
+                "to": list(recipient_list),
+                "attempts": 0,
+            }
+        )
+        pipe = get_redis_client().pipeline(transaction=False)
+        pipe.rpush(EMAIL_OUTBOX_KEY, payload)
+        pipe.set(EMAIL_FLUSH_SCHEDULED_KEY, 1, nx=True, ex=FLUSH_SCHEDULED_TIMEOUT)
+        _, scheduled = pipe.execute()
+        if scheduled:
+            EmailQueueService.schedule_flush(config["FLUSH_DELAY"])
+
+    @staticmethod
+    def schedule_flush(countdown: float = 0) -> None:
+        from apps.common.tasks import send_queued_emails
+
+        try:
+            send_queued_emails.apply_async(countdown=countdown)
+        except Exception:
+            # 메일은 outbox 에 남아 있으므로 요청은 실패시키지 않고 다음 메일이 다시 예약하도록 표시만 지운다
+            logger.exception("failed to schedule email delivery")
+            get_redis_client().delete(EMAIL_FLUSH_SCHEDULED_KEY)
+
+    @staticmethod
+    def flush() -> int:
+        """
+        outbox 가 빌 때까지 BATCH_SIZE 씩 보낸다. 보내지 못한 메일은 outbox 앞에 되돌리고 예외를 다시 던진다
+        꺼낸 배치는 processing list 로 옮겨 두고 보낸 메일만 지운다
+        """
+        config = get_email_queue_settings()
+        client = get_redis_client()
+        token = uuid.uuid4().hex
+        if not client.set(EMAIL_FLUSH_LOCK_KEY, token, nx=True, ex=FLUSH_LOCK_TIMEOUT):
+            # 다른 flush 가 보내는 중 - 그 flush 가 끝나면서 남은 메일을 확인한다
+            return 0
+
+        try:
+            # 꺼내기 전에 지워야 꺼내는 동안 들어온 메일이 다음 task 를 예약한다
+            client.delete(EMAIL_FLUSH_SCHEDULED_KEY)
+            EmailQueueService._recover(client)
+            sent = 0
+            with _smtp_connection.lock:
+                while True:
+                    # lock 이 만료되어 다른 flush 가 잡았으면 processing list 를 그쪽에 맡기고 멈춘다 (중복 발송 방지)
+                    if not compare_and_expire(EMAIL_FLUSH_LOCK_KEY, token, FLUSH_LOCK_TIMEOUT):
+                        logger.warning("email flush lock was lost, stopping after %d emails", sent)
+                        break
+                    items = EmailQueueService._claim(client, config["BATCH_SIZE"])
+                    if not items:
+                        break
+                    sent += EmailQueueService._send_batch(client, items, config)
+        finally:
+            compare_and_delete(EMAIL_FLUSH_LOCK_KEY, token)
+
+        # lock 을 잡고 있는 동안 들어와 task 가 건너뛴 메일
+        if client.llen(EMAIL_OUTBOX_KEY):
+            EmailQueueService.schedule_flush(config["FLUSH_DELAY"])
+        return sent
+
+    @staticmethod
+    def _recover(client) -> int:
+        """이전 flush 가 보내다 만(워커가 죽은) 메일을 원래 순서대로 outbox 앞에 되돌린다"""
+        recovered = 0
+        while client.lmove(EMAIL_PROCESSING_KEY, EMAIL_OUTBOX_KEY, "RIGHT", "LEFT") is not None:
+            recovered += 1
+        if recovered:
+            logger.warning("recovered %d unsent emails from the processing list", recovered)
+        return recovered
+
+    @staticmethod
+    def _claim(client, count: int) -> list[bytes]:
+        # LMOVE 는 하나씩 옮기므로 배치 크기만큼 모아 한 번의 왕복으로 보낸다
+        pipe = client.pipeline(transaction=True)
+        for _ in range(count):
+            pipe.lmove(EMAIL_OUTBOX_KEY, EMAIL_PROCESSING_KEY, "LEFT", "RIGHT")
+        return [item for item in pipe.execute() if item is not None]
+
+    @staticmethod
+    def _send_batch(client, items: list[bytes], config: dict) -> int:
+        payloads = [json.loads(item) for item in items]
+        for index, payload in enumerate(payloads):
+            message = EmailMessage(payload["subject"], payload["body"], payload["from_email"], payload["to"])
+            try:
+                try:
+                    _smtp_connection.get(config["CONNECTION_MAX_AGE"]).send_messages([message])
+                except smtplib.SMTPServerDisconnected:
+                    # 서버가 유휴 연결을 먼저 끊은 경우 - 한 번만 다시 연결해서 보낸다
+                    _smtp_connection.close()
+                    _smtp_connection.get(config["CONNECTION_MAX_AGE"]).send_messages([message])
+            except (smtplib.SMTPException, OSError):
+                _smtp_connection.close()
+                EmailQueueService._requeue(payloads[index:], config["MAX_ATTEMPTS"])
+                raise
+            client.lrem(EMAIL_PROCESSING_KEY, 1, items[index])
+        return len(payloads)
+
+    @staticmethod
+    def _requeue(payloads: list[dict], max_attempts: int) -> None:
+        retry = []
+        for payload in payloads:
+            payload = {**payload, "attempts": payload["attempts"] + 1}
+            if payload["attempts"] >= max_attempts:
+                logger.error("dropping email to %s after %d attempts", payload["to"], payload["attempts"])
+                continue
+            retry.append(json.dumps(payload))
+        # outbox 에 되돌리는 것과 processing list 를 비우는 것을 한 번에 (중간에 끊겨도 두 곳에 남지 않는다)
+        pipe = get_redis_client().pipeline(transaction=True)
+        if retry:
+            # LPUSH 는 인자를 하나씩 앞에 넣으므로 역순으로 넘겨야 원래 순서가 유지된다
+            pipe.lpush(EMAIL_OUTBOX_KEY, *reversed(retry))
+        pipe.delete(EMAIL_PROCESSING_KEY)
+        pipe.execute()
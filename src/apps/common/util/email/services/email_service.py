@@ -1,9 +1,8 @@
-from django.conf import settings
 from django.core import signing
-from django.core.mail import send_mail
 from django.core.signing import TimestampSigner
 
 from apps.common.constants.email_constants import VERIFY_EMAIL_URL
+from apps.common.util.email.services.email_queue_service import EmailQueueService
 
 
 class EmailService:
@@ -28,4 +27,5 @@ class EmailService:
     @staticmethod
     def send_email(subject: str, message: str, to_email: str) -> None:
         email = to_email if isinstance(to_email, list) else [to_email]
-        send_mail(subject, message, settings.EMAIL_HOST_USER, email)
+        # SMTP 발송은 Celery 워커가 한다 (요청 시간이 메일 서버 응답에 묶이지 않도록)
+        EmailQueueService.enqueue(subject, message, email)
@@ -1,13 +1,10 @@
 import random
 import string
 
-from django.conf import settings
-from django.core.mail import send_mail
 from rest_framework.exceptions import ValidationError
 
-from apps.common.util.redis_client import get_redis_client
-
-redis_client = get_redis_client()
+from apps.common.util.email.services.email_queue_service import EmailQueueService
+from apps.common.util.redis_client import compare_and_delete, get_redis_client
 
 
 class OTPService:
@@ -17,15 +14,15 @@ class OTPService:
 
     @staticmethod
     def _save_otp_to_redis(email: str, otp: str, expiry: int = 600) -> None:
-        redis_client.set(f"otp:{email}", otp, ex=expiry)
+        get_redis_client().set(f"otp:{email}", otp, ex=expiry)
 
     @staticmethod
     def get_otp_from_redis(email: str) -> bytes:
-        return redis_client.get(f"otp:{email}")
+        return get_redis_client().get(f"otp:{email}")
 
     @staticmethod
     def delete_otp_from_redis(email: str) -> None:
-        redis_client.delete(f"otp:{email}")
+        get_redis_client().delete(f"otp:{email}")
 
     def send_otp_email(self, to_email: str) -> None:
         otp = self._generate_otp()
@@ -34,14 +31,13 @@ class OTPService:
         subject = "Your OTP Code"
         message = f"Your OTP code is {otp}. It will expire in 10 minutes."
         email = to_email if isinstance(to_email, list) else [to_email]
-        send_mail(subject, message, settings.EMAIL_HOST_USER, email)
+        EmailQueueService.enqueue(subject, message, email)
 
     def verify_otp(self, email: str, otp: str) -> None:
         """OTP의 유효성을 검증하고, 유효하지 않으면 예외 발생"""
-        stored_otp = self.get_otp_from_redis(email)
-        if not stored_otp or stored_otp.decode() != otp:
+        # 비교와 삭제를 한 번에 - 같은 OTP 로 동시에 두 번 검증되지 않는다
+        if not otp or not compare_and_delete(f"otp:{email}", otp):
             raise ValidationError("Invalid or expired OTP.")
-        self.delete_otp_from_redis(email)
 
     def validate_otp_verified_in_session(self, otp_verified: bool) -> None:
         """OTP 검증 상태 확인"""
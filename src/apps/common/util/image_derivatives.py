@@ -0,0 +1,203 @@
+"""
+업로드 이미지 파생본(derivative) 생성 / 선택
+
+원본 업로드는 그대로 두고 thumbnail / card / full 크기를 WebP, JPEG 로 만들어 저장한다.
+생성은 Celery task(generate_image_derivatives)에서 하고, 결과(경로와 크기)는 모델의 derivatives JSONField 에 저장된다.
+
+    {
+        "source": "accommodation_images/a.jpg",
+        "original": {"width": 4032, "height": 3024},
+        "thumbnail": {"width": 320, "height": 240, "webp": "...", "jpeg": "..."},
+        ...
+    }
+
+serializer 는 select_image(name, derivatives, size, image_format) 로 화면에 맞는 파생본 경로를 고른다.
+파생본이 아직 없으면(생성 전/실패) 원본 경로를 반환한다.
+"""
+
+import logging
+import os
+from io import BytesIO
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Union
+
+from django.apps import apps
+from django.core.files.base import ContentFile
+from django.db import models, transaction
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from apps.common.storage import adopt_file
+from apps.common.util.direct_upload import DIRECT_UPLOAD_PREFIX
+
+if TYPE_CHECKING:
+    from apps.accommodations.models import Accommodation_Image
+    from apps.rooms.models import Room_Image
+
+    ImageModel = Union[Accommodation_Image, Room_Image]
+
+logger = logging.getLogger(__name__)
+
+# 긴 변 기준 최대 크기(px) - 원본보다 크게 늘리지 않는다
+IMAGE_DERIVATIVE_SIZES = {
+    "thumbnail": 320,  # 메인 피드 / 목록 썸네일
+    "card": 720,  # 검색 결과 카드, 객실 대표 이미지
+    "full": 1600,  # 상세 화면
+}
+
+IMAGE_FORMATS: dict[str, dict[str, Any]] = {
+    "webp": {"format": "WEBP", "quality": 80, "method": 4},
+    "jpeg": {"format": "JPEG", "quality": 82, "optimize": True, "progressive": True},
+}
+DEFAULT_IMAGE_FORMAT = "webp"
+IMAGE_FORMAT_QUERY_PARAM = "image_format"
+
+
+def derivative_name(name: str, size: str, image_format: str) -> str:
+    """accommodation_images/a.png -> accommodation_images/derivatives/a_card.webp"""
+    directory, filename = os.path.split(name)
+    stem = os.path.splitext(filename)[0]
+    extension = "jpg" if image_format == "jpeg" else image_format
+    return os.path.join(directory, "derivatives", f"{stem}_{size}.{extension}")
+
+
+def derivative_names(derivatives: Optional[dict]) -> list[str]:
+    return [
+        variant[image_format]
+        for variant in (derivatives or {}).values()
+        for image_format in IMAGE_FORMATS
+        if isinstance(variant, dict) and variant.get(image_format)
+    ]
+
+
+def select_image(
+    name: Optional[str], derivatives: Optional[dict], size: str, image_format: str = DEFAULT_IMAGE_FORMAT
+) -> Optional[str]:
+    if not name:
+        return None
+    variant = (derivatives or {}).get(size)
+    if not variant:
+        return name
+    return variant.get(image_format) or variant.get("jpeg") or name
+
+
+def get_image_format(context: Optional[dict]) -> str:
+    """?image_format=jpeg 로 WebP 를 지원하지 않는 클라이언트가 JPEG 를 받을 수 있다"""
+    request = (context or {}).get("request")
+    if request is None:
+        return DEFAULT_IMAGE_FORMAT
+    image_format = getattr(request, "query_params", request.GET).get(IMAGE_FORMAT_QUERY_PARAM)
+    return image_format if image_format in IMAGE_FORMATS else DEFAULT_IMAGE_FORMAT
+
+
+def _encode(image: Image.Image, image_format: str) -> bytes:
+    if image_format == "jpeg" and image.mode != "RGB":
+        # JPEG 는 투명도가 없으므로 흰 배경에 합성
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A") if "A" in image.getbands() else None)
+        image = background
+    buffer = BytesIO()
+    image.save(buffer, **IMAGE_FORMATS[image_format])
+    return buffer.getvalue()
+
+
+def build_derivatives(field_file) -> dict:
+    """원본 이미지 파일로 파생본을 만들어 같은 storage 에 저장하고 derivatives 값을 반환"""
+    storage = field_file.storage
+    largest = max(IMAGE_DERIVATIVE_SIZES.values())
+
+    with field_file.open("rb") as file:
+        image: Image.Image = Image.open(file)
+        original_size = image.size
+        # JPEG 는 필요한 크기 근처로 줄여서 디코딩 (큰 사진의 디코딩 시간/메모리를 크게 줄인다)
+        image.draft("RGB", (largest, largest))
+        image = ImageOps.exif_transpose(image)
+        image.load()
+
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "A" in image.getbands() or "transparency" in image.info else "RGB")
+
+    width, height = original_size
+    derivatives: dict = {"source": field_file.name, "original": {"width": width, "height": height}}
+    # 큰 크기부터 줄여 나가면 매번 원본에서 리샘플링하지 않아도 된다
+    source = image
+    for size, max_side in sorted(IMAGE_DERIVATIVE_SIZES.items(), key=lambda item: -item[1]):
+        variant = source.copy()
+        variant.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+        entry = {"width": variant.width, "height": variant.height}
+        for image_format in IMAGE_FORMATS:
+            name = derivative_name(field_file.name, size, image_format)
+            entry[image_format] = storage.save(name, ContentFile(_encode(variant, image_format)))
+        derivatives[size] = entry
+        source = variant
+    return derivatives
+
+
+class ImageDerivativeService:
+    """Accommodation_Image / Room_Image 파생본 생성 예약과 실행"""
+
+    @staticmethod
+    def schedule(instances: Iterable[models.Model]) -> None:
+        """커밋 후 이미지마다 파생본 생성 task 를 예약한다 (요청에서는 이미지를 디코딩하지 않는다)"""
+        targets = [(instance._meta.label, instance.pk) for instance in instances if instance.pk]
+        if not targets:
+            return
+
+        def enqueue():
+            from apps.common.tasks import generate_image_derivatives
+
+            for model_label, pk in targets:
+                generate_image_derivatives.delay(model_label, pk)
+
+        transaction.on_commit(enqueue)
+
+    @staticmethod
+    def is_current(instance: "ImageModel") -> bool:
+        """현재 원본으로 만든 파생본이 이미 있는지 (이미지가 바뀌지 않은 저장은 다시 만들지 않는다)"""
+        return bool(instance.image) and (instance.derivatives or {}).get("source") == instance.image.name
+
+    @staticmethod
+    def adopt(instance: "ImageModel") -> bool:
+        """
+        presigned 직접 업로드 파일을 content-addressed 이름으로 옮긴다 - 옮겼으면 True
+        올라온 파일은 바로 지워지므로 행의 경로도 바로 update() 로 바꾼다 (signal 은 generate 의 save() 가 보낸다)
+        """
+        try:
+            name = adopt_file(instance.image.storage, instance.image.name)
+        except FileNotFoundError:
+            return False
+        if name == instance.image.name:
+            return False
+        type(instance).objects.filter(pk=instance.pk).update(image=name)
+        instance.image.name = name
+        return True
+
+    @staticmethod
+    def generate(model_label: str, pk: int) -> Optional[dict]:
+        instance = apps.get_model(model_label).objects.filter(pk=pk).first()
+        if instance is None or not instance.image:
+            return None
+        adopted = instance.image.name.startswith(f"{DIRECT_UPLOAD_PREFIX}/") and ImageDerivativeService.adopt(instance)
+        # 옮긴 이미지는 파생본 생성 결과와 관계없이 save() 해서 post_save 로 숙소 카드 / 응답 캐시가 새 경로를 쓰게 한다
+        update_fields = ["image"] if adopted else []
+        if ImageDerivativeService.is_current(instance):
+            if update_fields:
+                instance.save(update_fields=update_fields)
+            return instance.derivatives
+
+        previous = derivative_names(instance.derivatives)
+        try:
+            derivatives = build_derivatives(instance.image)
+        except (FileNotFoundError, UnidentifiedImageError, Image.DecompressionBombError, SyntaxError, ValueError):
+            # 없는 파일이나 이미지로 읽을 수 없는 파일은 재시도해도 같으므로 원본만 제공한다
+            logger.warning("cannot build derivatives for %s %s", model_label, pk, exc_info=True)
+            if update_fields:
+                # 현재 원본으로 시도했음을 기록해 save() 의 post_save 가 생성을 다시 예약하지 않게 한다
+                instance.derivatives = {"source": instance.image.name}
+                instance.save(update_fields=[*update_fields, "derivatives"])
+            return None
+
+        # post_save 로 숙소 카드 / 응답 캐시가 갱신된다
+        instance.derivatives = derivatives
+        instance.save(update_fields=[*update_fields, "derivatives"])
+        for name in set(previous) - set(derivative_names(derivatives)):
+            instance.image.storage.delete(name)
+        return derivatives
@@ -0,0 +1,234 @@
+"""
+media GC - 어떤 행도 참조하지 않는 storage 파일(orphan)을 찾아 지운다
+
+1. DB 에서 참조 중인 경로를 먼저 모은다 (MEDIA_REFERENCES 와 확인 전인 직접 업로드)
+2. 관리하는 prefix 아래의 storage 파일을 batch 로 훑으며 참조 집합과 비교한다
+3. MIN_AGE 보다 오래된 orphan 만 지운다
+   스냅샷 이후에 올라온 파일(수정 시각)이나 다시 참조된 blob(StoredBlob.updated_at)은 cutoff 로 보호된다
+"""
+
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from itertools import islice
+from typing import Iterable, Iterator, Optional, TypedDict
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage, storages
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.common.models import PendingUpload, StoredBlob
+from apps.common.storage import (
+    STORAGE_ERRORS,
+    ContentAddressedStorageMixin,
+    check_storage_location,
+    lock_blob_name,
+)
+from apps.common.util.direct_upload import DIRECT_UPLOAD_PREFIX
+from apps.common.util.image_derivatives import derivative_names
+
+logger = logging.getLogger(__name__)
+
+# storage 경로를 가리키는 (모델, 경로 필드, 파생본 JSON 필드)
+MEDIA_REFERENCES = (
+    ("accommodations.Accommodation_Image", "image", "derivatives"),
+    ("rooms.Room_Image", "image", "derivatives"),
+    ("accommodations.AccommodationCard", "representative_image", "representative_image_derivatives"),
+    ("users.BusinessUser", "business_document", None),
+)
+
+DEFAULT_MEDIA_GC_SETTINGS = {
+    "STORAGES": ["images", "default"],  # 훑을 storage alias (같은 위치를 가리키면 한 번만 훑는다)
+    "MIN_AGE": 60 * 60 * 24,  # 이보다 최근(초)에 쓰였거나 참조된 파일은 지우지 않는다
+    "BATCH_SIZE": 1000,
+}
+
+
+def get_media_gc_settings() -> dict:
+    return {**DEFAULT_MEDIA_GC_SETTINGS, **getattr(settings, "MEDIA_GC", {})}
+
+
+class MediaGCStats(TypedDict):
+    scanned: int
+    scanned_bytes: int
+    orphans: int
+    orphan_bytes: int
+    deleted: int
+    failed: int
+    expired_uploads: int
+    elapsed: float  # 초
+    files_per_second: float
+
+
+def batched(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+class MediaGCService:
+    @staticmethod
+    def get_storages(aliases: Iterable[str]) -> list:
+        """같은 위치(bucket, location)를 가리키는 storage 는 처음 것만 사용한다"""
+        selected, seen = [], set()
+        for alias in aliases:
+            storage = storages[alias]
+            root = (getattr(storage, "bucket_name", None), str(getattr(storage, "location", "")))
+            if root not in seen:
+                seen.add(root)
+                selected.append(storage)
+        return selected
+
+    @staticmethod
+    def managed_prefixes(selected: Iterable) -> list[str]:
+        """업로드 경로(upload_to), content-addressed prefix, 직접 업로드 경로 - 이 밖의 파일은 건드리지 않는다"""
+        prefixes = {DIRECT_UPLOAD_PREFIX}
+        for label, name_field, _ in MEDIA_REFERENCES:
+            upload_to = getattr(apps.get_model(label)._meta.get_field(name_field), "upload_to", None)
+            if isinstance(upload_to, str) and upload_to.strip("/"):
+                prefixes.add(upload_to.strip("/"))
+        prefixes.update(storage.prefix for storage in selected if isinstance(storage, ContentAddressedStorageMixin))
+        return sorted(prefixes)
+
+    @staticmethod
+    def referenced_names(batch_size: int) -> set[str]:
+        names = set()
+        for label, name_field, derivatives_field in MEDIA_REFERENCES:
+            fields = [name_field, derivatives_field] if derivatives_field else [name_field]
+            for row in apps.get_model(label).objects.values_list(*fields).iterator(chunk_size=batch_size):
+                names.add(row[0])
+                if derivatives_field:
+                    names.update(derivative_names(row[1]))
+        # 아직 확인하지 않은 직접 업로드
+        names.update(
+            PendingUpload.objects.filter(status="pending", expires_at__gt=timezone.now())
+            .values_list("name", flat=True)
+            .iterator(chunk_size=batch_size)
+        )
+        names.discard("")
+        return names
+
+    @staticmethod
+    def iter_files(storage, prefix: str) -> Iterator[tuple[str, Optional[int], Optional[datetime]]]:
+        """prefix 아래의 (이름, 크기, 수정 시각) - 목록 조회에서 크기와 시각을 함께 읽어 파일마다 요청하지 않는다"""
+        if hasattr(storage, "bucket"):
+            # S3: list_objects_v2 를 1000 개씩 페이지로 읽는다
+            location = storage.location.strip("/")
+            key_prefix = "/".join(filter(None, [location, prefix])) + "/"
+            for obj in storage.bucket.objects.filter(Prefix=key_prefix):
+                yield (obj.key[len(location) + 1 :] if location else obj.key), obj.size, obj.last_modified
+        elif isinstance(storage, FileSystemStorage):
+            for dirpath, _, filenames in os.walk(storage.path(prefix)):
+                for filename in filenames:
+                    path = os.path.join(dirpath, filename)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    name = os.path.relpath(path, storage.location).replace(os.sep, "/")
+                    yield name, stat.st_size, datetime.fromtimestamp(stat.st_mtime, tz=dt_timezone.utc)
+        else:
+            directories, files = storage.listdir(prefix)
+            for filename in files:
+                yield f"{prefix}/{filename}", None, None
+            for directory in directories:
+                yield from MediaGCService.iter_files(storage, f"{prefix}/{directory}")
+
+    @staticmethod
+    def delete_orphan(storage, name: str, cutoff: datetime) -> bool:
+        """
+        참조가 없는 파일을 지우고 True, 스캔 뒤 cutoff 이후에 다시 참조된 blob 이면 남기고 False
+        이름 잠금을 잡은 transaction 안에서 행을 확인하고 파일을 지워 그 사이에 acquire_blob() 이 끼어들지 못한다
+        """
+        with transaction.atomic():
+            lock_blob_name(name)
+            blob = StoredBlob.objects.select_for_update().filter(name=name).first()
+            if blob is not None:
+                if blob.updated_at >= cutoff:
+                    return False
+                # 가리키는 행이 없는데 참조 수가 남은 blob 은 새어 나간 참조이므로 함께 지운다
+                blob.delete()
+            # 참조 수를 다시 해제하지 않도록 storage.delete() 대신 파일만 지운다 (실패하면 행 삭제도 롤백된다)
+            if isinstance(storage, ContentAddressedStorageMixin):
+                storage.delete_file(name)
+            else:
+                storage.delete(name)
+        return True
+
+    @staticmethod
+    def delete_orphans(storage, names: list[str], cutoff: datetime) -> tuple[int, int]:
+        """(지운 수, 실패한 수) - 다시 참조되어 남긴 파일은 어느 쪽에도 세지 않는다"""
+        deleted = failed = 0
+        for name in names:
+            try:
+                deleted += MediaGCService.delete_orphan(storage, name, cutoff)
+            except STORAGE_ERRORS:
+                logger.warning("cannot delete %s", name, exc_info=True)
+                failed += 1
+        return deleted, failed
+
+    @staticmethod
+    def clean_uploads(cutoff: datetime, dry_run: bool = False) -> int:
+        """만료된 직접 업로드와 확인이 끝난 PendingUpload 행 정리 (만료된 업로드 파일은 orphan 으로 지워진다)"""
+        queryset = PendingUpload.objects.filter(
+            Q(status="pending", expires_at__lt=cutoff) | Q(status="confirmed", created_at__lt=cutoff)
+        )
+        if dry_run:
+            return queryset.count()
+        return queryset.delete()[0]
+
+    @staticmethod
+    def collect(dry_run: bool = False, min_age: Optional[int] = None, batch_size: Optional[int] = None) -> MediaGCStats:
+        config = get_media_gc_settings()
+        min_age = config["MIN_AGE"] if min_age is None else min_age
+        batch_size = batch_size or config["BATCH_SIZE"]
+        started = time.perf_counter()
+        cutoff = timezone.now() - timedelta(seconds=min_age)
+
+        # 참조 스냅샷을 먼저 만든다 - 이후에 생긴 파일과 참조는 cutoff 로 보호된다
+        referenced = MediaGCService.referenced_names(batch_size)
+        stats: MediaGCStats = {
+            "scanned": 0,
+            "scanned_bytes": 0,
+            "orphans": 0,
+            "orphan_bytes": 0,
+            "deleted": 0,
+            "failed": 0,
+            "expired_uploads": 0,
+            "elapsed": 0.0,
+            "files_per_second": 0.0,
+        }
+        selected = MediaGCService.get_storages(config["STORAGES"])
+        prefixes = MediaGCService.managed_prefixes(selected)
+
+        for storage in selected:
+            check_storage_location(storage)
+            for prefix in prefixes:
+                for batch in batched(MediaGCService.iter_files(storage, prefix), batch_size):
+                    orphans = []
+                    for name, size, modified in batch:
+                        stats["scanned"] += 1
+                        stats["scanned_bytes"] += size or 0
+                        if name in referenced:
+                            continue
+                        if (modified or storage.get_modified_time(name)) >= cutoff:
+                            continue
+                        orphans.append(name)
+                        stats["orphan_bytes"] += size or 0
+                    stats["orphans"] += len(orphans)
+                    if orphans and not dry_run:
+                        deleted, failed = MediaGCService.delete_orphans(storage, orphans, cutoff)
+                        stats["deleted"] += deleted
+                        stats["failed"] += failed
+
+        stats["expired_uploads"] = MediaGCService.clean_uploads(cutoff, dry_run)
+        elapsed = time.perf_counter() - started
+        stats["elapsed"] = round(elapsed, 3)
+        stats["files_per_second"] = round(stats["scanned"] / elapsed, 1) if elapsed else 0.0
+        logger.info("media gc%s: %s", " (dry run)" if dry_run else "", stats)
+        return stats
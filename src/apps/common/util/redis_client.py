@@ -1,10 +1,424 @@
-import os
+"""
+Redis client factory (OTP / refresh token 등 캐시 backend 를 거치지 않는 직접 접근용)
+
+- get_redis_client(): 설정된 connection pool(최대 연결 수, socket timeout, health check)을 공유하는 동기 client
+- get_async_redis_client(): ASGI view 용 asyncio client (event loop 마다 pool 을 따로 둔다)
+- compare_and_delete / compare_and_expire / get_many / set_many: Lua 스크립트·pipeline 으로 왕복을 한 번으로 줄인 helper
+- settings.REDIS_CLIENT["IN_MEMORY"] 가 True 이면 Redis 없이 동작하는 InMemoryRedis 를 사용한다 (테스트)
+"""
+
+import asyncio
+import fnmatch
+import threading
+import time
+import weakref
+from typing import Any, Callable, Iterable, Optional, Union
 
 import redis
+from django.conf import settings
+from redis import asyncio as redis_asyncio
+
+DEFAULT_REDIS_CLIENT_SETTINGS = {
+    "HOST": "redis",
+    "PORT": 6379,
+    "DB": 1,  # db 1 은 OTP / refresh token 용
+    "MAX_CONNECTIONS": 50,
+    "POOL_TIMEOUT": 2,  # pool 이 가득 찼을 때 연결을 기다리는 시간(초)
+    "SOCKET_TIMEOUT": 1,
+    "SOCKET_CONNECT_TIMEOUT": 1,
+    "HEALTH_CHECK_INTERVAL": 30,
+    "IN_MEMORY": False,
+}
+
+# 값이 expected 와 같을 때만 삭제 (GET + DEL 을 원자적으로 한 번에)
+COMPARE_AND_DELETE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+COMPARE_AND_EXPIRE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+def get_redis_settings() -> dict:
+    return {**DEFAULT_REDIS_CLIENT_SETTINGS, **getattr(settings, "REDIS_CLIENT", {})}
+
+
+def _connection_kwargs(config: dict) -> dict:
+    return {
+        "host": config["HOST"],
+        "port": config["PORT"],
+        "db": config["DB"],
+        "max_connections": config["MAX_CONNECTIONS"],
+        "timeout": config["POOL_TIMEOUT"],
+        "socket_timeout": config["SOCKET_TIMEOUT"],
+        "socket_connect_timeout": config["SOCKET_CONNECT_TIMEOUT"],
+        "health_check_interval": config["HEALTH_CHECK_INTERVAL"],
+        "retry_on_timeout": True,
+    }
+
+
+class InMemoryRedis:
+    """
+    테스트용 Redis stand-in (이 모듈에서 쓰는 명령만 구현)
+    값은 Redis 처럼 bytes 로 저장하고, Lua 스크립트는 emulate() 로 등록한 파이썬 구현으로 실행한다
+    """
+
+    script_emulations: dict[str, Callable] = {}
+
+    def __init__(self):
+        # key -> (문자열 값 또는 list 값, 만료 시각)
+        self._data: dict[str, tuple[Union[bytes, list[bytes]], Optional[float]]] = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def emulate(cls, source: str):
+        def decorator(func):
+            cls.script_emulations[source] = func
+            return func
+
+        return decorator
+
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        if isinstance(value, bytes):
+            return value
+        return str(value).encode()
+
+    def _alive(self, name: str) -> Union[bytes, list[bytes], None]:
+        entry = self._data.get(name)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[name]
+            return None
+        return value
+
+    def _string(self, name: str) -> Optional[bytes]:
+        value = self._alive(name)
+        if isinstance(value, list):
+            raise redis.ResponseError("WRONGTYPE Operation against a key holding the wrong kind of value")
+        return value
+
+    def _list(self, name: str) -> list[bytes]:
+        value = self._alive(name)
+        if isinstance(value, bytes):
+            raise redis.ResponseError("WRONGTYPE Operation against a key holding the wrong kind of value")
+        return value or []
+
+    def _store_list(self, name: str, items: list[bytes]) -> None:
+        # Redis 처럼 빈 list 는 key 를 지운다 (만료 시각은 유지)
+        if items:
+            self._data[name] = (items, self._data[name][1] if name in self._data else None)
+        else:
+            self._data.pop(name, None)
+
+    def ping(self) -> bool:
+        return True
+
+    def get(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            return self._string(name)
+
+    def mget(self, keys: Iterable[str], *args: str) -> list[Optional[bytes]]:
+        keys = [keys] if isinstance(keys, str) else list(keys)
+        with self._lock:
+            return [self._string(key) for key in [*keys, *args]]
+
+    def set(self, name: str, value: Any, ex=None, px=None, nx: bool = False, xx: bool = False) -> Optional[bool]:
+        with self._lock:
+            exists = self._alive(name) is not None
+            if (nx and exists) or (xx and not exists):
+                return None
+            if hasattr(ex, "total_seconds"):
+                ex = ex.total_seconds()
+            expires_at = None
+            if ex is not None:
+                expires_at = time.monotonic() + ex
+            elif px is not None:
+                expires_at = time.monotonic() + px / 1000
+            self._data[name] = (self._encode(value), expires_at)
+            return True
+
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            deleted = [name for name in names if self._alive(name) is not None]
+            for name in deleted:
+                del self._data[name]
+            return len(deleted)
+
+    def getdel(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._string(name)
+            self._data.pop(name, None)
+            return value
+
+    def exists(self, *names: str) -> int:
+        with self._lock:
+            return sum(1 for name in names if self._alive(name) is not None)
+
+    def incr(self, name: str, amount: int = 1) -> int:
+        with self._lock:
+            value = int(self._string(name) or 0) + amount
+            expires_at = self._data[name][1] if name in self._data else None
+            self._data[name] = (self._encode(value), expires_at)
+            return value
+
+    def expire(self, name: str, time_seconds) -> bool:
+        with self._lock:
+            value = self._alive(name)
+            if value is None:
+                return False
+            if hasattr(time_seconds, "total_seconds"):
+                time_seconds = time_seconds.total_seconds()
+            self._data[name] = (value, time.monotonic() + time_seconds)
+            return True
+
+    def ttl(self, name: str) -> int:
+        with self._lock:
+            if self._alive(name) is None:
+                return -2
+            expires_at = self._data[name][1]
+            return -1 if expires_at is None else int(expires_at - time.monotonic())
+
+    def keys(self, pattern: str = "*") -> list[bytes]:
+        with self._lock:
+            return [key.encode() for key in list(self._data) if self._alive(key) and fnmatch.fnmatch(key, pattern)]
+
+    # list (email outbox 등)
+    def rpush(self, name: str, *values: Any) -> int:
+        with self._lock:
+            items = [*self._list(name), *(self._encode(value) for value in values)]
+            self._store_list(name, items)
+            return len(items)
+
+    def lpush(self, name: str, *values: Any) -> int:
+        with self._lock:
+            items = [*(self._encode(value) for value in reversed(values)), *self._list(name)]
+            self._store_list(name, items)
+            return len(items)
+
+    def lpop(self, name: str, count: Optional[int] = None):
+        with self._lock:
+            items = self._list(name)
+            if not items:
+                return None
+            popped, rest = items[: count or 1], items[count or 1 :]
+            self._store_list(name, rest)
+            return popped if count is not None else popped[0]
+
+    def lmove(self, first_list: str, second_list: str, src: str = "LEFT", dest: str = "RIGHT") -> Optional[bytes]:
+        with self._lock:
+            items = self._list(first_list)
+            if not items:
+                return None
+            value, rest = (items[0], items[1:]) if src == "LEFT" else (items[-1], items[:-1])
+            self._store_list(first_list, rest)
+            if dest == "LEFT":
+                self.lpush(second_list, value)
+            else:
+                self.rpush(second_list, value)
+            return value
+
+    def lrem(self, name: str, count: int, value: Any) -> int:
+        with self._lock:
+            items = self._list(name)
+            value = self._encode(value)
+            indexes = [index for index, item in enumerate(items) if item == value]
+            if count < 0:
+                indexes.reverse()
+            removed = set(indexes[: abs(count)] if count else indexes)
+            self._store_list(name, [item for index, item in enumerate(items) if index not in removed])
+            return len(removed)
+
+    def llen(self, name: str) -> int:
+        with self._lock:
+            return len(self._list(name))
+
+    def publish(self, channel: str, message: Any) -> int:
+        return 0
+
+    def flushdb(self) -> bool:
+        with self._lock:
+            self._data.clear()
+            return True
+
+    def pipeline(self, transaction: bool = True) -> "InMemoryPipeline":
+        return InMemoryPipeline(self)
+
+    def register_script(self, source: str) -> Callable:
+        emulation = self.script_emulations[source]
+
+        def run(keys=(), args=(), client=None):
+            target = client or self
+            with target._lock:
+                return emulation(target, list(keys), [target._encode(arg) for arg in args])
+
+        return run
 
-redis_host = os.environ.get("REDIS_HOST", "redis")
-redis_client = redis.StrictRedis(host=redis_host, port=6379, db=1)
+
+class InMemoryPipeline:
+    """명령을 모았다가 execute() 에서 한 번에 실행 (InMemoryRedis 용)"""
+
+    def __init__(self, client: InMemoryRedis):
+        self._client = client
+        self._commands: list[tuple[str, tuple, dict]] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._commands = []
+
+    def __getattr__(self, name: str):
+        if not hasattr(self._client, name):
+            raise AttributeError(name)
+
+        def queue(*args, **kwargs):
+            self._commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self) -> list:
+        with self._client._lock:
+            results = [getattr(self._client, name)(*args, **kwargs) for name, args, kwargs in self._commands]
+        self._commands = []
+        return results
+
+
+class AsyncInMemoryRedis:
+    """InMemoryRedis 의 asyncio 인터페이스 (같은 저장소를 공유한다)"""
+
+    def __init__(self, client: InMemoryRedis):
+        self._client = client
+
+    def register_script(self, source: str) -> Callable:
+        run = self._client.register_script(source)
+
+        async def arun(keys=(), args=(), client=None):
+            return run(keys, args)
+
+        return arun
+
+    def __getattr__(self, name: str):
+        method = getattr(self._client, name)
+
+        async def call(*args, **kwargs):
+            return method(*args, **kwargs)
+
+        return call
+
+
+@InMemoryRedis.emulate(COMPARE_AND_DELETE_SCRIPT)
+def _compare_and_delete(client: InMemoryRedis, keys: list, args: list) -> int:
+    if client.get(keys[0]) == args[0]:
+        return client.delete(keys[0])
+    return 0
+
+
+@InMemoryRedis.emulate(COMPARE_AND_EXPIRE_SCRIPT)
+def _compare_and_expire(client: InMemoryRedis, keys: list, args: list) -> int:
+    if client.get(keys[0]) == args[0]:
+        return int(client.expire(keys[0], int(args[1])))
+    return 0
+
+
+_lock = threading.Lock()
+_client = None
+_in_memory_client: Optional[InMemoryRedis] = None
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+_scripts: dict[str, Any] = {}
+
+
+def _get_in_memory_client() -> InMemoryRedis:
+    global _in_memory_client
+    if _in_memory_client is None:
+        _in_memory_client = InMemoryRedis()
+    return _in_memory_client
 
 
 def get_redis_client():
-    return redis_client
+    """프로세스에서 공유하는 동기 client (pool 은 fork 후 첫 사용 시 redis-py 가 새로 만든다)"""
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                config = get_redis_settings()
+                if config["IN_MEMORY"]:
+                    _client = _get_in_memory_client()
+                else:
+                    pool = redis.BlockingConnectionPool(**_connection_kwargs(config))
+                    _client = redis.Redis(connection_pool=pool)
+    return _client
+
+
+def get_async_redis_client():
+    """
+    ASGI view 용 asyncio client
+    asyncio 연결은 만든 event loop 에서만 쓸 수 있으므로 loop 마다 client(pool)를 따로 만든다
+    """
+    config = get_redis_settings()
+    if config["IN_MEMORY"]:
+        return AsyncInMemoryRedis(_get_in_memory_client())
+
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        pool = redis_asyncio.BlockingConnectionPool(**_connection_kwargs(config))
+        client = _async_clients[loop] = redis_asyncio.Redis(connection_pool=pool)
+    return client
+
+
+def reset_redis_client() -> None:
+    """설정 변경 후(테스트 등) client 를 다시 만들도록 초기화"""
+    global _client, _in_memory_client
+    with _lock:
+        _client = None
+        _in_memory_client = None
+        _scripts.clear()
+
+
+def get_script(source: str):
+    # register_script 는 EVALSHA 를 쓰고, 서버에 스크립트가 없으면 EVAL 로 다시 보낸다
+    script = _scripts.get(source)
+    if script is None:
+        script = _scripts[source] = get_redis_client().register_script(source)
+    return script
+
+
+def compare_and_delete(key: str, expected: str) -> bool:
+    """key 의 값이 expected 와 같을 때만 삭제 (한 번의 왕복, 원자적)"""
+    return bool(get_script(COMPARE_AND_DELETE_SCRIPT)(keys=[key], args=[expected]))
+
+
+def compare_and_expire(key: str, expected: str, seconds: int) -> bool:
+    """key 의 값이 expected 와 같을 때만 만료 시간을 다시 설정 (lock 을 잡은 쪽만 연장한다)"""
+    return bool(get_script(COMPARE_AND_EXPIRE_SCRIPT)(keys=[key], args=[expected, seconds]))
+
+
+async def acompare_and_delete(key: str, expected: str) -> bool:
+    client = get_async_redis_client()
+    return bool(await client.register_script(COMPARE_AND_DELETE_SCRIPT)(keys=[key], args=[expected]))
+
+
+def get_many(keys: Iterable[str]) -> dict[str, Optional[bytes]]:
+    keys = list(keys)
+    if not keys:
+        return {}
+    return dict(zip(keys, get_redis_client().mget(keys)))
+
+
+def set_many(mapping: dict[str, Any], ex=None) -> None:
+    """여러 key 를 pipeline 으로 한 번에 저장 (MSET 은 만료 시간을 줄 수 없다)"""
+    with get_redis_client().pipeline(transaction=False) as pipe:
+        for key, value in mapping.items():
+            pipe.set(key, value, ex=ex)
+        pipe.execute()
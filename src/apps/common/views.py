@@ -0,0 +1,25 @@
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.common.serializers import DirectUploadRequestSerializer
+from apps.common.util.direct_upload import DirectUploadService
+
+
+@extend_schema(tags=["Upload"])
+class DirectUploadCreateView(APIView):
+    """
+    presigned 업로드 URL 발급
+    응답의 url 로 fields 와 file 을 multipart POST 한 뒤, 이미지/서류 API 에 upload_id 를 넘겨 확인한다
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(summary="직접 업로드 URL 발급", request=DirectUploadRequestSerializer)
+    def post(self, request, *args, **kwargs):
+        serializer = DirectUploadRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = DirectUploadService.create(request.user, **serializer.validated_data)
+        return Response(data, status=status.HTTP_201_CREATED)
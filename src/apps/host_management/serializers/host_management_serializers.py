@@ -5,6 +5,8 @@ from rest_framework import serializers
 from apps.accommodations.models import Accommodation, Accommodation_Image
 from apps.bookings.models import Booking
 from apps.common.choices import BOOKING_STATUS_CHOICES
+from apps.common.storage import get_image_storage
+from apps.common.util.image_derivatives import get_image_format, select_image
 from apps.rooms.models import Room
 
 
@@ -186,9 +188,13 @@ class AccommodationImageSerializer(serializers.ModelSerializer):
         fields = ["id", "image", "image_url", "is_representative"]
 
     def get_image_url(self, obj):
-        """이미지 URL을 반환합니다."""
+        """목록 카드 크기 파생본의 URL을 반환합니다."""
+        if not obj.image:
+            return None
         request = self.context.get("request")
-        return request.build_absolute_uri(obj.image.url) if obj.image else None
+        image = select_image(obj.image.name, obj.derivatives, "card", get_image_format(self.context))
+        image_url = get_image_storage().url(image)
+        return request.build_absolute_uri(image_url) if request else image_url
 
 
 class AccommodationHostManagementSerializer(serializers.ModelSerializer):
@@ -199,13 +205,13 @@ class AccommodationHostManagementSerializer(serializers.ModelSerializer):
         model = Accommodation
         fields = ["id", "name", "image", "address"]
 
+    # 대표 이미지는 view 에서 prefetch 한 representative_images, 주소는 select_related("gps_info") 에서 읽는다
     def get_image(self, obj):
-        representative_image = obj.images.filter(is_representative=True).first()
-        return (
-            AccommodationImageSerializer(representative_image, context=self.context).data
-            if representative_image
-            else None
-        )
+        images = getattr(obj, "representative_images", None)
+        if images is None:
+            images = obj.images.filter(is_representative=True)[:1]
+        return AccommodationImageSerializer(images[0], context=self.context).data if images else None
 
     def get_address(self, obj):
-        return obj.gps_info.address if obj.gps_info else None  # GPS 정보가 없을 경우 None 반환
+        gps_info = getattr(obj, "gps_info", None)
+        return gps_info.address if gps_info else None  # GPS 정보가 없을 경우 None 반환
@@ -1,9 +1,10 @@
+from django.core.cache import caches
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from apps.accommodations.models import Accommodation
+from apps.accommodations.models import Accommodation, Accommodation_Image, GPS_Info
 from apps.users.models import BusinessUser, User
 
 
@@ -34,6 +35,46 @@ class BookingCheckViewTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
 
+class MyAccommodationListViewTest(APITestCase):
+    def setUp(self):
+        caches["catalog"].clear()
+        self.user = User.objects.create_superuser(email="test123@test.com", password="test123")
+        self.host = BusinessUser.objects.create(user=self.user)
+        self.accommodation = Accommodation.objects.create(host=self.host, name="test accommodation")
+        GPS_Info.objects.create(
+            accommodation=self.accommodation,
+            city="Busan",
+            states="Haeundae",
+            road_name="Haeundae-ro",
+            address="부산 해운대구 1",
+        )
+        Accommodation_Image.objects.create(accommodation=self.accommodation, image="accommodation_images/other.jpg")
+        self.image = Accommodation_Image.objects.create(
+            accommodation=self.accommodation, image="accommodation_images/main.jpg", is_representative=True
+        )
+        Accommodation.objects.create(host=self.host, name="no image accommodation")
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(self.user).access_token}")
+
+    def test_lists_representative_image_and_gps_address(self):
+        # given
+        url = reverse("host_management:host-management-my-accommodations-list")
+
+        # when
+        with self.assertNumQueries(3):  # 사용자 + 숙소(gps_info) + 대표 이미지
+            response = self.client.get(url)
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = {result["name"]: result for result in response.data["results"]}
+        image = results["test accommodation"]["image"]
+        self.assertEqual(image["id"], self.image.id)
+        self.assertTrue(image["is_representative"])
+        self.assertTrue(image["image_url"].endswith("accommodation_images/main.jpg"))
+        self.assertEqual(results["test accommodation"]["address"], "부산 해운대구 1")
+        self.assertIsNone(results["no image accommodation"]["image"])
+        self.assertIsNone(results["no image accommodation"]["address"])
+
+
 class BookingRequestCheckViewTest(APITestCase):
     def setUp(self):
         self.user = User.objects.create_superuser(email="test123@test.com", password="<PASSWORD>")
@@ -1,14 +1,17 @@
 from datetime import date
 
+from django.db.models import Prefetch
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from apps.accommodations.models import Accommodation
+from apps.accommodations.models import Accommodation, Accommodation_Image
 from apps.bookings.models import Booking
+from apps.bookings.services.booking_guest_service import BookingService
 from apps.common.permissions.host_permission import IsHost
+from apps.common.renderers import StreamingListMixin
 from apps.host_management.serializers.host_management_serializers import (
     AccommodationHostManagementSerializer,
     BookingCheckSerializer,
@@ -19,7 +22,7 @@ from apps.host_management.serializers.host_management_serializers import (
 
 
 @extend_schema(tags=["Host-Management"])
-class BookingCheckView(generics.GenericAPIView):
+class BookingCheckView(StreamingListMixin, generics.GenericAPIView):
     """예약 내역 관리"""
 
     serializer_class = BookingCheckSerializer
@@ -60,11 +63,16 @@ class BookingCheckView(generics.GenericAPIView):
             check_in_datetime__lte=selected_date,
             check_out_datetime__gte=selected_date,
             room__accommodation_id__in=accommodation_ids,
-        )
+        ).select_related("guest", "room__accommodation")
+
+        # ?stream=1 이면 전체 목록을 행 단위로 스트리밍
+        if self.should_stream(request):
+            return self.stream_response(booking_list, BookingSerializer)
 
-        # 예약 리스트를 직렬화 후 응답
-        serializer = BookingSerializer(booking_list, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        # 예약 리스트를 직렬화 후 응답 (keyset 페이지네이션)
+        page = self.paginate_queryset(booking_list)
+        serializer = BookingSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
 
 @extend_schema(tags=["Host-Management"])
@@ -91,12 +99,12 @@ class BookingRequestCheckView(generics.GenericAPIView):
         booking = serializer.context["booking"]
         action = serializer.validated_data["action"]
 
+        # 호스트 거절 시 날짜별 재고 반환은 BookingService.update_status 에서 처리
         if action == "accept":
-            booking.status = "confirmed"
+            BookingService.update_status(booking, "confirmed")
         if action == "cancelled":
-            booking.status = "cancelled_by_host"
+            BookingService.update_status(booking, "cancelled_by_host")
 
-        booking.save()
         return Response(
             {"message": "예약 요청이 성공했습니다", "status": booking.status},
             status=status.HTTP_200_OK,
@@ -104,7 +112,7 @@ class BookingRequestCheckView(generics.GenericAPIView):
 
 
 @extend_schema(tags=["Host-Management"])
-class CompleteBookingsView(generics.GenericAPIView):
+class CompleteBookingsView(StreamingListMixin, generics.GenericAPIView):
     """이용 완료 내역"""
 
     permission_classes = (IsAuthenticated, IsHost)
@@ -138,10 +146,14 @@ class CompleteBookingsView(generics.GenericAPIView):
             room__accommodation__host=user,
             check_out_datetime__lte=selected_date,
             status="completed",
-        )
+        ).select_related("guest", "room__accommodation")
 
-        serializer = BookingSerializer(booking_list, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        if self.should_stream(request):
+            return self.stream_response(booking_list, BookingSerializer)
+
+        page = self.paginate_queryset(booking_list)
+        serializer = BookingSerializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
 
 @extend_schema(tags=["Host-Management"])
@@ -157,8 +169,14 @@ class MyAccommodationListView(generics.GenericAPIView):
     )
     def get(self, request, *args, **kwargs):
         """GET 요청을 처리하여 숙소 목록을 반환합니다."""
-        queryset = Accommodation.objects.filter(host=request.user.business_profile, is_active=True)
+        representative_images = Accommodation_Image.objects.filter(is_representative=True)
+        queryset = (
+            Accommodation.objects.filter(host=request.user.business_profile, is_active=True)
+            .select_related("gps_info")
+            .prefetch_related(Prefetch("images", queryset=representative_images, to_attr="representative_images"))
+        )
 
-        serializer = self.get_serializer(queryset, many=True)
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
 
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return self.get_paginated_response(serializer.data)
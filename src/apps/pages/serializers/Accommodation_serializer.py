@@ -8,9 +8,10 @@ from apps.accommodations.models import (
     GPS_Info,
     RefundPolicy,
 )
-from apps.amenities.models import AccommodationAmenity, Amenity
+from apps.amenities.models import AccommodationAmenity
+from apps.common.util.image_derivatives import get_image_format, select_image
 from apps.pages.serializers.room_serializer import RoomImagesSerializer, RoomSerializer
-from apps.rooms.models import Room, Room_Image
+from apps.rooms.models import Room
 
 
 # 호텔 주소 시리얼라이저
@@ -74,12 +75,10 @@ class AccommodationRoomSerializer(serializers.ModelSerializer):
         ]
 
     def get_accommodation_name(self, obj):
-        accommodation = Accommodation.objects.get(pk=obj.accommodation_id)
-        return accommodation.name
+        return obj.accommodation.name
 
     def get_images(self, obj):
-        images = Room_Image.objects.filter(room=obj.id)
-        serializer = RoomImagesSerializer(images, many=True)
+        serializer = RoomImagesSerializer(obj.images.all(), many=True, context=self.context)
         return serializer.data
 
 
@@ -101,62 +100,48 @@ class AccommodationDetailSerializer(serializers.ModelSerializer):
         fields = ["accommodation_img", "name", "address", "min_price", "rooms", "description", "rules", "refund_policy"]
         # exclude = ['id', 'created_at', 'updated_at', 'is_active', 'average_rating']
 
-    def get_accommodation_img(self, obj: Accommodation) -> Union[str, None]:
-        imgs = Accommodation_Image.objects.filter(accommodation_id=obj.pk)
-        if imgs:
-            img_list = []
-            for img in imgs:
-                img_list.append(img.image.name)
-            return img_list  # 이객체의 image필드의 값을 반환(클라우드 url주소 예정)
-
-        return None  # img가 없다면 None 반환
+    # 아래 메서드들은 Accommodation.objects.for_detail_page() 로 미리 가져온 데이터만 사용한다
+    def get_accommodation_img(self, obj: Accommodation) -> Union[list, None]:
+        # 상세 화면은 full 파생본 경로 반환(클라우드 url주소 예정)
+        image_format = get_image_format(self.context)
+        img_list = [select_image(img.image.name, img.derivatives, "full", image_format) for img in obj.images.all()]
+        return img_list or None
 
     def get_address(self, obj):
-        gps_info = GPS_Info.objects.filter(accommodation=obj)
-        serializer = AccommodationAddressSerializer(gps_info, many=True)
-        address_data = serializer.data[0] if serializer.data else None
+        gps_info = getattr(obj, "gps_info", None)
+        if gps_info is None:
+            return None
+        address_data = AccommodationAddressSerializer(gps_info).data
         address_full = (
             f"{address_data['city']} {address_data['states']} {address_data['road_name']} {address_data['address']}"
         )
         return address_full
 
     def get_min_price(self, obj):
-        min_price = obj.room_set.order_by("price").first()
-        if min_price:
-            return min_price.price
-        return None
+        prices = [room.price for room in obj.room_set.all()]
+        return min(prices) if prices else None
 
     # 룸정보 + 룸대표이미지
     def get_rooms(self, obj):
-        rooms = Room.objects.filter(accommodation=obj)
         room_list = []
+        image_format = get_image_format(self.context)
 
-        for room in rooms:
-            room_serializer = RoomSerializer(room)
-            room_dict = room_serializer.data
-
-            # 현재 room에 해당하는 이미지들을 가져옵니다.
-            room_images = Room_Image.objects.filter(room_id=room.id)
+        for room in obj.room_set.all():
+            room_dict = RoomSerializer(room, context=self.context).data
 
             # 대표 이미지가 담길 변수
             representative_image = None
-
-            # room에 대한 이미지를 순회하며 대표 이미지를 찾습니다.
-            for image in room_images:
+            for image in room.images.all():
                 if image.is_representative:
-                    representative_image = image.image.name
+                    representative_image = select_image(image.image.name, image.derivatives, "card", image_format)
                     break  # 대표 이미지를 찾으면 더 이상 순회하지 않음
 
             # 직렬화된 데이터에 'images' 필드로 대표 이미지를 추가
             room_dict["images"] = representative_image
-
-            # 각 room의 데이터를 room_list에 추가
             room_list.append(room_dict)
 
-        # room_list에는 각 room의 대표 이미지가 포함됨
         return room_list
 
     def get_refund_policy(self, obj):
-        refund_policy = RefundPolicy.objects.filter(accommodation=obj)
-        refund_policy_serializer = AccommodationRefundPolicySerializer(refund_policy, many=True)
+        refund_policy_serializer = AccommodationRefundPolicySerializer(obj.refund_policies.all(), many=True)
         return refund_policy_serializer.data
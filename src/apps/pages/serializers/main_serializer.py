@@ -2,7 +2,8 @@ from typing import Union
 
 from rest_framework import serializers
 
-from apps.accommodations.models import Accommodation, Accommodation_Image
+from apps.accommodations.models import Accommodation
+from apps.common.util.image_derivatives import get_image_format, select_image
 
 
 class MainPageSerializer(serializers.ModelSerializer):
@@ -13,16 +14,25 @@ class MainPageSerializer(serializers.ModelSerializer):
         model = Accommodation
         fields = ["id", "name", "rooms", "hotel_img"]
 
+    # 최저가/대표 이미지는 숙소 카드(select_related("card"))에서 읽는다
     def get_rooms(self, obj: Accommodation) -> Union[int, None]:
-        min_price_room = obj.room_set.order_by("price").first()
-        if min_price_room:
-            return min_price_room.price
-        return None
+        card = getattr(obj, "card", None)
+        return card.min_price if card else None
 
     def get_hotel_img(self, obj: Accommodation) -> Union[str, None]:
-        # Accommodation과 연결된 Accommodation_image 테이블에서 첫 번째 이미지의 URL을 반환
-        img = Accommodation_Image.objects.filter(accommodation_id=obj.pk).first()  # 이미지들중 첫번째 이미지
-        if img:  # img가 있다면
-            return img.image.name  # 이객체의 image필드의 값을 반환(클라우드 url주소 예정)
+        card = getattr(obj, "card", None)
+        if card and card.representative_image:
+            # 피드에는 썸네일 파생본 경로 반환(클라우드 url주소 예정)
+            return select_image(
+                card.representative_image,
+                card.representative_image_derivatives,
+                "thumbnail",
+                get_image_format(self.context),
+            )
+        return None
+
 
-        return None  # img가 없다면 None 반환
+class MainFeedQuerySerializer(serializers.Serializer):
+    seed = serializers.IntegerField(min_value=0, required=False)
+    cursor = serializers.CharField(required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=20)
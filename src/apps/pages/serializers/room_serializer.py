@@ -1,18 +1,23 @@
 from rest_framework import serializers
 
-from apps.accommodations.models import Accommodation
 from apps.amenities.models import RoomOption
+from apps.common.util.image_derivatives import get_image_format, select_image
 from apps.rooms.models import Room, Room_Image, RoomInventory, RoomType
 
 
-# 룸 사진들
-class RoomImagesSerializer(serializers.Serializer):
+# 룸 사진들 (상세 화면용 full 파생본 경로)
+class RoomImagesSerializer(serializers.ModelSerializer):
+    image = serializers.SerializerMethodField()
+
     class Meta:
         model = Room_Image
         fields = [
             "image",
         ]
 
+    def get_image(self, obj):
+        return select_image(obj.image.name, obj.derivatives, "full", get_image_format(self.context))
+
 
 # 룸 옵션
 class RoomOptionSerializer(serializers.Serializer):
@@ -54,11 +59,10 @@ class RoomSerializer(serializers.ModelSerializer):
             "images",
         ]
 
+    # accommodation / images 는 select_related, prefetch_related 된 데이터를 사용
     def get_accommodation_name(self, obj):
-        accommodation = Accommodation.objects.get(pk=obj.accommodation_id)
-        return accommodation.name
+        return obj.accommodation.name
 
     def get_images(self, obj):
-        images = Room_Image.objects.filter(room=obj.id)
-        serializer = RoomImagesSerializer(images, many=True)
+        serializer = RoomImagesSerializer(obj.images.all(), many=True, context=self.context)
         return serializer.data
@@ -0,0 +1,130 @@
+from datetime import date
+from typing import Union
+
+from rest_framework import serializers
+
+from apps.accommodations.models import Accommodation
+from apps.common.util.image_derivatives import get_image_format, select_image
+from apps.rooms.models import Room
+
+
+class AvailabilitySearchQuerySerializer(serializers.Serializer):
+    check_in_date = serializers.DateField()
+    check_out_date = serializers.DateField()
+    guests_count = serializers.IntegerField(min_value=1)
+    min_price = serializers.IntegerField(min_value=0, required=False)
+    max_price = serializers.IntegerField(min_value=0, required=False)
+    q = serializers.CharField(max_length=100, required=False, allow_blank=True, trim_whitespace=True)
+    latitude = serializers.FloatField(min_value=-90, max_value=90, required=False)
+    longitude = serializers.FloatField(min_value=-180, max_value=180, required=False)
+    radius = serializers.IntegerField(min_value=1, max_value=50_000, default=5_000)
+    amenities = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, max_length=30)
+    options = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, max_length=30)
+
+    def validate(self, data: dict) -> dict:
+        if ("latitude" in data) != ("longitude" in data):
+            raise serializers.ValidationError("latitude and longitude must be given together.")
+
+        check_in_date = data["check_in_date"]
+        check_out_date = data["check_out_date"]
+
+        if check_in_date >= check_out_date:
+            raise serializers.ValidationError("Check-out date must be after check-in date.")
+
+        if check_in_date < date.today():
+            raise serializers.ValidationError("Check-in date cannot be in the past.")
+
+        max_booking_days = 30
+        if (check_out_date - check_in_date).days > max_booking_days:
+            raise serializers.ValidationError(f"Booking duration cannot exceed {max_booking_days} days.")
+
+        if "min_price" in data and "max_price" in data and data["min_price"] > data["max_price"]:
+            raise serializers.ValidationError("min_price cannot be greater than max_price.")
+
+        return data
+
+
+# 숙소별 최저가 객실 (AvailabilitySearchService.search 결과)
+class AvailabilitySearchResultSerializer(serializers.ModelSerializer):
+    accommodation_id = serializers.IntegerField(source="accommodation.id")
+    accommodation_name = serializers.CharField(source="accommodation.name")
+    hotel_img = serializers.SerializerMethodField()
+    room_id = serializers.IntegerField(source="id")
+    room_name = serializers.CharField(source="name")
+    nights = serializers.IntegerField()
+    total_price = serializers.IntegerField()
+    distance = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Room
+        fields = [
+            "accommodation_id",
+            "accommodation_name",
+            "hotel_img",
+            "room_id",
+            "room_name",
+            "price",
+            "nights",
+            "total_price",
+            "distance",
+        ]
+
+    def get_hotel_img(self, obj: Room) -> Union[str, None]:
+        card = getattr(obj.accommodation, "card", None)
+        if card is None:
+            return None
+        return select_image(
+            card.representative_image, card.representative_image_derivatives, "card", get_image_format(self.context)
+        )
+
+    # 위치 조건으로 검색한 경우에만 (미터)
+    def get_distance(self, obj: Room) -> Union[float, None]:
+        distance = getattr(obj, "distance", None)
+        return round(distance.m, 1) if distance is not None else None
+
+
+class NearbySearchQuerySerializer(serializers.Serializer):
+    latitude = serializers.FloatField(min_value=-90, max_value=90)
+    longitude = serializers.FloatField(min_value=-180, max_value=180)
+    radius = serializers.IntegerField(min_value=1, max_value=50_000, default=5_000)
+    guests_count = serializers.IntegerField(min_value=1, required=False)
+    amenities = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, max_length=30)
+    min_price = serializers.IntegerField(min_value=0, required=False)
+    max_price = serializers.IntegerField(min_value=0, required=False)
+
+    def validate(self, data: dict) -> dict:
+        if "min_price" in data and "max_price" in data and data["min_price"] > data["max_price"]:
+            raise serializers.ValidationError("min_price cannot be greater than max_price.")
+        return data
+
+
+# 주변 숙소 (Accommodation.objects.nearby 결과, 카드는 select_related("card"))
+class NearbyAccommodationSerializer(serializers.ModelSerializer):
+    min_price = serializers.SerializerMethodField()
+    hotel_img = serializers.SerializerMethodField()
+    address = serializers.SerializerMethodField()
+    distance = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Accommodation
+        fields = ["id", "name", "min_price", "hotel_img", "address", "average_rating", "distance"]
+
+    def get_min_price(self, obj: Accommodation) -> Union[int, None]:
+        card = getattr(obj, "card", None)
+        return card.min_price if card else None
+
+    def get_hotel_img(self, obj: Accommodation) -> Union[str, None]:
+        card = getattr(obj, "card", None)
+        if card is None:
+            return None
+        return select_image(
+            card.representative_image, card.representative_image_derivatives, "card", get_image_format(self.context)
+        )
+
+    def get_address(self, obj: Accommodation) -> Union[str, None]:
+        card = getattr(obj, "card", None)
+        return card.address if card else None
+
+    # 미터 단위
+    def get_distance(self, obj: Accommodation) -> float:
+        return round(obj.distance, 1)
@@ -0,0 +1,95 @@
+from datetime import date
+from typing import Optional
+
+from django.contrib.gis.db.models.functions import Distance
+from django.contrib.gis.geos import Point
+from django.contrib.gis.measure import D
+from django.db.models import F, QuerySet, Value, Window
+from django.db.models.functions import RowNumber
+
+from apps.accommodations.models import Accommodation
+from apps.accommodations.querysets.accommodation_queryset import (
+    text_search_expressions,
+)
+from apps.amenities.services.amenity_index_service import AmenityIndexService
+from apps.rooms.models import Room
+
+
+class AvailabilitySearchService:
+    """
+    날짜/인원/가격 조건으로 예약 가능한 숙소를 검색한다
+    숙소별 최저가 객실 1개와 숙박 총액을 한 번의 쿼리(ROW_NUMBER() OVER (PARTITION BY accommodation))로 구한다
+    검색어(query), 위치(point, radius_m), 부대시설/옵션(amenity_ids, option_ids) 조건도 같은 쿼리 안에서 함께 건다
+    """
+
+    @staticmethod
+    def matching_rooms(
+        check_in_date: date,
+        check_out_date: date,
+        guests_count: int,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        query: Optional[str] = None,
+        point: Optional[Point] = None,
+        radius_m: Optional[float] = None,
+        amenity_ids: Optional[list[int]] = None,
+        option_ids: Optional[list[int]] = None,
+    ) -> QuerySet:
+        """검색 조건에 맞는 객실 (숙소별 순위를 매기기 전)"""
+        rooms = (
+            Room.objects.available()
+            .filter(accommodation__is_active=True)
+            .within_capacity_range(guests_count)
+            .available_for_dates(check_in_date, check_out_date)
+        )
+        # 가격 조건은 1박 요금 기준 (순위를 매기기 전에 걸러야 조건에 맞는 최저가 객실이 남는다)
+        if min_price is not None:
+            rooms = rooms.filter(price__gte=min_price)
+        if max_price is not None:
+            rooms = rooms.filter(price__lte=max_price)
+        if amenity_ids:
+            rooms = rooms.with_amenities(amenity_ids)
+        if option_ids:
+            rooms = rooms.with_options(option_ids)
+        if point is not None:
+            rooms = rooms.filter(accommodation__gps_info__location__dwithin=(point, D(m=radius_m))).annotate(
+                distance=Distance("accommodation__gps_info__location", point)
+            )
+        if query:
+            condition, rank = text_search_expressions(query, prefix="accommodation__card__")
+            rooms = rooms.filter(condition).annotate(search_rank=rank)
+        return rooms
+
+    @staticmethod
+    def search(check_in_date: date, check_out_date: date, guests_count: int, **filters) -> QuerySet:
+        """숙소별 최저가 객실 - 검색어가 있으면 검색 순위, 위치가 있으면 거리, 그 다음 숙박 총액 순"""
+        nights = (check_out_date - check_in_date).days
+        rooms = AvailabilitySearchService.matching_rooms(check_in_date, check_out_date, guests_count, **filters)
+
+        ordering = ["total_price", "accommodation_id"]
+        if filters.get("point") is not None:
+            ordering = ["distance", *ordering]
+        if filters.get("query"):
+            ordering = ["-search_rank", *ordering]
+
+        return (
+            rooms.select_related("accommodation", "accommodation__card")
+            .annotate(
+                nights=Value(nights),
+                total_price=F("price") * nights,
+                price_rank=Window(
+                    RowNumber(),
+                    partition_by=F("accommodation_id"),
+                    order_by=[F("price").asc(), F("id").asc()],
+                ),
+            )
+            .filter(price_rank=1)
+            .order_by(*ordering)
+        )
+
+    @staticmethod
+    def amenity_facets(check_in_date: date, check_out_date: date, guests_count: int, **filters) -> dict[int, int]:
+        """검색 결과 숙소들의 부대시설별 숙소 수"""
+        rooms = AvailabilitySearchService.matching_rooms(check_in_date, check_out_date, guests_count, **filters)
+        accommodations = Accommodation.objects.filter(pk__in=rooms.values("accommodation_id"))
+        return AmenityIndexService.amenity_facets(accommodations)
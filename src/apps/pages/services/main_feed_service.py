@@ -0,0 +1,82 @@
+import hashlib
+import random
+import time
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache, caches
+
+from apps.accommodations.models import Accommodation
+
+FEED_CACHE_KEY = "main_feed:ids"
+FEED_LOCK_CACHE_KEY = "main_feed:lock"
+FEED_PERMUTATION_CACHE_KEY = "main_feed:{version}:{seed}"
+
+
+class MainFeedService:
+    """
+    메인 피드 서비스
+    활성 숙소 id 목록을 주기적으로 캐시에 만들어 두고, 시드별로 섞은 순열을 offset 으로 잘라서 제공한다.
+    """
+
+    # 피드 재생성 주기(초) - 지나면 다음 요청 하나가 피드를 다시 만든다
+    timeout = getattr(settings, "MAIN_FEED_TIMEOUT", 60 * 10)
+    # 시드 개수 - 캐시에 올라가는 순열 수의 상한
+    seed_buckets = getattr(settings, "MAIN_FEED_SEED_BUCKETS", 64)
+
+    @staticmethod
+    def build_feed() -> dict:
+        ids = list(Accommodation.objects.filter(is_active=True).order_by("id").values_list("id", flat=True))
+        feed = {"version": time.time_ns(), "built_at": time.time(), "ids": ids}
+        # 재생성이 늦어져도 이전 피드를 계속 쓸 수 있도록 만료는 주기의 두 배로 둔다
+        caches["catalog"].set(FEED_CACHE_KEY, feed, MainFeedService.timeout * 2)
+        cache.delete(FEED_LOCK_CACHE_KEY)
+        return feed
+
+    @staticmethod
+    def get_feed() -> dict:
+        feed = caches["catalog"].get(FEED_CACHE_KEY)
+        if feed is None:
+            return MainFeedService.build_feed()
+
+        is_stale = time.time() - feed["built_at"] > MainFeedService.timeout
+        # 여러 요청이 동시에 재생성하지 않도록 락을 잡은 요청만 다시 만든다
+        if is_stale and cache.add(FEED_LOCK_CACHE_KEY, 1, 30):
+            return MainFeedService.build_feed()
+        return feed
+
+    @staticmethod
+    def new_seed() -> int:
+        return random.randrange(MainFeedService.seed_buckets)
+
+    @staticmethod
+    def normalize_seed(seed: Optional[int]) -> int:
+        if seed is None:
+            return MainFeedService.new_seed()
+        return seed % MainFeedService.seed_buckets
+
+    @staticmethod
+    def shuffle(ids: list[int], seed: int) -> list[int]:
+        # id 별 해시로 정렬하므로 피드가 다시 만들어져도 남아있는 숙소끼리의 순서는 그대로 유지된다
+        def sort_key(pk: int) -> bytes:
+            return hashlib.blake2b(f"{seed}:{pk}".encode(), digest_size=8).digest()
+
+        return sorted(ids, key=sort_key)
+
+    @staticmethod
+    def get_permutation(seed: int) -> list[int]:
+        feed = MainFeedService.get_feed()
+        key = FEED_PERMUTATION_CACHE_KEY.format(version=feed["version"], seed=seed)
+
+        # 피드 버전별 순열은 바뀌지 않으므로 워커 메모리(catalog 로컬 계층)에서 바로 읽는다
+        permutation = caches["catalog"].get(key)
+        if permutation is None:
+            permutation = MainFeedService.shuffle(feed["ids"], seed)
+            caches["catalog"].set(key, permutation, MainFeedService.timeout * 2)
+        return permutation
+
+    @staticmethod
+    def get_page(seed: int, offset: int, limit: int) -> tuple[list[int], int]:
+        """시드 순열에서 offset 부터 limit 개의 숙소 id 와 전체 개수를 반환"""
+        permutation = MainFeedService.get_permutation(seed)
+        return permutation[offset : offset + limit], len(permutation)
@@ -0,0 +1,123 @@
+import math
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.contrib.gis.geos import Point
+from django.core.cache import cache
+from django.db import connection, transaction
+
+from apps.accommodations.models import Accommodation, AccommodationCard, GPS_Info
+
+MAP_TILE_CACHE_KEY = "map_tile:{z}:{x}:{y}"
+# Web Mercator 타일이 표현하는 위도 한계
+MAX_LATITUDE = 85.0511287798
+
+
+class MapClusterService:
+    """
+    지도 마커 클러스터링
+    (z, x, y) 타일을 grid_size x grid_size 격자로 나눠 SQL 에서 격자별로 묶으므로
+    타일 하나의 응답은 숙소 수와 관계없이 최대 grid_size^2 개 클러스터로 제한된다.
+    타일 결과는 캐시하고, 숙소가 이동/비활성화되면 이전/현재 위치가 속한 모든 줌의 타일을 지운다.
+    타일은 경도/위도 평면의 사각형이므로 geography 가 아닌 geometry 로 비교한다 (gps_info_location_geometry_gist 인덱스)
+    - geography 로 바꾼 envelope 는 낮은 줌에서 ±180 변이 날짜변경선 하나로 합쳐지거나 측지선 경계가 되어 타일 안의 점을 놓친다
+    (최저가 변경은 만료 시간 안에 반영)
+    """
+
+    timeout = getattr(settings, "MAP_TILE_CACHE_TIMEOUT", 60 * 10)
+    grid_size = getattr(settings, "MAP_CLUSTER_GRID_SIZE", 8)
+    max_zoom = getattr(settings, "MAP_MAX_ZOOM", 20)
+
+    @staticmethod
+    def tile_bounds(z: int, x: int, y: int) -> tuple[float, float, float, float]:
+        """(west, south, east, north)"""
+        n = 2**z
+
+        def latitude(tile_y: int) -> float:
+            return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * tile_y / n))))
+
+        return x / n * 360 - 180, latitude(y + 1), (x + 1) / n * 360 - 180, latitude(y)
+
+    @staticmethod
+    def tile_for(longitude: float, latitude: float, z: int) -> tuple[int, int]:
+        n = 2**z
+        latitude = max(min(latitude, MAX_LATITUDE), -MAX_LATITUDE)
+        x = int((longitude + 180) / 360 * n)
+        y = int((1 - math.asinh(math.tan(math.radians(latitude))) / math.pi) / 2 * n)
+        return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+    @staticmethod
+    def cluster(z: int, x: int, y: int) -> list[dict]:
+        west, south, east, north = MapClusterService.tile_bounds(z, x, y)
+        grid_size = MapClusterService.grid_size
+        sql = f"""
+            SELECT
+                COUNT(*) AS count,
+                MIN(c.min_price) AS min_price,
+                AVG(ST_X(g.location::geometry)) AS longitude,
+                AVG(ST_Y(g.location::geometry)) AS latitude,
+                MIN(a.id) AS accommodation_id
+            FROM {GPS_Info._meta.db_table} g
+            JOIN {Accommodation._meta.db_table} a ON a.id = g.accommodation_id AND a.is_active
+            LEFT JOIN {AccommodationCard._meta.db_table} c ON c.accommodation_id = a.id
+            WHERE g.location::geometry && ST_MakeEnvelope(%(west)s, %(south)s, %(east)s, %(north)s, 4326)
+              AND ST_X(g.location::geometry) >= %(west)s AND ST_X(g.location::geometry) < %(east)s
+              AND ST_Y(g.location::geometry) > %(south)s AND ST_Y(g.location::geometry) <= %(north)s
+            GROUP BY
+                LEAST(FLOOR((ST_X(g.location::geometry) - %(west)s) / %(cell_width)s), %(last_cell)s),
+                LEAST(FLOOR((%(north)s - ST_Y(g.location::geometry)) / %(cell_height)s), %(last_cell)s)
+            ORDER BY count DESC
+        """
+        params = {
+            "west": west,
+            "south": south,
+            "east": east,
+            "north": north,
+            "cell_width": (east - west) / grid_size,
+            "cell_height": (north - south) / grid_size,
+            "last_cell": grid_size - 1,
+        }
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+
+        return [
+            {
+                "count": count,
+                "min_price": min_price,
+                "longitude": round(longitude, 6),
+                "latitude": round(latitude, 6),
+                # 숙소가 하나뿐인 클러스터는 바로 상세로 이동할 수 있도록
+                "accommodation_id": accommodation_id if count == 1 else None,
+            }
+            for count, min_price, longitude, latitude, accommodation_id in rows
+        ]
+
+    @staticmethod
+    def get_tile(z: int, x: int, y: int) -> list[dict]:
+        key = MAP_TILE_CACHE_KEY.format(z=z, x=x, y=y)
+        clusters = cache.get(key)
+        if clusters is None:
+            clusters = MapClusterService.cluster(z, x, y)
+            cache.set(key, clusters, MapClusterService.timeout)
+        return clusters
+
+    @staticmethod
+    def tile_keys(points: Iterable[Optional[Point]]) -> set[str]:
+        keys = set()
+        for point in points:
+            if point is None:
+                continue
+            for z in range(MapClusterService.max_zoom + 1):
+                x, y = MapClusterService.tile_for(point.x, point.y, z)
+                keys.add(MAP_TILE_CACHE_KEY.format(z=z, x=x, y=y))
+        return keys
+
+    @staticmethod
+    def invalidate(*points: Optional[Point]) -> None:
+        cache.delete_many(list(MapClusterService.tile_keys(points)))
+
+    @staticmethod
+    def schedule_invalidate(*points: Optional[Point]) -> None:
+        """트랜잭션 커밋 후 해당 위치가 속한 모든 줌의 타일 캐시를 지운다"""
+        transaction.on_commit(lambda: MapClusterService.invalidate(*points))
@@ -0,0 +1,73 @@
+from datetime import time
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.accommodations.models import (
+    Accommodation,
+    Accommodation_Image,
+    GPS_Info,
+    RefundPolicy,
+)
+from apps.rooms.models import Room, Room_Image
+from apps.users.models import BusinessUser, User
+
+
+class AccommodationDetailQueryCountTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_superuser(email="detail@test.com", password="test123")
+        self.host = BusinessUser.objects.create(user=self.user)
+
+    def create_accommodation(self, room_count):
+        accommodation = Accommodation.objects.create(host=self.host, name=f"hotel with {room_count} rooms")
+        GPS_Info.objects.create(
+            accommodation=accommodation, city="Seoul", states="Jung-gu", road_name="Sejong-daero", address="110"
+        )
+        Accommodation_Image.objects.create(accommodation=accommodation, image="accommodation_images/a.jpg")
+        RefundPolicy.objects.create(
+            accommodation=accommodation,
+            seven_days_before=100,
+            five_days_before=80,
+            three_days_before=50,
+            one_day_before=20,
+            same_day=0,
+        )
+        for i in range(room_count):
+            room = Room.objects.create(
+                accommodation=accommodation,
+                name=f"room {i}",
+                capacity=2,
+                max_capacity=4,
+                price=50000 + i * 1000,
+                stay_type=True,
+                check_in_time=time(15, 0),
+                check_out_time=time(11, 0),
+            )
+            Room_Image.objects.create(room=room, image=f"room_images/{i}.jpg", is_representative=True)
+        return accommodation
+
+    def count_detail_queries(self, accommodation):
+        url = reverse("pages:hotel_detail", kwargs={"pk": accommodation.pk})
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries), response
+
+    def test_query_count_is_flat_from_1_to_50_rooms(self):
+        # given
+        small = self.create_accommodation(room_count=1)
+        large = self.create_accommodation(room_count=50)
+
+        # when
+        small_queries, _ = self.count_detail_queries(small)
+        large_queries, response = self.count_detail_queries(large)
+
+        # then
+        self.assertEqual(small_queries, large_queries)
+        self.assertEqual(len(response.data["rooms"]), 50)
+        self.assertEqual(response.data["min_price"], 50000)
+        self.assertEqual(response.data["rooms"][0]["images"], "room_images/0.jpg")
+        self.assertEqual(response.data["address"], "Seoul Jung-gu Sejong-daero 110")
@@ -0,0 +1,192 @@
+from datetime import date, time, timedelta
+
+from django.core.cache import caches
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.accommodations.models import Accommodation
+from apps.amenities.models import AccommodationAmenity, Amenity, Option, RoomOption
+from apps.rooms.models import Room, RoomInventory, RoomNightInventory
+from apps.users.models import BusinessUser, User
+
+
+class AvailabilitySearchTest(APITestCase):
+    def setUp(self):
+        user = User.objects.create_superuser(email="search@test.com", password="test123")
+        self.host = BusinessUser.objects.create(user=user)
+        self.check_in = date.today() + timedelta(days=5)
+        self.check_out = self.check_in + timedelta(days=2)
+        self.url = reverse("pages:availability_search")
+
+    def create_room(self, accommodation, price, capacity=2, max_capacity=4, count_room=1):
+        room = Room.objects.create(
+            accommodation=accommodation,
+            name=f"room {price}",
+            capacity=capacity,
+            max_capacity=max_capacity,
+            price=price,
+            stay_type=True,
+            check_in_time=time(15, 0),
+            check_out_time=time(11, 0),
+        )
+        RoomInventory.objects.create(room=room, count_room=count_room)
+        return room
+
+    def search(self, **params):
+        query = {"check_in_date": self.check_in, "check_out_date": self.check_out, "guests_count": 2, **params}
+        return self.client.get(self.url, query)
+
+    def test_returns_cheapest_available_room_per_accommodation(self):
+        # given
+        hotel = Accommodation.objects.create(host=self.host, name="hotel")
+        sold_out = self.create_room(hotel, 50000)
+        self.create_room(hotel, 70000)
+        self.create_room(hotel, 90000)
+        motel = Accommodation.objects.create(host=self.host, name="motel")
+        self.create_room(motel, 60000)
+        self.create_room(motel, 40000, capacity=1, max_capacity=1)
+        RoomNightInventory.objects.create(
+            room=sold_out, date=self.check_in + timedelta(days=1), nights_available=1, nights_sold=1
+        )
+
+        # when
+        response = self.search()
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+        results = response.data["results"]
+        self.assertEqual([result["accommodation_id"] for result in results], [motel.pk, hotel.pk])
+        self.assertEqual([result["price"] for result in results], [60000, 70000])
+        self.assertEqual(results[1]["total_price"], 140000)
+        self.assertEqual(results[1]["nights"], 2)
+
+    def test_price_filter_applies_before_ranking(self):
+        # given
+        hotel = Accommodation.objects.create(host=self.host, name="hotel")
+        self.create_room(hotel, 50000)
+        self.create_room(hotel, 80000)
+
+        # when
+        response = self.search(min_price=60000)
+
+        # then
+        self.assertEqual([result["price"] for result in response.data["results"]], [80000])
+
+    def test_search_runs_in_fixed_number_of_queries(self):
+        # given
+        for i in range(15):
+            accommodation = Accommodation.objects.create(host=self.host, name=f"hotel {i}")
+            self.create_room(accommodation, 50000 + i)
+            self.create_room(accommodation, 60000 + i)
+
+        # when / then (count 1 + 목록 1)
+        with self.assertNumQueries(2):
+            response = self.search(page_size=10)
+        self.assertEqual(response.data["count"], 15)
+        self.assertEqual(len(response.data["results"]), 10)
+
+    def test_invalid_dates_return_400(self):
+        # when
+        response = self.search(check_out_date=self.check_in)
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class AmenityFilterTest(APITestCase):
+    def setUp(self):
+        caches["catalog"].clear()
+        user = User.objects.create_superuser(email="amenity@test.com", password="test123")
+        self.host = BusinessUser.objects.create(user=user)
+        self.wifi = Amenity.objects.create(name="wifi", category="basic")
+        self.parking = Amenity.objects.create(name="parking", category="basic")
+        self.pool = Amenity.objects.create(name="pool", category="leisure")
+        self.check_in = date.today() + timedelta(days=5)
+        self.url = reverse("pages:availability_search")
+
+    def create_accommodation(self, name, amenities, options=()):
+        with self.captureOnCommitCallbacks(execute=True):
+            accommodation = Accommodation.objects.create(host=self.host, name=name)
+            for amenity in amenities:
+                AccommodationAmenity.objects.create(accommodation=accommodation, amenity=amenity)
+            room = Room.objects.create(
+                accommodation=accommodation,
+                name="standard",
+                capacity=1,
+                max_capacity=4,
+                price=100000,
+                stay_type=True,
+                check_in_time=time(15, 0),
+                check_out_time=time(11, 0),
+            )
+            RoomInventory.objects.create(room=room, count_room=1)
+            for option in options:
+                RoomOption.objects.create(room=room, option=option)
+        return accommodation
+
+    def search(self, **params):
+        query = {
+            "check_in_date": self.check_in,
+            "check_out_date": self.check_in + timedelta(days=1),
+            "guests_count": 2,
+            **params,
+        }
+        return self.client.get(self.url, query)
+
+    def test_has_all_amenities_filter(self):
+        # given
+        full = self.create_accommodation("full", [self.wifi, self.parking, self.pool])
+        self.create_accommodation("no pool", [self.wifi, self.parking])
+
+        # when
+        response = self.search(amenities=[self.wifi.pk, self.pool.pk])
+
+        # then
+        self.assertEqual([result["accommodation_id"] for result in response.data["results"]], [full.pk])
+
+    def test_facets_count_every_amenity_over_result_set(self):
+        # given
+        self.create_accommodation("a", [self.wifi, self.parking])
+        self.create_accommodation("b", [self.wifi])
+        self.create_accommodation("c", [self.wifi, self.pool])
+
+        # when
+        response = self.search(amenities=[self.wifi.pk], facets="true")
+
+        # then
+        counts = {facet["name"]: facet["count"] for facet in response.data["facets"]}
+        self.assertEqual(counts, {"wifi": 3, "parking": 1, "pool": 1})
+
+    def test_room_option_ids_follow_room_option_writes(self):
+        # given
+        balcony = Option.objects.create(name="balcony", category="view")
+        bathtub = Option.objects.create(name="bathtub", category="bath")
+        accommodation = self.create_accommodation("options", [], options=[balcony, bathtub])
+        room = Room.objects.get(accommodation=accommodation)
+
+        # when
+        RoomOption.objects.filter(room=room, option=bathtub).delete()
+
+        # then
+        room.refresh_from_db()
+        self.assertEqual(room.option_ids, [balcony.pk])
+        self.assertTrue(Room.objects.with_options([balcony.pk]).exists())
+        self.assertFalse(Room.objects.with_options([balcony.pk, bathtub.pk]).exists())
+
+    def test_saving_room_does_not_overwrite_option_ids(self):
+        # given - 옵션이 바뀌기 전에 불러온 객실 (수정 API 가 들고 있는 인스턴스)
+        balcony = Option.objects.create(name="balcony", category="view")
+        accommodation = self.create_accommodation("options", [])
+        room = Room.objects.get(accommodation=accommodation)
+        RoomOption.objects.create(room=room, option=balcony)
+
+        # when
+        room.price = 120000
+        room.save()
+
+        # then
+        room.refresh_from_db()
+        self.assertEqual(room.price, 120000)
+        self.assertEqual(room.option_ids, [balcony.pk])
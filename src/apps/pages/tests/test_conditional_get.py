@@ -0,0 +1,68 @@
+from datetime import time
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.accommodations.models import Accommodation, Accommodation_Image
+from apps.rooms.models import Room, Room_Image
+from apps.users.models import BusinessUser, User
+
+
+class ConditionalGetTest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_superuser(email="etag@test.com", password="test123")
+        self.host = BusinessUser.objects.create(user=self.user)
+        self.accommodation = Accommodation.objects.create(host=self.host, name="etag hotel")
+        self.room = Room.objects.create(
+            accommodation=self.accommodation,
+            name="standard",
+            capacity=2,
+            max_capacity=2,
+            price=80000,
+            stay_type=True,
+            check_in_time=time(15, 0),
+            check_out_time=time(11, 0),
+        )
+        self.detail_url = reverse("pages:hotel_detail", kwargs={"pk": self.accommodation.pk})
+        self.room_url = reverse("pages:room_detail", kwargs={"hotel_pk": self.accommodation.pk, "pk": self.room.pk})
+
+    def test_if_none_match_returns_304(self):
+        # given
+        first = self.client.get(self.detail_url)
+
+        # when
+        second = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        # then
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertIn("Last-Modified", first)
+        self.assertEqual(second.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(second["ETag"], first["ETag"])
+
+    def test_child_changes_update_validator(self):
+        # given
+        etag = self.client.get(self.detail_url)["ETag"]
+        room_etag = self.client.get(self.room_url)["ETag"]
+
+        # when
+        Room_Image.objects.create(room=self.room, image="room_images/new.jpg")
+
+        # then
+        self.assertEqual(self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_200_OK)
+        self.assertEqual(self.client.get(self.room_url, HTTP_IF_NONE_MATCH=room_etag).status_code, status.HTTP_200_OK)
+
+    def test_accommodation_read_view_supports_etag(self):
+        # given
+        url = reverse("accommodations:accommodation-image-detail", kwargs={"pk": self.accommodation.pk})
+        etag = self.client.get(url)["ETag"]
+
+        # when
+        not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        Accommodation_Image.objects.create(accommodation=self.accommodation, image="accommodation_images/new.jpg")
+        modified = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        # then
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(modified.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(modified.data), 1)
@@ -0,0 +1,76 @@
+from django.core.cache import cache, caches
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.accommodations.models import Accommodation
+from apps.pages.services.main_feed_service import MainFeedService
+from apps.users.models import BusinessUser, User
+
+
+class MainFeedViewTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        caches["catalog"].clear()
+        self.user = User.objects.create_superuser(email="feed@test.com", password="test123")
+        self.host = BusinessUser.objects.create(user=self.user)
+        self.accommodations = [
+            Accommodation.objects.create(host=self.host, name=f"accommodation {i}") for i in range(25)
+        ]
+        self.url = reverse("pages:main_list")
+
+    def test_pages_are_stable_for_one_seed(self):
+        # given
+        first = self.client.get(self.url, {"seed": 7, "limit": 10})
+        seed = first.data["seed"]
+
+        # when
+        pages = [first.data["results"]]
+        next_url = first.data["next"]
+        while next_url is not None:
+            response = self.client.get(next_url)
+            self.assertEqual(response.data["seed"], seed)
+            pages.append(response.data["results"])
+            next_url = response.data["next"]
+
+        # then
+        ids = [item["id"] for page in pages for item in page]
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(first.data["count"], 25)
+        self.assertEqual(len(ids), 25)
+        self.assertEqual(set(ids), {accommodation.id for accommodation in self.accommodations})
+
+    def test_same_seed_returns_same_order(self):
+        # when
+        first = self.client.get(self.url, {"seed": 3})
+        second = self.client.get(self.url, {"seed": 3})
+
+        # then
+        self.assertEqual(
+            [item["id"] for item in first.data["results"]],
+            [item["id"] for item in second.data["results"]],
+        )
+
+    def test_inactive_accommodation_is_skipped(self):
+        # given
+        MainFeedService.build_feed()
+        hidden = self.accommodations[0]
+        hidden.is_active = False
+        hidden.save()
+
+        # when
+        response = self.client.get(self.url, {"seed": 1, "limit": 100})
+
+        # then
+        self.assertNotIn(hidden.id, [item["id"] for item in response.data["results"]])
+
+    def test_rebuild_keeps_relative_order(self):
+        # given
+        ids = [accommodation.id for accommodation in self.accommodations]
+        before = MainFeedService.shuffle(ids, seed=5)
+
+        # when
+        after = MainFeedService.shuffle(ids[1:], seed=5)
+
+        # then
+        self.assertEqual([pk for pk in before if pk != ids[0]], after)
@@ -0,0 +1,132 @@
+from django.contrib.gis.geos import Point
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.accommodations.models import Accommodation, AccommodationCard, GPS_Info
+from apps.pages.services.map_cluster_service import MapClusterService
+from apps.users.models import BusinessUser, User
+
+ZOOM = 12
+# 강남역
+ORIGIN = (127.0276, 37.4979)
+
+
+class MapClusterTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create_superuser(email="map@test.com", password="test123")
+        self.host = BusinessUser.objects.create(user=user)
+        self.x, self.y = MapClusterService.tile_for(*ORIGIN, ZOOM)
+        self.url = reverse("pages:map_clusters", kwargs={"z": ZOOM, "x": self.x, "y": self.y})
+
+    def create_accommodation(self, longitude, latitude, min_price):
+        accommodation = Accommodation.objects.create(host=self.host, name="map hotel")
+        with self.captureOnCommitCallbacks(execute=True):
+            gps_info = GPS_Info.objects.create(
+                accommodation=accommodation,
+                city="서울",
+                states="강남구",
+                road_name="강남대로",
+                address="서울 강남구 강남대로",
+                location=Point(longitude, latitude, srid=4326),
+            )
+        AccommodationCard.objects.update_or_create(accommodation=accommodation, defaults={"min_price": min_price})
+        return accommodation, gps_info
+
+    def test_clusters_carry_count_and_min_price(self):
+        # given (같은 격자에 3개)
+        for i, price in enumerate([90000, 70000, 80000]):
+            self.create_accommodation(ORIGIN[0] + i * 0.0001, ORIGIN[1], price)
+
+        # when
+        response = self.client.get(self.url)
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        clusters = response.data["clusters"]
+        self.assertEqual(len(clusters), 1)
+        self.assertEqual(clusters[0]["count"], 3)
+        self.assertEqual(clusters[0]["min_price"], 70000)
+        self.assertIsNone(clusters[0]["accommodation_id"])
+
+    def test_cluster_count_is_bounded_by_grid(self):
+        # given (타일 전체에 흩어진 숙소)
+        west, south, east, north = MapClusterService.tile_bounds(ZOOM, self.x, self.y)
+        for i in range(12):
+            for j in range(12):
+                longitude = west + (east - west) * (i + 0.5) / 12
+                latitude = south + (north - south) * (j + 0.5) / 12
+                self.create_accommodation(longitude, latitude, 50000)
+
+        # when
+        clusters = self.client.get(self.url).data["clusters"]
+
+        # then
+        self.assertLessEqual(len(clusters), MapClusterService.grid_size**2)
+        self.assertEqual(sum(cluster["count"] for cluster in clusters), 144)
+
+    def test_low_zoom_tiles_include_points(self):
+        # given - 강남과 부산 (z=0 은 세계 전체, z=1/2 는 대륙 단위 타일)
+        self.create_accommodation(*ORIGIN, 50000)
+        self.create_accommodation(129.0756, 35.1796, 40000)
+
+        for z in (0, 1, 2):
+            with self.subTest(z=z):
+                # when
+                x, y = MapClusterService.tile_for(*ORIGIN, z)
+                clusters = self.client.get(reverse("pages:map_clusters", kwargs={"z": z, "x": x, "y": y})).data[
+                    "clusters"
+                ]
+
+                # then
+                self.assertEqual(sum(cluster["count"] for cluster in clusters), 2)
+                self.assertEqual(min(cluster["min_price"] for cluster in clusters), 40000)
+
+    def test_low_zoom_tile_excludes_other_hemisphere(self):
+        # given
+        self.create_accommodation(*ORIGIN, 50000)
+
+        # when - 서반구 북쪽 타일
+        response = self.client.get(reverse("pages:map_clusters", kwargs={"z": 1, "x": 0, "y": 0}))
+
+        # then
+        self.assertEqual(response.data["clusters"], [])
+
+    def test_tile_is_cached_and_invalidated_on_move(self):
+        # given
+        accommodation, gps_info = self.create_accommodation(*ORIGIN, 50000)
+        self.client.get(self.url)
+
+        # when
+        with self.assertNumQueries(0):
+            cached = self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            gps_info.location = Point(129.0756, 35.1796, srid=4326)  # 부산
+            gps_info.save()
+        moved = self.client.get(self.url)
+
+        # then
+        self.assertEqual(cached.data["clusters"][0]["accommodation_id"], accommodation.pk)
+        self.assertEqual(moved.data["clusters"], [])
+
+    def test_deactivation_invalidates_tile(self):
+        # given
+        accommodation, _ = self.create_accommodation(*ORIGIN, 50000)
+        self.client.get(self.url)
+
+        # when
+        with self.captureOnCommitCallbacks(execute=True):
+            accommodation.is_active = False
+            accommodation.save()
+
+        # then
+        self.assertEqual(self.client.get(self.url).data["clusters"], [])
+
+    def test_out_of_range_tile_returns_400(self):
+        # when
+        response = self.client.get(reverse("pages:map_clusters", kwargs={"z": 1, "x": 5, "y": 0}))
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,80 @@
+from datetime import time
+
+from django.contrib.gis.geos import Point
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.accommodations.models import Accommodation, GPS_Info
+from apps.rooms.models import Room
+from apps.users.models import BusinessUser, User
+
+# 강남역
+ORIGIN = (127.0276, 37.4979)
+
+
+class NearbySearchTest(APITestCase):
+    def setUp(self):
+        user = User.objects.create_superuser(email="nearby@test.com", password="test123")
+        self.host = BusinessUser.objects.create(user=user)
+        self.url = reverse("pages:nearby_search")
+
+    def create_accommodation(self, name, longitude, latitude, price=80000, is_active=True):
+        accommodation = Accommodation.objects.create(host=self.host, name=name, is_active=is_active)
+        GPS_Info.objects.create(
+            accommodation=accommodation,
+            city="서울",
+            states="강남구",
+            road_name="강남대로",
+            address="서울 강남구 강남대로",
+            location=Point(longitude, latitude, srid=4326),
+        )
+        Room.objects.create(
+            accommodation=accommodation,
+            name="standard",
+            capacity=2,
+            max_capacity=4,
+            price=price,
+            stay_type=True,
+            check_in_time=time(15, 0),
+            check_out_time=time(11, 0),
+        )
+        return accommodation
+
+    def search(self, **params):
+        return self.client.get(self.url, {"longitude": ORIGIN[0], "latitude": ORIGIN[1], **params})
+
+    def test_orders_by_distance_within_radius(self):
+        # given (위도 0.01도 ≈ 1.1km)
+        far = self.create_accommodation("far", ORIGIN[0], ORIGIN[1] + 0.03)
+        near = self.create_accommodation("near", ORIGIN[0], ORIGIN[1] + 0.005)
+        self.create_accommodation("out of radius", ORIGIN[0], ORIGIN[1] + 0.2)
+        self.create_accommodation("inactive", ORIGIN[0], ORIGIN[1] + 0.001, is_active=False)
+
+        # when
+        response = self.search(radius=5000)
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        self.assertEqual([result["id"] for result in results], [near.pk, far.pk])
+        self.assertAlmostEqual(results[0]["distance"], 555, delta=10)
+        self.assertLess(results[0]["distance"], results[1]["distance"])
+
+    def test_composes_with_room_filters(self):
+        # given
+        self.create_accommodation("expensive", ORIGIN[0], ORIGIN[1] + 0.001, price=300000)
+        cheap = self.create_accommodation("cheap", ORIGIN[0], ORIGIN[1] + 0.002, price=70000)
+
+        # when
+        response = self.search(max_price=100000, guests_count=2)
+
+        # then
+        self.assertEqual([result["id"] for result in response.data["results"]], [cheap.pk])
+
+    def test_invalid_coordinates_return_400(self):
+        # when
+        response = self.search(latitude=120)
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,102 @@
+from datetime import time
+from unittest import mock
+
+from django.core.cache import cache, caches
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.accommodations.models import Accommodation, GPS_Info
+from apps.common.cache.response_cache import ResponseCache, accommodation_tag
+from apps.pages.views.Accommodation_view import AccommodationDetailView
+from apps.rooms.models import Room
+from apps.users.models import BusinessUser, User
+
+
+class ResponseCacheTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        caches["catalog"].clear()
+        self.user = User.objects.create_superuser(email="cache@test.com", password="test123")
+        self.host = BusinessUser.objects.create(user=self.user)
+        self.accommodation = Accommodation.objects.create(host=self.host, name="cached hotel")
+        GPS_Info.objects.create(
+            accommodation=self.accommodation, city="Busan", states="Haeundae", road_name="Haeundae-ro", address="1"
+        )
+        self.room = Room.objects.create(
+            accommodation=self.accommodation,
+            name="ocean view",
+            capacity=2,
+            max_capacity=4,
+            price=120000,
+            stay_type=True,
+            check_in_time=time(15, 0),
+            check_out_time=time(11, 0),
+        )
+        self.detail_url = reverse("pages:hotel_detail", kwargs={"pk": self.accommodation.pk})
+        self.room_url = reverse("pages:room_detail", kwargs={"hotel_pk": self.accommodation.pk, "pk": self.room.pk})
+
+    def test_second_request_is_served_from_cache(self):
+        # when
+        first = self.client.get(self.detail_url)
+        second = self.client.get(self.detail_url)
+
+        # then
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(first["X-Cache"], "MISS")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(ResponseCache.stats()["hits"], 1)
+        self.assertEqual(ResponseCache.stats()["misses"], 1)
+
+    def test_room_change_invalidates_room_and_accommodation(self):
+        # given
+        self.client.get(self.detail_url)
+        self.client.get(self.room_url)
+
+        # when
+        with self.captureOnCommitCallbacks(execute=True):
+            self.room.price = 90000
+            self.room.save()
+        detail = self.client.get(self.detail_url)
+        room = self.client.get(self.room_url)
+
+        # then
+        self.assertEqual(detail["X-Cache"], "MISS")
+        self.assertEqual(detail.data["min_price"], 90000)
+        self.assertEqual(room["X-Cache"], "MISS")
+        self.assertEqual(room.data["price"], 90000)
+
+    def test_gps_change_invalidates_accommodation_only(self):
+        # given
+        self.client.get(self.detail_url)
+        self.client.get(self.room_url)
+
+        # when
+        with self.captureOnCommitCallbacks(execute=True):
+            self.accommodation.gps_info.city = "Seoul"
+            self.accommodation.gps_info.save()
+
+        # then
+        self.assertEqual(self.client.get(self.detail_url)["X-Cache"], "MISS")
+        self.assertEqual(self.client.get(self.room_url)["X-Cache"], "HIT")
+
+    def test_change_committed_between_read_and_set_is_not_cached(self):
+        # given - 숙소를 읽은 직후(직렬화/저장 전)에 다른 요청의 변경이 커밋되고 무효화가 도착한다
+        get_object = AccommodationDetailView.get_object
+
+        def get_object_then_commit_change(view):
+            instance = get_object(view)
+            Accommodation.objects.filter(pk=self.accommodation.pk).update(name="renamed hotel")
+            ResponseCache.invalidate_tags(accommodation_tag(self.accommodation.pk))
+            return instance
+
+        # when
+        with mock.patch.object(AccommodationDetailView, "get_object", get_object_then_commit_change):
+            stale = self.client.get(self.detail_url)
+        fresh = self.client.get(self.detail_url)
+
+        # then - 이전 값은 응답으로만 나가고 캐시에는 저장되지 않는다
+        self.assertEqual(stale.data["name"], "cached hotel")
+        self.assertEqual(fresh["X-Cache"], "MISS")
+        self.assertEqual(fresh.data["name"], "renamed hotel")
@@ -6,13 +6,19 @@ from .views import (
     booking_request_view,
     booking_status_view,
     main_view,
+    map_view,
+    response_cache_view,
     room_view,
+    search_view,
 )
 
 app_name = "pages"  # 앱 이름 설정
 
 urlpatterns = [
     path("main/", main_view.MainListView.as_view(), name="main_list"),
+    path("search/", search_view.AvailabilitySearchView.as_view(), name="availability_search"),
+    path("nearby/", search_view.NearbySearchView.as_view(), name="nearby_search"),
+    path("map/<int:z>/<int:x>/<int:y>/", map_view.MapClusterView.as_view(), name="map_clusters"),
     path("accommodations/<int:pk>/", Accommodation_view.AccommodationDetailView.as_view(), name="hotel_detail"),
     path("accomodations/<int:hotel_pk>/<int:pk>/", room_view.RoomDetailView.as_view(), name="room_detail"),
     path(
@@ -21,4 +27,5 @@ urlpatterns = [
         name="booking_request",
     ),
     path("bookings/status/<int:pk>/", booking_status_view.BookingStatusView.as_view(), name="booking_status"),
+    path("cache/stats/", response_cache_view.ResponseCacheStatsView.as_view(), name="response_cache_stats"),
 ]
@@ -3,16 +3,26 @@ from rest_framework.generics import RetrieveAPIView
 from rest_framework.permissions import AllowAny
 
 from apps.accommodations.models import Accommodation
+from apps.common.cache.conditional import ConditionalGetMixin
+from apps.common.cache.mixins import ResponseCacheMixin
+from apps.common.cache.response_cache import accommodation_tag
 from apps.pages.serializers.Accommodation_serializer import (
     AccommodationDetailSerializer,
 )
 
 
 @extend_schema(tags=["Guest"])
-class AccommodationDetailView(RetrieveAPIView):
+class AccommodationDetailView(ConditionalGetMixin, ResponseCacheMixin, RetrieveAPIView):
     serializer_class = AccommodationDetailSerializer
     permission_classes = (AllowAny,)
-    queryset = Accommodation.objects.all()
+    queryset = Accommodation.objects.for_detail_page()
+    response_cache_name = "accommodation_detail"
+
+    def get_last_modified(self):
+        return Accommodation.objects.filter(pk=self.kwargs["pk"]).values_list("updated_at", flat=True).first()
+
+    def get_response_cache_tags(self):
+        return [accommodation_tag(self.kwargs["pk"])]
 
     @extend_schema(
         summary="  >> 숙박 업소 디테일 페이지 / {accommodation_id}<<",
@@ -1,17 +1,29 @@
 from drf_spectacular.utils import extend_schema
 from rest_framework.generics import RetrieveAPIView
 
+from apps.common.cache.conditional import ConditionalGetMixin
+from apps.common.cache.mixins import ResponseCacheMixin
+from apps.common.cache.response_cache import accommodation_tag, room_tag
 from apps.pages.serializers.booking_request_serializer import BookingRequestSerializer
 from apps.rooms.models import Room
 
 
 @extend_schema(tags=["Guest"])
-class BookingRequestView(RetrieveAPIView):
+class BookingRequestView(ConditionalGetMixin, ResponseCacheMixin, RetrieveAPIView):
     serializer_class = BookingRequestSerializer
+    response_cache_name = "booking_request"
 
     def get_queryset(self):
         hotel_pk = self.kwargs["hotel_pk"]
-        return Room.objects.filter(accommodation__id=hotel_pk)
+        return Room.objects.filter(accommodation__id=hotel_pk).select_related("accommodation")
+
+    def get_last_modified(self):
+        return (
+            self.get_queryset().filter(pk=self.kwargs["pk"]).values_list("accommodation__updated_at", flat=True).first()
+        )
+
+    def get_response_cache_tags(self):
+        return [room_tag(self.kwargs["pk"]), accommodation_tag(self.kwargs["hotel_pk"])]
 
     @extend_schema(
         summary=">> 예약 요청 /{숙소_id}/{룸_id}/ <<",
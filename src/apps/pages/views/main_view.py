@@ -1,9 +1,19 @@
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import status
+from rest_framework.exceptions import NotFound
 from rest_framework.generics import ListAPIView
 from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 from apps.accommodations.models import Accommodation
-from apps.pages.serializers.main_serializer import MainPageSerializer
+from apps.common.pagination import decode_cursor, encode_cursor
+from apps.pages.serializers.main_serializer import (
+    MainFeedQuerySerializer,
+    MainPageSerializer,
+)
+from apps.pages.services.main_feed_service import MainFeedService
 
 
 # /api/v1/ui/main/
@@ -11,4 +21,49 @@ from apps.pages.serializers.main_serializer import MainPageSerializer
 class MainListView(ListAPIView):
     serializer_class = MainPageSerializer
     permission_classes = (AllowAny,)
-    queryset = Accommodation.objects.all().order_by("?")
+    queryset = Accommodation.objects.filter(is_active=True).select_related("card")
+
+    @extend_schema(
+        summary=">> 메인 피드 <<",
+        description="첫 요청의 seed 로 섞인 순서를 고정하고, 응답의 next(cursor 포함 URL)로 다음 페이지를 받는다",
+        parameters=[
+            OpenApiParameter(name="seed", type=OpenApiTypes.INT, description="세션 시드 (첫 요청에서만)"),
+            OpenApiParameter(name="cursor", type=OpenApiTypes.STR, description="다음 페이지 cursor (next 에 포함)"),
+            OpenApiParameter(name="limit", type=OpenApiTypes.INT, description="페이지 크기 (기본 20, 최대 100)"),
+        ],
+    )
+    def get(self, request, *args, **kwargs):
+        query_serializer = MainFeedQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        limit = query_serializer.validated_data["limit"]
+        # cursor 는 (seed, 순열 위치) - 피드 순열은 캐시에 있으므로 몇 번째 페이지든 같은 비용
+        cursor = decode_cursor(query_serializer.validated_data.get("cursor")) or {}
+        seed = cursor.get("seed", query_serializer.validated_data.get("seed"))
+        offset = cursor.get("offset", 0)
+        if not isinstance(offset, int) or offset < 0 or not isinstance(seed, (int, type(None))):
+            raise NotFound("Invalid cursor")
+        seed = MainFeedService.normalize_seed(seed)
+
+        page_ids, count = MainFeedService.get_page(seed, offset, limit)
+
+        # 순열 순서를 유지하고, 피드 생성 이후 비활성화/삭제된 숙소는 건너뛴다
+        accommodations = self.get_queryset().in_bulk(page_ids)
+        page = [accommodations[pk] for pk in page_ids if pk in accommodations]
+
+        next_url = None
+        if offset + limit < count:
+            next_url = replace_query_param(
+                remove_query_param(request.build_absolute_uri(), "seed"),
+                "cursor",
+                encode_cursor({"seed": seed, "offset": offset + limit}),
+            )
+        serializer = self.get_serializer(page, many=True)
+        return Response(
+            {
+                "seed": seed,
+                "count": count,
+                "next": next_url,
+                "results": serializer.data,
+            },
+            status=status.HTTP_200_OK,
+        )
@@ -0,0 +1,27 @@
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.pages.services.map_cluster_service import MapClusterService
+
+
+# /api/v1/ui/map/<z>/<x>/<y>/
+@extend_schema(tags=["Guest"])
+class MapClusterView(APIView):
+    permission_classes = (AllowAny,)
+
+    @extend_schema(
+        summary=">> 지도 마커 클러스터 <<",
+        description="지도 타일(z/x/y, Web Mercator) 단위로 묶은 숙소 마커. 클러스터마다 숙소 수와 최저가를 포함한다",
+    )
+    def get(self, request, z: int, x: int, y: int, *args, **kwargs):
+        if z > MapClusterService.max_zoom:
+            raise ValidationError({"z": f"Zoom level must be between 0 and {MapClusterService.max_zoom}."})
+        if x >= 2**z or y >= 2**z:
+            raise ValidationError("Tile is out of range for this zoom level.")
+
+        clusters = MapClusterService.get_tile(z, x, y)
+        return Response({"z": z, "x": x, "y": y, "clusters": clusters}, status=status.HTTP_200_OK)
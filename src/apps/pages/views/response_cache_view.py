@@ -0,0 +1,22 @@
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.common.cache.response_cache import ResponseCache
+
+
+# /api/v1/ui/cache/stats/
+@extend_schema(tags=["Admin"])
+class ResponseCacheStatsView(APIView):
+    """응답 캐시 hit / miss 통계 (캐시 크기 산정용)"""
+
+    permission_classes = (IsAdminUser,)
+
+    def get(self, request, *args, **kwargs):
+        return Response(ResponseCache.stats(), status=status.HTTP_200_OK)
+
+    def delete(self, request, *args, **kwargs):
+        ResponseCache.reset_stats()
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -2,12 +2,34 @@ from drf_spectacular.utils import extend_schema
 from rest_framework.generics import RetrieveAPIView
 from rest_framework.permissions import AllowAny
 
+from apps.common.cache.conditional import ConditionalGetMixin
+from apps.common.cache.mixins import ResponseCacheMixin
+from apps.common.cache.response_cache import accommodation_tag, room_tag
 from apps.pages.serializers.room_serializer import RoomSerializer
 from apps.rooms.models import Room
 
 
 @extend_schema(tags=["Guest"])
-class RoomDetailView(RetrieveAPIView):
+class RoomDetailView(ConditionalGetMixin, ResponseCacheMixin, RetrieveAPIView):
     permission_classes = (AllowAny,)
-    queryset = Room.objects.all()
     serializer_class = RoomSerializer
+    response_cache_name = "room_detail"
+
+    def get_queryset(self):
+        # URL 의 숙소에 속한 객실만 - 캐시 태그를 URL 인자로 만들기 때문에 다른 숙소의 객실이 조회되면 안 된다
+        return (
+            Room.objects.filter(accommodation_id=self.kwargs["hotel_pk"])
+            .select_related("accommodation")
+            .prefetch_related("images")
+        )
+
+    def get_last_modified(self):
+        # 객실 변경도 숙소 버전(updated_at)을 올리므로 숙소 기준으로 검증한다
+        return (
+            Room.objects.filter(pk=self.kwargs["pk"], accommodation_id=self.kwargs["hotel_pk"])
+            .values_list("accommodation__updated_at", flat=True)
+            .first()
+        )
+
+    def get_response_cache_tags(self):
+        return [room_tag(self.kwargs["pk"]), accommodation_tag(self.kwargs["hotel_pk"])]
@@ -0,0 +1,135 @@
+from django.contrib.gis.geos import Point
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework.generics import ListAPIView
+from rest_framework.permissions import AllowAny
+
+from apps.accommodations.models import Accommodation
+from apps.amenities.services.amenity_catalog_service import AmenityCatalogService
+from apps.common.pagination import CountedPageNumberPagination
+from apps.pages.serializers.search_serializer import (
+    AvailabilitySearchQuerySerializer,
+    AvailabilitySearchResultSerializer,
+    NearbyAccommodationSerializer,
+    NearbySearchQuerySerializer,
+)
+from apps.pages.services.availability_search_service import (
+    AvailabilitySearchService,
+)
+
+
+# /api/v1/ui/search/
+@extend_schema(tags=["Guest"])
+class AvailabilitySearchView(ListAPIView):
+    serializer_class = AvailabilitySearchResultSerializer
+    permission_classes = (AllowAny,)
+    # 검색 결과 화면은 전체 개수를 보여주므로 페이지 번호 방식
+    pagination_class = CountedPageNumberPagination
+
+    def get_search_params(self) -> tuple[tuple, dict]:
+        if not hasattr(self, "_search_params"):
+            query_serializer = AvailabilitySearchQuerySerializer(data=self.request.query_params)
+            query_serializer.is_valid(raise_exception=True)
+            data = query_serializer.validated_data
+
+            point = None
+            if "latitude" in data:
+                point = Point(data["longitude"], data["latitude"], srid=4326)
+            self._search_params = (
+                (data["check_in_date"], data["check_out_date"], data["guests_count"]),
+                {
+                    "min_price": data.get("min_price"),
+                    "max_price": data.get("max_price"),
+                    "query": data.get("q"),
+                    "point": point,
+                    "radius_m": data["radius"],
+                    "amenity_ids": data.get("amenities"),
+                    "option_ids": data.get("options"),
+                },
+            )
+        return self._search_params
+
+    def get_queryset(self):
+        args, filters = self.get_search_params()
+        return AvailabilitySearchService.search(*args, **filters)
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        if request.query_params.get("facets") in ("1", "true"):
+            search_args, filters = self.get_search_params()
+            counts = AvailabilitySearchService.amenity_facets(*search_args, **filters)
+            response.data["facets"] = [
+                {"id": amenity["id"], "name": amenity["name"], "count": counts.get(amenity["id"], 0)}
+                for amenity in AmenityCatalogService.amenities()
+            ]
+        return response
+
+    @extend_schema(
+        summary=">> 예약 가능 숙소 검색 <<",
+        description=(
+            "기간/인원/1박 요금 조건으로 예약 가능한 숙소를 숙소별 최저가 객실과 숙박 총액 순으로 반환. "
+            "검색어(q)가 있으면 검색 순위 순, 위치가 있으면 가까운 순"
+        ),
+        parameters=[
+            OpenApiParameter(name="check_in_date", type=OpenApiTypes.DATE, required=True, description="체크인 날짜"),
+            OpenApiParameter(name="check_out_date", type=OpenApiTypes.DATE, required=True, description="체크아웃 날짜"),
+            OpenApiParameter(name="guests_count", type=OpenApiTypes.INT, required=True, description="인원"),
+            OpenApiParameter(name="min_price", type=OpenApiTypes.INT, description="1박 최소 요금"),
+            OpenApiParameter(name="max_price", type=OpenApiTypes.INT, description="1박 최대 요금"),
+            OpenApiParameter(name="q", type=OpenApiTypes.STR, description="검색어 (숙소명/설명/주소)"),
+            OpenApiParameter(name="latitude", type=OpenApiTypes.FLOAT, description="위도"),
+            OpenApiParameter(name="longitude", type=OpenApiTypes.FLOAT, description="경도"),
+            OpenApiParameter(name="radius", type=OpenApiTypes.INT, description="반경 미터 (기본 5000, 최대 50000)"),
+            OpenApiParameter(
+                name="amenities", type=OpenApiTypes.INT, many=True, description="모두 갖춰야 하는 부대시설 id"
+            ),
+            OpenApiParameter(
+                name="options", type=OpenApiTypes.INT, many=True, description="모두 갖춰야 하는 객실 옵션 id"
+            ),
+            OpenApiParameter(name="facets", type=OpenApiTypes.BOOL, description="부대시설별 숙소 수 포함"),
+            OpenApiParameter(name="page", type=OpenApiTypes.INT, description="페이지 번호"),
+            OpenApiParameter(name="page_size", type=OpenApiTypes.INT, description="페이지 크기 (기본 20, 최대 100)"),
+        ],
+    )
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+
+# /api/v1/ui/nearby/
+@extend_schema(tags=["Guest"])
+class NearbySearchView(ListAPIView):
+    serializer_class = NearbyAccommodationSerializer
+    permission_classes = (AllowAny,)
+    cursor_orderings = {"distance": ("distance", "id")}
+
+    def get_queryset(self):
+        query_serializer = NearbySearchQuerySerializer(data=self.request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        data = query_serializer.validated_data
+
+        point = Point(data["longitude"], data["latitude"], srid=4326)
+        accommodations = Accommodation.objects.active().with_available_room(
+            data.get("guests_count"), data.get("min_price"), data.get("max_price")
+        )
+        if data.get("amenities"):
+            accommodations = accommodations.with_amenities(data["amenities"])
+        return accommodations.nearby(point, data["radius"]).select_related("card")
+
+    @extend_schema(
+        summary=">> 주변 숙소 검색 <<",
+        description="현재 위치에서 반경(미터) 안의 숙소를 가까운 순으로 반환. 인원/1박 요금 조건을 함께 줄 수 있다",
+        parameters=[
+            OpenApiParameter(name="latitude", type=OpenApiTypes.FLOAT, required=True, description="위도"),
+            OpenApiParameter(name="longitude", type=OpenApiTypes.FLOAT, required=True, description="경도"),
+            OpenApiParameter(name="radius", type=OpenApiTypes.INT, description="반경 미터 (기본 5000, 최대 50000)"),
+            OpenApiParameter(name="guests_count", type=OpenApiTypes.INT, description="인원"),
+            OpenApiParameter(name="min_price", type=OpenApiTypes.INT, description="1박 최소 요금"),
+            OpenApiParameter(name="max_price", type=OpenApiTypes.INT, description="1박 최대 요금"),
+            OpenApiParameter(
+                name="amenities", type=OpenApiTypes.INT, many=True, description="모두 갖춰야 하는 부대시설 id"
+            ),
+            OpenApiParameter(name="page_size", type=OpenApiTypes.INT, description="페이지 크기 (기본 20, 최대 100)"),
+        ],
+    )
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
@@ -0,0 +1,63 @@
+# Generated by Django 5.1.2 on 2026-10-18 11:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+RELEASED_BOOKING_STATUSES = ["cancelled_by_guest", "cancelled_by_host", "refunded"]
+
+
+def backfill_room_nights(apps, schema_editor):
+    # 기존 예약을 1박 단위로 펼쳐 재고 행을 채운다 (RoomCalendarService.rebuild 와 같은 집계)
+    # 비워 두면 이미 판매된 날이 판매 0 으로 보여 다시 팔린다
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO rooms_roomnightinventory (room_id, date, nights_available, nights_sold)
+            SELECT b.room_id, night::date, GREATEST(COALESCE(ri.count_room, 0), COUNT(*)), COUNT(*)
+            FROM bookings_booking b
+            CROSS JOIN LATERAL generate_series(
+                (b.check_in_datetime AT TIME ZONE %s)::date,
+                (b.check_out_datetime AT TIME ZONE %s)::date - 1,
+                interval '1 day'
+            ) AS night
+            LEFT JOIN rooms_roominventory ri ON ri.room_id = b.room_id
+            WHERE b.status <> ALL(%s)
+            GROUP BY b.room_id, night::date, ri.count_room
+            """,
+            [settings.TIME_ZONE, settings.TIME_ZONE, RELEASED_BOOKING_STATUSES],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("rooms", "0004_alter_room_check_in_time_alter_room_check_out_time"),
+        ("bookings", "0005_remove_booking_check_in_date_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RoomNightInventory",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("date", models.DateField()),
+                ("nights_available", models.PositiveIntegerField()),
+                ("nights_sold", models.PositiveIntegerField(default=0)),
+                (
+                    "room",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="night_inventories",
+                        to="rooms.room",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(fields=("room", "date"), name="unique_room_night_inventory"),
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_room_nights, migrations.RunPython.noop),
+    ]
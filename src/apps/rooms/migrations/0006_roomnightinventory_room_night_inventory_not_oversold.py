@@ -0,0 +1,25 @@
+# Generated by Django 5.1.2 on 2026-10-18 14:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("rooms", "0005_roomnightinventory"),
+    ]
+
+    operations = [
+        # 제약 추가 전 기존 초과 판매 행은 판매 수량으로 맞춘다
+        migrations.RunSQL(
+            "UPDATE rooms_roomnightinventory SET nights_available = nights_sold WHERE nights_sold > nights_available",
+            migrations.RunSQL.noop,
+        ),
+        migrations.AddConstraint(
+            model_name="roomnightinventory",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("nights_sold__lte", models.F("nights_available"))),
+                name="room_night_inventory_not_oversold",
+            ),
+        ),
+    ]
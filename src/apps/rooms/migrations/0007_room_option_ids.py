@@ -0,0 +1,39 @@
+# Generated by Django 5.1.2 on 2026-10-18 16:00
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("rooms", "0006_roomnightinventory_room_night_inventory_not_oversold"),
+        ("amenities", "0002_alter_accommodationamenity_custom_value_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="room",
+            name="option_ids",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.BigIntegerField(), blank=True, default=list, size=None
+            ),
+        ),
+        # 기존 객실의 옵션 id 채우기
+        migrations.RunSQL(
+            """
+            UPDATE rooms_room AS r
+            SET option_ids = ARRAY(
+                SELECT ro.option_id FROM amenities_roomoption AS ro
+                WHERE ro.room_id = r.id
+                ORDER BY ro.option_id
+            )
+            """,
+            migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name="room",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["option_ids"], name="room_option_ids_gin"),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.2 on 2026-10-18 17:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("rooms", "0007_room_option_ids"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="room",
+            index=models.Index(fields=["price", "id"], name="room_price_id_idx"),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-18 18:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("rooms", "0008_room_price_id_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="room_image",
+            name="derivatives",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.2 on 2026-10-18 19:00
+
+from django.db import migrations, models
+
+import apps.common.storage
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("rooms", "0009_room_image_derivatives"),
+        ("common", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="room_image",
+            name="image",
+            field=models.ImageField(storage=apps.common.storage.get_image_storage, upload_to="room_images"),
+        ),
+    ]
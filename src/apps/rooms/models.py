@@ -1,8 +1,11 @@
 # type: ignore
 
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
 from apps.accommodations.models import Accommodation
+from apps.common.storage import get_image_storage
 from apps.rooms.querysets.room_queryset import RoomQuerySet
 
 
@@ -17,9 +20,30 @@ class Room(models.Model):
     check_in_time = models.TimeField()
     check_out_time = models.TimeField()
     is_available = models.BooleanField(default=True)
+    # 옵션 id 목록 (RoomOption) - "모두 포함" 필터(@>)와 facet 집계용
+    option_ids = ArrayField(models.BigIntegerField(), blank=True, default=list)
 
     objects = RoomQuerySet.as_manager()
 
+    class Meta:
+        indexes = [
+            GinIndex(fields=["option_ids"], name="room_option_ids_gin"),
+            # 가격순 keyset 페이지네이션
+            models.Index(fields=["price", "id"], name="room_price_id_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        # option_ids 는 RoomOption 이 바뀔 때 AmenityIndexService 가 갱신한다
+        # 옵션보다 먼저 불러온 인스턴스를 저장해도 덮어쓰지 않도록 수정 시에는 option_ids 를 빼고 저장한다
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != "option_ids" and field.attname not in deferred
+            ]
+        super().save(*args, **kwargs)
+
 
 class RoomType(models.Model):
     room = models.OneToOneField(Room, on_delete=models.CASCADE)
@@ -29,7 +53,10 @@ class RoomType(models.Model):
 
 class Room_Image(models.Model):
     room = models.ForeignKey(Room, on_delete=models.CASCADE, related_name="images")
-    image = models.ImageField(upload_to="room_images")
+    # 내용 hash 로 이름 짓는 storage - 같은 사진은 한 번만 저장된다 (apps.common.storage)
+    image = models.ImageField(upload_to="room_images", storage=get_image_storage)
+    # thumbnail / card / full 파생본 경로와 크기 (apps.common.util.image_derivatives)
+    derivatives = models.JSONField(default=dict, blank=True)
     is_representative = models.BooleanField(default=False)
 
     class Meta:
@@ -45,3 +72,25 @@ class Room_Image(models.Model):
 class RoomInventory(models.Model):
     room = models.OneToOneField(Room, on_delete=models.CASCADE)
     count_room = models.IntegerField()
+
+
+class RoomNightInventory(models.Model):
+    """
+    객실 날짜별 재고 (1박 = 1행)
+    예약 생성/취소/호스트 거절 시 같은 트랜잭션에서 갱신되며, rebuild_room_calendar 명령으로 Booking 에서 다시 만들 수 있다
+    """
+
+    room = models.ForeignKey(Room, on_delete=models.CASCADE, related_name="night_inventories")
+    date = models.DateField()
+    nights_available = models.PositiveIntegerField()
+    nights_sold = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["room", "date"], name="unique_room_night_inventory"),
+            # 동시 예약 시 초과 판매를 막는 마지막 방어선
+            models.CheckConstraint(
+                condition=models.Q(nights_sold__lte=models.F("nights_available")),
+                name="room_night_inventory_not_oversold",
+            ),
+        ]
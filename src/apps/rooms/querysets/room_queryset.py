@@ -1,7 +1,7 @@
 from datetime import datetime
 
 from django.db import models
-from django.db.models import Q
+from django.db.models import Exists, F, OuterRef
 
 
 class RoomQuerySet(models.QuerySet):
@@ -21,7 +21,21 @@ class RoomQuerySet(models.QuerySet):
         return self.filter(price__gte=min_price, price__lte=max_price)
 
     def available_for_dates(self, check_in_date, check_out_date):
-        return self.exclude(Q(booking__check_in_date__lt=check_out_date) & Q(booking__check_out_date__gt=check_in_date))
+        """숙박 기간 중 하루라도 매진(nights_sold >= nights_available)인 객실을 제외"""
+        from apps.rooms.models import RoomNightInventory
+
+        sold_out_nights = RoomNightInventory.objects.filter(
+            room=OuterRef("pk"),
+            date__gte=check_in_date,
+            date__lt=check_out_date,
+            nights_sold__gte=F("nights_available"),
+        )
+        return self.filter(roominventory__count_room__gt=0).exclude(Exists(sold_out_nights))
 
     def with_amenities(self, amenity_ids):
-        return self.filter(amenities__id__in=amenity_ids).distinct()
+        """숙소가 부대시설을 모두 갖춘 객실 (숙소 카드 amenity_ids @> ...)"""
+        return self.filter(accommodation__card__amenity_ids__contains=list(amenity_ids))
+
+    def with_options(self, option_ids):
+        """옵션을 모두 갖춘 객실 (option_ids @> ...)"""
+        return self.filter(option_ids__contains=list(option_ids))
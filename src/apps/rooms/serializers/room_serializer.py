@@ -2,6 +2,7 @@
 from django.utils import timezone
 from rest_framework import serializers
 
+from apps.common.serializers import DynamicFieldsMixin, Expandable
 from apps.rooms.models import Room, Room_Image, RoomInventory, RoomType
 
 
@@ -76,9 +77,19 @@ class RoomTypeSerializer(serializers.ModelSerializer):
 
 
 class RoomImageSerializer(serializers.ModelSerializer):
+    # presigned 직접 업로드 - image 대신 업로드 id 를 넘긴다
+    upload_id = serializers.UUIDField(write_only=True, required=False)
+
     class Meta:
         model = Room_Image
-        fields = ["id", "image"]
+        fields = ["id", "image", "upload_id", "derivatives"]
+        read_only_fields = ["derivatives"]
+        extra_kwargs = {"image": {"required": False}}
+
+    def validate(self, attrs):
+        if not attrs.get("image") and not attrs.get("upload_id"):
+            raise serializers.ValidationError({"image": "Either image or upload_id is required"})
+        return attrs
 
     def validate_image(self, value):
         # Check file size (limit to 5MB)
@@ -107,7 +118,7 @@ class RoomInventorySerializer(serializers.ModelSerializer):
         return value
 
 
-class RoomSerializer(serializers.ModelSerializer):
+class RoomSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     room_type = RoomTypeSerializer(source="roomtype", read_only=True)
     images = RoomImageSerializer(many=True, read_only=True)
     inventory = RoomInventorySerializer(source="roominventory", read_only=True)
@@ -130,6 +141,12 @@ class RoomSerializer(serializers.ModelSerializer):
             "images",
             "inventory",
         ]
+        # ?fields= / ?expand= 로 고를 수 있는 중첩 필드
+        expandable_fields = {
+            "room_type": Expandable(select_related=("roomtype",)),
+            "images": Expandable(prefetch_related=("images",)),
+            "inventory": Expandable(select_related=("roominventory",)),
+        }
 
     def validate(self, data):
         # 필수 필드 검증
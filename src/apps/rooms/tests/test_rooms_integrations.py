@@ -99,7 +99,7 @@ class RoomIntegrationTest(TestBase):
         # 2. 재고 확인
         inventory_url = reverse("rooms:room-inventory-list")
         response = self.client.get(inventory_url)
-        initial_inventory = response.data[0]["count_room"]
+        initial_inventory = response.data["results"][0]["count_room"]
         self.assertEqual(initial_inventory, 1)
 
         # 3. 방 비활성화 (모든 필수 필드 포함)
@@ -0,0 +1,67 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from apps.rooms.models import Room
+from apps.rooms.tests.rooms_base import TestBase
+
+
+class RoomKeysetPaginationTest(TestBase):
+    def setUp(self):
+        super().setUp()
+        Room.objects.bulk_create(
+            Room(
+                accommodation=self.accommodation,
+                name=f"room {i}",
+                capacity=2,
+                max_capacity=4,
+                price=50000 + (i % 7) * 10000,
+                stay_type=True,
+                check_in_time="14:00",
+                check_out_time="11:00",
+            )
+            for i in range(45)
+        )
+        self.url = reverse("rooms:room-list-create")
+
+    def collect(self, params):
+        pages = []
+        response = self.client.get(self.url, params)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append(response.data["results"])
+            if response.data["next"] is None:
+                return pages
+            response = self.client.get(response.data["next"])
+
+    def test_cursor_pages_cover_all_rows_once(self):
+        # when
+        pages = self.collect({"page_size": 10})
+
+        # then
+        ids = [room["id"] for page in pages for room in page]
+        self.assertEqual(len(pages), 5)
+        self.assertEqual(ids, sorted(Room.objects.values_list("id", flat=True)))
+
+    def test_price_ordering_with_duplicate_prices(self):
+        # when
+        pages = self.collect({"page_size": 10, "ordering": "price"})
+
+        # then
+        prices = [room["price"] for page in pages for room in page]
+        self.assertEqual(len(prices), 45)
+        self.assertEqual(prices, sorted(prices))
+        self.assertEqual(len({room["id"] for page in pages for room in page}), 45)
+
+    def test_later_pages_do_not_use_offset(self):
+        # given
+        first = self.client.get(self.url, {"page_size": 10})
+        third = self.client.get(self.client.get(first.data["next"]).data["next"])
+
+        # when
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(third.data["next"])
+
+        # then
+        self.assertFalse(any("OFFSET" in query["sql"] for query in queries.captured_queries))
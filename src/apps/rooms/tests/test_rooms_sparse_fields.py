@@ -0,0 +1,67 @@
+from django.urls import reverse
+from rest_framework import status
+
+from apps.rooms.models import Room, Room_Image, RoomInventory, RoomType
+from apps.rooms.tests.rooms_base import TestBase
+
+
+class RoomSparseFieldsTest(TestBase):
+    def setUp(self):
+        super().setUp()
+        for i in range(3):
+            room = Room.objects.create(
+                accommodation=self.accommodation,
+                name=f"room {i}",
+                capacity=2,
+                max_capacity=4,
+                price=50000 + i * 10000,
+                stay_type=True,
+                check_in_time="14:00",
+                check_out_time="11:00",
+            )
+            RoomType.objects.create(room=room, type_name="standard")
+            RoomInventory.objects.create(room=room, count_room=2)
+            Room_Image.objects.create(room=room, image=f"room_images/{i}.jpg")
+        self.url = reverse("rooms:room-list-create")
+
+    def test_fields_skip_nested_queries(self):
+        # when
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"fields": "id,name,price"})
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 3)
+        self.assertEqual(set(response.data["results"][0]), {"id", "name", "price"})
+
+    def test_expand_prefetches_requested_relation_only(self):
+        # when
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {"fields": "id,name", "expand": "images"})
+
+        # then
+        room = response.data["results"][0]
+        self.assertEqual(set(room), {"id", "name", "images"})
+        self.assertEqual(len(room["images"]), 1)
+
+    def test_expand_select_related_relations(self):
+        # when
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"expand": "room_type,inventory"})
+
+        # then
+        room = response.data["results"][0]
+        self.assertNotIn("images", room)
+        self.assertEqual(room["room_type"]["type_name"], "standard")
+        self.assertEqual(room["inventory"]["count_room"], 2)
+        self.assertIn("price", room)
+
+    def test_default_response_keeps_full_object(self):
+        # when
+        response = self.client.get(self.url)
+
+        # then
+        room = response.data["results"][0]
+        self.assertIn("images", room)
+        self.assertIn("room_type", room)
+        self.assertIn("inventory", room)
@@ -0,0 +1,48 @@
+import json
+
+from django.urls import reverse
+from rest_framework import status
+
+from apps.rooms.models import Room, RoomInventory
+from apps.rooms.tests.rooms_base import TestBase
+
+
+class RoomInventoryStreamingTest(TestBase):
+    def setUp(self):
+        super().setUp()
+        rooms = Room.objects.bulk_create(
+            Room(
+                accommodation=self.accommodation,
+                name=f"room {i}",
+                capacity=2,
+                max_capacity=4,
+                price=50000,
+                stay_type=True,
+                check_in_time="14:00",
+                check_out_time="11:00",
+            )
+            for i in range(30)
+        )
+        RoomInventory.objects.bulk_create(RoomInventory(room=room, count_room=i) for i, room in enumerate(rooms))
+        self.url = reverse("rooms:room-inventory-list")
+
+    def test_stream_returns_whole_json_array(self):
+        # when
+        response = self.client.get(self.url, {"stream": "1", "room__accommodation": self.accommodation.pk})
+
+        # then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/json")
+        data = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(len(data), 30)
+        self.assertEqual(sorted(row["count_room"] for row in data), list(range(30)))
+
+    def test_without_stream_keeps_paginated_response(self):
+        # when
+        response = self.client.get(self.url, {"room__accommodation": self.accommodation.pk})
+
+        # then
+        self.assertFalse(response.streaming)
+        self.assertEqual(len(response.data["results"]), 20)
+        self.assertEqual(response.data["meta"]["total_rooms"], 30)
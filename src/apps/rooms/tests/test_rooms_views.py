@@ -48,7 +48,7 @@ class RoomViewTest(TestBase):
         url = reverse("rooms:room-list-create")
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertTrue(len(response.data) > 0)
+        self.assertTrue(len(response.data["results"]) > 0)
 
     def test_get_room_detail(self):
         room = Room.objects.create(**self.room_data_for_model)
@@ -3,7 +3,8 @@ from datetime import timedelta
 
 from django.contrib.auth import get_user_model
 from django.db import transaction
-from django.db.models import F, Prefetch
+from django.db.models import Count, F, Prefetch, Q, Sum
+from django.db.models.functions import Coalesce
 from django.db.utils import IntegrityError
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
@@ -16,6 +17,9 @@ from rest_framework.response import Response
 
 from apps.accommodations.models import Accommodation
 from apps.bookings.models import Booking
+from apps.common.renderers import StreamingListMixin
+from apps.common.serializers import DynamicFieldsViewMixin
+from apps.common.util.direct_upload import DirectUploadService
 from apps.rooms.models import Room, Room_Image, RoomInventory, RoomType
 from apps.rooms.serializers.room_serializer import (
     RoomImageSerializer,
@@ -26,14 +30,18 @@ from apps.rooms.serializers.room_serializer import (
 
 User = get_user_model()
 
+# keyset 페이지네이션 정렬 (?ordering=price) - Room(price, id) 인덱스
+ROOM_CURSOR_ORDERINGS = {"id": ("id",), "price": ("price", "id"), "-price": ("-price", "-id")}
+
 
 @extend_schema(tags=["Host"])
-class AccommodationRoomsView(generics.ListAPIView):
+class AccommodationRoomsView(DynamicFieldsViewMixin, generics.ListAPIView):
     serializer_class = RoomSerializer
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ["is_available", "capacity"]
     ordering_fields = ["price", "id"]
+    cursor_orderings = ROOM_CURSOR_ORDERINGS
 
     def get_queryset(self):
         accommodation_id = self.kwargs.get("accommodation_id")
@@ -45,14 +53,15 @@ class AccommodationRoomsView(generics.ListAPIView):
         if not accommodation.is_active:
             raise ValidationError("This accommodation is currently not active")
 
-        return Room.objects.filter(accommodation_id=accommodation_id)
+        return self.optimize_queryset(Room.objects.filter(accommodation_id=accommodation_id))
 
 
 @extend_schema(tags=["Host"])
-class RoomListCreateView(generics.ListCreateAPIView):
+class RoomListCreateView(DynamicFieldsViewMixin, generics.ListCreateAPIView):
     queryset = Room.objects.all()
     serializer_class = RoomSerializer
     permission_classes = [AllowAny]
+    cursor_orderings = ROOM_CURSOR_ORDERINGS
 
     def validate_business_user(self, user_id):
         """Validate business user permissions"""
@@ -96,7 +105,7 @@ class RoomListCreateView(generics.ListCreateAPIView):
 
 
 @extend_schema(tags=["Host"])
-class RoomDetailView(generics.RetrieveUpdateDestroyAPIView):
+class RoomDetailView(DynamicFieldsViewMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = Room.objects.all()
     serializer_class = RoomSerializer
     permission_classes = [AllowAny]
@@ -179,8 +188,13 @@ class RoomImageCreateView(generics.CreateAPIView):
         self.validate_image_limit(room)
         self.validate_image_upload_frequency(room)
 
+        extra = {}
+        upload_id = serializer.validated_data.pop("upload_id", None)
+        if upload_id:
+            (extra["image"],) = DirectUploadService.confirm(self.request.user, "room_image", [upload_id])
+
         try:
-            serializer.save(room=room)
+            serializer.save(room=room, **extra)
         except Exception as e:
             raise ValidationError(f"Failed to upload image: {str(e)}")
 
@@ -213,9 +227,7 @@ class RoomImageDetailView(generics.DestroyAPIView):
         self.validate_image_deletion(instance)
 
         try:
-            # 이미지 파일 삭제
-            if instance.image:
-                instance.image.delete(save=False)
+            # 파일은 post_delete signal 이 커밋 후 참조를 해제하면서 지운다 (같은 파일을 쓰는 다른 이미지가 있으면 유지)
             instance.delete()
         except Exception as e:
             raise ValidationError(f"Failed to delete image: {str(e)}")
@@ -296,13 +308,10 @@ class RoomTypeListCreateView(generics.ListCreateAPIView):
                     room__accommodation=accommodation, is_customized=True
                 ).count()
 
-                response.data = {
-                    "results": response.data,
-                    "meta": {
-                        "total_custom_types": custom_types_count,
-                        "max_types_limit": 10,
-                        "available_slots": 10 - custom_types_count,
-                    },
+                response.data["meta"] = {
+                    "total_custom_types": custom_types_count,
+                    "max_types_limit": 10,
+                    "available_slots": 10 - custom_types_count,
                 }
 
             return response
@@ -436,7 +445,7 @@ class RoomInventoryUpdateView(generics.UpdateAPIView):
 
 
 @extend_schema(tags=["Host"])
-class RoomInventoryListView(generics.ListAPIView):
+class RoomInventoryListView(StreamingListMixin, generics.ListAPIView):
     serializer_class = RoomInventorySerializer
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
@@ -468,21 +477,20 @@ class RoomInventoryListView(generics.ListAPIView):
 
         # 메타데이터 추가
         accommodation_id = request.query_params.get("room__accommodation")
-        if accommodation_id:
+        if accommodation_id and not self.should_stream(request):
             try:
                 accommodation = Accommodation.objects.get(id=accommodation_id)
-                total_inventory = sum(item.get("count_room", 0) for item in response.data)
-                available_rooms = sum(1 for item in response.data if item.get("count_room", 0) > 0)
-
-                response.data = {
-                    "results": response.data,
-                    "meta": {
-                        "total_inventory": total_inventory,
-                        "total_rooms": len(response.data),
-                        "available_rooms": available_rooms,
-                        "accommodation_name": accommodation.name,
-                        "last_updated": timezone.now(),
-                    },
+                # 페이지가 아닌 필터 결과 전체 기준으로 집계
+                summary = self.filter_queryset(self.get_queryset()).aggregate(
+                    total_inventory=Coalesce(Sum("count_room"), 0),
+                    total_rooms=Count("id"),
+                    available_rooms=Count("id", filter=Q(count_room__gt=0)),
+                )
+
+                response.data["meta"] = {
+                    **summary,
+                    "accommodation_name": accommodation.name,
+                    "last_updated": timezone.now(),
                 }
             except Accommodation.DoesNotExist:
                 raise ValidationError("Invalid accommodation ID")
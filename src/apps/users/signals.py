@@ -0,0 +1,20 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.auth.authentication import UserPrincipalCache
+from apps.users.models import BusinessUser, User, WithdrawManager
+
+
+# 인증 사용자 캐시 무효화 (정보/권한 변경, 비활성화, 비즈니스 프로필 등록, 탈퇴)
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_principal(sender, instance, **kwargs):
+    UserPrincipalCache.schedule_invalidate(instance.pk)
+
+
+@receiver(post_save, sender=BusinessUser)
+@receiver(post_delete, sender=BusinessUser)
+@receiver(post_save, sender=WithdrawManager)
+@receiver(post_delete, sender=WithdrawManager)
+def invalidate_user_principal_profile(sender, instance, **kwargs):
+    UserPrincipalCache.schedule_invalidate(instance.user_id)
@@ -5,5 +5,5 @@ from . import views
 app_name = "users"  # 앱 이름 설정
 
 urlpatterns: list = [
-    # 예: path('register/', views.register, name='register'),
+    path("business-document/", views.BusinessDocumentView.as_view(), name="business-document"),
 ]
@@ -1,3 +1,42 @@
-from django.shortcuts import render
+from django.db import transaction
+from django.shortcuts import get_object_or_404
+from drf_spectacular.utils import extend_schema
+from rest_framework import serializers
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-# Create your views here.
+from apps.common.storage import release_files
+from apps.common.util.direct_upload import DirectUploadService
+from apps.users.models import BusinessUser
+
+
+class BusinessDocumentUploadSerializer(serializers.Serializer):
+    upload_id = serializers.UUIDField()
+
+
+@extend_schema(tags=["Host"])
+class BusinessDocumentView(APIView):
+    """사업자 서류 교체 - presigned 직접 업로드(purpose=business_document)로 올린 파일을 등록"""
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(summary="사업자 서류 등록", request=BusinessDocumentUploadSerializer)
+    @transaction.atomic
+    def put(self, request, *args, **kwargs):
+        serializer = BusinessDocumentUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        business_user = get_object_or_404(BusinessUser.objects.select_for_update(), user=request.user)
+
+        (name,) = DirectUploadService.confirm(
+            request.user, "business_document", [serializer.validated_data["upload_id"]]
+        )
+        previous = business_user.business_document.name
+        business_user.business_document = name
+        # 서류가 바뀌면 다시 심사한다
+        business_user.verification_status = "pending"
+        business_user.verified_at = None
+        business_user.save(update_fields=["business_document", "verification_status", "verified_at"])
+        if previous != name:
+            release_files(business_user.business_document.storage, [previous])
+        return Response({"business_document": business_user.business_document.url})
@@ -0,0 +1,15 @@
+"""
+공개 API 엔드포인트 벤치마크 (in-process test client)
+
+고정 seed 데이터셋(apps.common.util.data_seeder)을 만든 뒤 엔드포인트마다 지연 시간 분포(p50/p95/max)와 쿼리 수를 재고,
+baselines.json 과 비교해 p95 나 쿼리 수가 기준을 넘으면 실패한다.
+
+    BENCHMARK=1 python manage.py test benchmarks --tag benchmark                                # 측정 + 기준 비교
+    BENCHMARK=1 BENCHMARK_UPDATE_BASELINES=1 python manage.py test benchmarks --tag benchmark   # 기준 갱신
+
+- BENCHMARK 환경 변수가 없으면 건너뛴다 (일반 manage.py test 에서는 실행되지 않는다)
+- 측정 결과는 benchmarks/results/latest.json 에 저장된다
+- 쿼리 수 기준은 환경과 무관하므로 저장소에 기록해 두고, 지연 시간(p95_ms) 기준은 기준 머신(CI/도커)에서 기록한다
+  p95_ms 기준이 없는 엔드포인트는 실패하므로 기준 머신에서 BENCHMARK_UPDATE_BASELINES=1 로 한 번 기록한 뒤 커밋한다
+- 호스트 예약 조회는 오늘 이후 날짜만 받으므로 측정하는 동안 오늘을 데이터셋의 reference_date 로 고정한다
+"""
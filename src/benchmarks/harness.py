@@ -0,0 +1,121 @@
+import json
+import os
+import statistics
+import time
+from pathlib import Path
+from typing import Optional
+
+from django.core.cache import caches
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+BASELINES_PATH = BENCHMARK_DIR / "baselines.json"
+RESULTS_PATH = BENCHMARK_DIR / "results" / "latest.json"
+
+DEFAULT_THRESHOLDS = {
+    "latency_ratio": 1.5,  # p95 가 기준의 1.5 배 + slack 을 넘으면 실패
+    "latency_slack_ms": 5.0,  # 아주 빠른 엔드포인트의 측정 잡음 허용치
+    "query_slack": 0,  # 쿼리 수는 늘어나면 바로 실패
+}
+
+
+def get_runs() -> tuple[int, int]:
+    """(측정 횟수, 워밍업 횟수)"""
+    return int(os.getenv("BENCHMARK_RUNS", 30)), int(os.getenv("BENCHMARK_WARMUP", 3))
+
+
+def clear_caches() -> None:
+    # 응답 캐시 / 메인 피드 / 사용자 캐시를 비워 DB 를 거치는 경로를 잰다
+    caches["default"].clear()
+    caches["catalog"].clear()
+
+
+def read_body(response) -> bytes:
+    # 스트리밍 응답은 본문을 읽는 동안 쿼리가 실행되므로 끝까지 소비한 시간까지 잰다
+    if response.streaming:
+        return b"".join(response.streaming_content)
+    return response.content
+
+
+def percentile(values: list[float], percent: int) -> float:
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+def measure(client, path: str, cold: bool, runs: int, warmup: int, **extra) -> dict:
+    """
+    같은 요청을 반복해 지연 시간(ms) 분포와 요청당 최대 쿼리 수를 반환
+    cold=True 이면 매 요청 전에 캐시를 비운다 (캐시가 가리는 쿼리 회귀를 잡는다)
+    """
+    timings, queries = [], 0
+    for iteration in range(warmup + runs):
+        if cold:
+            clear_caches()
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            response = client.get(path, **extra)
+            read_body(response)
+            elapsed = (time.perf_counter() - started) * 1000
+        if response.status_code != 200:
+            raise AssertionError(f"GET {path} returned {response.status_code}")
+        if iteration >= warmup:
+            timings.append(elapsed)
+            queries = max(queries, len(captured))
+    return {
+        "p50_ms": round(statistics.median(timings), 2),
+        "p95_ms": round(percentile(timings, 95), 2),
+        "max_ms": round(max(timings), 2),
+        "queries": queries,
+        "runs": runs,
+    }
+
+
+def load_baselines() -> dict:
+    if not BASELINES_PATH.exists():
+        return {"thresholds": DEFAULT_THRESHOLDS, "endpoints": {}}
+    with open(BASELINES_PATH, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def compare(name: str, result: dict, baseline: Optional[dict], thresholds: dict) -> list[str]:
+    """
+    기준보다 나빠진 항목 목록 (기준이 없으면 비교하지 않는다)
+    지연 시간 기준(p95_ms)이 빠진 엔드포인트도 실패로 보고해 지연 시간 비교가 조용히 꺼지지 않게 한다
+    """
+    if not baseline:
+        return []
+    thresholds = {**DEFAULT_THRESHOLDS, **thresholds}
+    regressions = []
+    if "p95_ms" not in baseline:
+        regressions.append(f"{name}: no p95_ms baseline (record one with BENCHMARK_UPDATE_BASELINES=1)")
+    else:
+        latency_limit = baseline["p95_ms"] * thresholds["latency_ratio"] + thresholds["latency_slack_ms"]
+        if result["p95_ms"] > latency_limit:
+            regressions.append(
+                f"{name}: p95 {result['p95_ms']}ms > {latency_limit:.2f}ms (baseline {baseline['p95_ms']}ms)"
+            )
+    query_limit = baseline["queries"] + thresholds["query_slack"]
+    if result["queries"] > query_limit:
+        regressions.append(f"{name}: {result['queries']} queries > {query_limit} (baseline {baseline['queries']})")
+    return regressions
+
+
+def write_json(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file, indent=2, sort_keys=True, ensure_ascii=False)
+        file.write("\n")
+
+
+def save_results(results: dict, dataset: dict, update_baselines: bool) -> None:
+    write_json(RESULTS_PATH, {"dataset": dataset, "endpoints": results})
+    if update_baselines:
+        baselines = load_baselines()
+        baselines["dataset"] = dataset
+        endpoints = baselines.setdefault("endpoints", {})
+        for name, modes in results.items():
+            for mode, result in modes.items():
+                endpoints.setdefault(name, {})[mode] = {**endpoints.get(name, {}).get(mode, {}), **result}
+        write_json(BASELINES_PATH, baselines)
@@ -0,0 +1,116 @@
+import os
+import unittest
+from datetime import date
+from unittest import mock
+
+from django.test import TestCase, tag
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.accommodations.models import Accommodation
+from apps.common.util.data_seeder import DataSeeder
+from apps.rooms.models import Room
+from apps.users.models import User
+from benchmarks.harness import compare, get_runs, load_baselines, measure, save_results
+
+# 고정 데이터셋 - 바꾸면 baselines.json 도 다시 기록해야 한다
+DATASET = {
+    "seed": 2024,
+    "reference_date": "2025-06-01",
+    "counts": {"guests": 500, "hosts": 20, "accommodations": 200, "rooms_per_accommodation": 3, "bookings": 5_000},
+}
+MODES = ("cold", "warm")
+
+
+class ReferenceDate(date):
+    """데이터셋 기준일을 오늘로 돌려주는 date - 날짜 검증이 실행하는 날과 무관하게 같은 행을 조회한다"""
+
+    @classmethod
+    def today(cls):
+        return date.fromisoformat(DATASET["reference_date"])
+
+
+# 일반 manage.py test 에서는 건너뛴다 (BENCHMARK=1 일 때만 데이터셋을 만들고 측정)
+@unittest.skipUnless(os.getenv("BENCHMARK"), "set BENCHMARK=1 to run endpoint benchmarks")
+@tag("benchmark")
+class EndpointBenchmarkTest(TestCase):
+    seeder: DataSeeder
+    baselines: dict
+    runs: int
+    warmup: int
+    results: dict = {}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.seeder = DataSeeder(
+            dict(DATASET["counts"]),
+            seed=DATASET["seed"],
+            reference_date=date.fromisoformat(DATASET["reference_date"]),
+            log=lambda _: None,
+        )
+        cls.seeder.run()
+        cls.baselines = load_baselines()
+        cls.runs, cls.warmup = get_runs()
+
+    @classmethod
+    def tearDownClass(cls):
+        save_results(cls.results, DATASET, update_baselines=bool(os.getenv("BENCHMARK_UPDATE_BASELINES")))
+        super().tearDownClass()
+
+    def setUp(self):
+        # 가장 많은 숙소를 가진 호스트(zipf 1위)와 그 호스트의 첫 활성 숙소/객실
+        host = User.objects.get(pk=self.seeder.user_base)
+        accommodation = (
+            Accommodation.objects.filter(host_id=self.seeder.business_base, is_active=True).order_by("pk").first()
+        )
+        self.accommodation_id = accommodation.pk
+        self.room_id = Room.objects.filter(accommodation=accommodation, is_available=True).order_by("pk").first().pk
+        self.host_headers = {"HTTP_AUTHORIZATION": f"Bearer {RefreshToken.for_user(host).access_token}"}
+
+    def benchmark(self, name: str, path: str, **extra) -> None:
+        regressions = []
+        self.results[name] = {}
+        for mode in MODES:
+            result = measure(self.client, path, cold=mode == "cold", runs=self.runs, warmup=self.warmup, **extra)
+            self.results[name][mode] = result
+            baseline = self.baselines.get("endpoints", {}).get(name, {}).get(mode)
+            regressions += compare(f"{name} ({mode})", result, baseline, self.baselines.get("thresholds", {}))
+        if regressions and not os.getenv("BENCHMARK_UPDATE_BASELINES"):
+            self.fail("\n".join(regressions))
+
+    def test_main_feed(self):
+        self.benchmark("ui.main", "/api/v1/ui/main/")
+
+    def test_accommodation_detail(self):
+        self.benchmark("ui.accommodation_detail", f"/api/v1/ui/accommodations/{self.accommodation_id}/")
+
+    def test_room_detail(self):
+        self.benchmark("ui.room_detail", f"/api/v1/ui/accomodations/{self.accommodation_id}/{self.room_id}/")
+
+    def test_booking_request(self):
+        self.benchmark("ui.booking_request", f"/api/v1/ui/bookings/request/{self.accommodation_id}/{self.room_id}/")
+
+    def test_accommodation_rooms(self):
+        self.benchmark("rooms.accommodation", f"/api/v1/rooms/accommodation/{self.accommodation_id}/")
+
+    def test_room_inventory(self):
+        self.benchmark("rooms.inventory", "/api/v1/rooms/inventory/")
+
+    # 호스트 대시보드 (조회 엔드포인트만 - requestcheck 는 예약 상태를 바꾸는 PATCH 라 반복 측정하지 않는다)
+    def test_host_booking_check(self):
+        # 과거 날짜는 검증에서 거절되므로 검증이 보는 오늘을 기준일로 고정한다
+        with mock.patch("apps.host_management.serializers.host_management_serializers.date", ReferenceDate):
+            self.benchmark(
+                "host.booking_check",
+                f"/api/v1/host/bookingcheck/?date={DATASET['reference_date']}",
+                **self.host_headers,
+            )
+
+    def test_host_complete_bookings(self):
+        self.benchmark(
+            "host.complete_bookings",
+            f"/api/v1/host/Completebooking/?date={DATASET['reference_date']}",
+            **self.host_headers,
+        )
+
+    def test_host_accommodation_list(self):
+        self.benchmark("host.accommodation_list", "/api/v1/host/accommodation/list/", **self.host_headers)
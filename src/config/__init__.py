@@ -0,0 +1,4 @@
+# Django 가 시작될 때 Celery app 을 로드해서 @shared_task 가 이 app 을 사용하도록 한다
+from config.celery import app as celery_app
+
+__all__ = ("celery_app",)
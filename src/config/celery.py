@@ -0,0 +1,13 @@
+import os
+
+from celery import Celery
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+app = Celery("config")
+
+# settings.py 의 CELERY_ 로 시작하는 설정을 사용한다
+app.config_from_object("django.conf:settings", namespace="CELERY")
+
+# 각 app 의 tasks.py 를 자동으로 등록
+app.autodiscover_tasks()
@@ -13,7 +13,9 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 import os
 import sys
 from pathlib import Path
+from typing import Any
 
+from celery.schedules import crontab
 from dotenv import load_dotenv
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -60,6 +62,7 @@ DJANGO_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "django.contrib.gis",
+    "django.contrib.postgres",  # 전문 검색 / pg_trgm
 ]
 
 THIRD_PARTY_APPS = [
@@ -201,6 +204,18 @@ STATIC_ROOT = os.path.join(BASE_DIR, "static")
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
+STORAGES: dict[str, dict[str, Any]] = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    # 숙소/객실 이미지 - 내용 hash 로 이름 짓고 blobs/ab/cd/ 로 나눠 저장, 같은 파일은 참조 수로 공유
+    "images": {"BACKEND": "apps.common.storage.ContentAddressedFileSystemStorage"},
+}
+CONTENT_ADDRESSED_STORAGE = {
+    "PREFIX": "blobs",
+    "DEPTH": 2,
+    "WIDTH": 2,
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
@@ -239,17 +254,99 @@ EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD", "your_email_password")
 # 기본 발신자 이메일 주소
 DEFAULT_FROM_EMAIL = "webmaster@yourdomain.com"  # 발신자 기본 이메일
 
+# 메일 발송 큐 (apps.common.util.email.services.email_queue_service)
+# 요청에서는 Redis outbox 에 넣기만 하고 Celery 워커가 SMTP 연결을 재사용하며 묶어서 보낸다
+EMAIL_QUEUE = {
+    "BATCH_SIZE": 50,  # 한 번에 꺼내서 보내는 메일 수
+    "FLUSH_DELAY": 1,  # 첫 메일이 들어온 뒤 발송 task 를 실행하기까지 기다리는 시간(초) - 그 사이의 메일을 묶는다
+    "MAX_ATTEMPTS": 5,  # 이 횟수만큼 실패한 메일은 버린다
+    "CONNECTION_MAX_AGE": 60,  # 워커가 SMTP 연결을 재사용하는 최대 시간(초)
+}
+
 
 # redis settings
-# CACHES = {
-#     "default": {
-#         "BACKEND": "django_redis.cache.RedisCache",
-#         "LOCATION": "redis://redis:6379/1",
-#         "OPTIONS": {
-#             "CLIENT_CLASS": "django_redis.client.DefaultClient",
-#         },
-#     }
-# }
+REDIS_HOST = os.getenv("REDIS_HOST", "redis")
+
+# OTP / refresh token 용 직접 접근 client (apps.common.util.redis_client)
+REDIS_CLIENT = {
+    "HOST": REDIS_HOST,
+    "PORT": 6379,
+    "DB": 1,
+    "MAX_CONNECTIONS": int(os.getenv("REDIS_MAX_CONNECTIONS", 50)),
+    "POOL_TIMEOUT": 2,
+    "SOCKET_TIMEOUT": 1,
+    "SOCKET_CONNECT_TIMEOUT": 1,
+    "HEALTH_CHECK_INTERVAL": 30,
+    # 테스트는 Redis 없이 인메모리 stand-in 사용
+    "IN_MEMORY": "test" in sys.argv,
+}
+
+# catalog: 자주 읽고 드물게 바뀌는 데이터(부대시설/옵션, 숙소/객실 응답, 메인 피드)용 2단 캐시
+# 워커 메모리 LRU 가 catalog_shared(Redis) 앞에 놓이고, 무효화는 Redis pub/sub 으로 모든 워커에 전달된다
+CATALOG_CACHE = {
+    "BACKEND": "apps.common.cache.backends.TwoTierCache",
+    "LOCATION": "catalog_shared",
+    "KEY_PREFIX": "catalog",
+    "TIMEOUT": 60 * 60,
+    "OPTIONS": {
+        "LOCAL_MAX_ENTRIES": 2000,  # 워커당 항목 수 상한 (LRU)
+        "LOCAL_TIMEOUT": 60,  # pub/sub 메시지를 놓쳤을 때의 최대 지연(초)
+    },
+}
+
+if "test" in sys.argv:
+    # 테스트 환경에서는 로컬 메모리 캐시 사용
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        },
+        "catalog_shared": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "catalog_shared",
+        },
+        "catalog": CATALOG_CACHE,
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": f"redis://{REDIS_HOST}:6379/2",  # db 1 은 OTP / refresh token 용
+            "OPTIONS": {
+                "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            },
+        },
+        # catalog.clear() 가 db 전체를 비우므로 세션 등과 db 를 나눈다
+        "catalog_shared": {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": f"redis://{REDIS_HOST}:6379/3",
+            "OPTIONS": {
+                "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            },
+        },
+        "catalog": CATALOG_CACHE,
+    }
+
+# celery settings (config.celery)
+CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", f"redis://{REDIS_HOST}:6379/4")
+CELERY_TASK_ACKS_LATE = True
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+CELERY_TASK_IGNORE_RESULT = True
+CELERY_TIMEZONE = TIME_ZONE
+CELERY_BEAT_SCHEDULE = {
+    # 참조가 없는 media 파일 정리 (apps.common.util.media_gc)
+    "collect-media-garbage": {"task": "apps.common.tasks.collect_media_garbage", "schedule": crontab(hour=4, minute=0)},
+}
+
+if "test" in sys.argv:
+    # 테스트는 브로커 없이 호출한 자리에서 task 를 실행한다 (메일은 test runner 가 locmem backend 로 바꾼다)
+    CELERY_TASK_ALWAYS_EAGER = True
+    CELERY_TASK_EAGER_PROPAGATES = True
+
+# 응답 캐시 만료 시간(초) - 태그 무효화가 기본이고 만료는 안전장치
+RESPONSE_CACHE_TIMEOUT = 60 * 60
+
+# 지도 타일 클러스터 캐시 만료 시간(초) - 이동/비활성화는 즉시 무효화, 최저가 변경은 만료 시 반영
+MAP_TILE_CACHE_TIMEOUT = 60 * 10
 
 # 세션 설정 (선택 사항)
 SESSION_ENGINE = "django.contrib.sessions.backends.cache"
@@ -260,11 +357,20 @@ SESSION_CACHE_ALIAS = "default"
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        # JWTAuthentication + 사용자 캐시 (apps.auth.authentication.UserPrincipalCache)
+        "apps.auth.authentication.CachedJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.AllowAny",
     ],
+    # 목록은 기본적으로 keyset(cursor) 페이지네이션 - 전체 개수가 필요한 뷰만 CountedPageNumberPagination 지정
+    "DEFAULT_PAGINATION_CLASS": "apps.common.pagination.KeysetPagination",
+    "PAGE_SIZE": 20,
+    # orjson 이 없으면 FastJSONRenderer 는 표준 JSONRenderer 로 동작한다
+    "DEFAULT_RENDERER_CLASSES": [
+        "apps.common.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
 }
 
 SPECTACULAR_SETTINGS = {
@@ -291,6 +397,9 @@ SIMPLE_JWT = {
     "SIGNING_KEY": os.getenv("JWT_SECRET_KEY", "default-secret-key"),
 }
 
+# 인증 사용자 캐시 만료 시간(초) - 사용자/비즈니스 프로필 변경 시 즉시 무효화, 만료는 안전장치
+AUTH_USER_CACHE_TIMEOUT = 60 * 5
+
 # if DEBUG:
 #     SIMPLE_JWT["ACCESS_TOKEN_LIFETIME"] = timedelta(days=3650)  # 개발 환경용 긴 토큰
 # else:
@@ -299,18 +408,37 @@ SIMPLE_JWT = {
 
 # Aws S3 settings
 
-# # django-storages를 사용한 S3 설정
-# INSTALLED_APPS += ['storages']
-#
-# # AWS S3 관련 설정
-# AWS_ACCESS_KEY_ID = 'your-access-key-id'
-# AWS_SECRET_ACCESS_KEY = 'your-secret-access-key'
-# AWS_STORAGE_BUCKET_NAME = 'your-s3-bucket-name'
-# AWS_S3_REGION_NAME = 'your-region'  # 예: 'us-west-1'
-#
-# # 정적 파일 및 미디어 파일 설정
-# DEFAULT_FILE_STORAGE = 'storages.backends.s3boto3.S3Boto3Storage'
-# STATICFILES_STORAGE = 'storages.backends.s3boto3.S3Boto3Storage'
-#
-# # 캐시 설정 (선택 사항)
-# AWS_QUERYSTRING_AUTH = False  # S3 링크에 인증 매개변수를 포함하지 않음
+# AWS_STORAGE_BUCKET_NAME 이 있으면 미디어를 S3 호환 storage(로컬은 MinIO)에 저장하고 presigned 직접 업로드를 사용한다
+# 자격 증명은 boto3 기본 체인(AWS_ACCESS_KEY_ID / AWS_SECRET_ACCESS_KEY 환경 변수, IAM role)을 사용
+AWS_STORAGE_BUCKET_NAME = os.getenv("AWS_STORAGE_BUCKET_NAME")
+if AWS_STORAGE_BUCKET_NAME:
+    AWS_S3_REGION_NAME = os.getenv("AWS_S3_REGION_NAME", "ap-northeast-2")
+    AWS_S3_ENDPOINT_URL = os.getenv("AWS_S3_ENDPOINT_URL")  # MinIO 등 S3 호환 endpoint
+    AWS_S3_FILE_OVERWRITE = False
+    STORAGES["default"] = {
+        # 사업자 서류 등은 서명된 URL 로만 내려준다
+        "BACKEND": "storages.backends.s3.S3Storage",
+        "OPTIONS": {"location": "media", "querystring_auth": True},
+    }
+    STORAGES["images"] = {
+        # 이미지는 내용 hash 이름이라 바뀌지 않으므로 서명 없는 URL 로 CDN/브라우저 캐시를 쓴다
+        "BACKEND": "apps.common.storage.ContentAddressedS3Storage",
+        "OPTIONS": {
+            "location": "media",
+            "querystring_auth": False,
+            "object_parameters": {"CacheControl": "public, max-age=31536000, immutable"},
+        },
+    }
+
+# 참조가 없는 media 파일 정리 (apps.common.util.media_gc, collect_media_garbage 명령)
+MEDIA_GC = {
+    "STORAGES": ["images", "default"],
+    "MIN_AGE": 60 * 60 * 24,
+    "BATCH_SIZE": 1000,
+}
+
+# presigned 직접 업로드 (apps.common.util.direct_upload)
+DIRECT_UPLOAD = {
+    "EXPIRES_IN": 60 * 10,
+    "MAX_FILES": 10,
+}
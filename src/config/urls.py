@@ -44,6 +44,7 @@ v1_urlpatterns = [
     path("host/", include("apps.host_management.urls")),
     path("auth/", include("apps.auth.urls")),
     path("ui/", include("apps.pages.urls")),
+    path("", include("apps.common.urls")),
 ]
 
 # 5. WebSocket 관련 URL